@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -6,6 +8,20 @@ class Settings(BaseSettings):
     debug: bool = True
 
     database_url: str = "sqlite+aiosqlite:///./okr.db"
+    # Log every SQL statement; independent of debug because it is very noisy
+    sql_echo: bool = False
+
+    # SQLite PRAGMA profile applied to new connections (see app.core.storage)
+    storage_profile: Literal["dev", "test", "prod"] = "dev"
+    # Seconds between PRAGMA optimize runs; 0 disables the background task
+    storage_optimize_interval_seconds: float = 3600.0
+
+    # Reader pool size for GET routes; writes share one dedicated connection
+    db_read_pool_size: int = 4
+    # Seconds to wait for a reader connection before failing
+    db_read_timeout: float = 30.0
+    # Seconds a write transaction may queue for the writer connection
+    db_write_timeout: float = 30.0
 
     cors_origins: list[str] = [
         "http://localhost:4200",
@@ -16,6 +32,74 @@ class Settings(BaseSettings):
     default_page_size: int = 10
     max_page_size: int = 1000
 
+    # Raise on any lazy relationship load (see app.core.loading)
+    strict_loading: bool = False
+
+    # Seconds a cached count may be served for count=estimate
+    count_cache_ttl_seconds: float = 60.0
+    # Most counts kept for count=estimate, one per distinct filter and search
+    count_cache_max_entries: int = 1024
+
+    # Seconds a version ETag stays valid, bounding how long writes made by other
+    # worker processes can go unnoticed by conditional GETs; 0 never expires
+    etag_ttl_seconds: float = 60.0
+    # Bytes of serialized objective detail responses kept in memory; 0 disables
+    response_cache_max_bytes: int = 16 * 1024 * 1024
+    # User, role and group names kept for resolving objective owners
+    owner_name_cache_size: int = 10000
+    # Seconds an owner name is trusted before it is reloaded, bounding how long
+    # renames made by other worker processes go unnoticed; 0 never expires
+    owner_name_ttl_seconds: float = 60.0
+    # Seconds the in-memory group tree is trusted before it is reloaded, bounding
+    # how long moves made by other worker processes go unnoticed; 0 never reloads
+    group_hierarchy_ttl_seconds: float = 60.0
+
+    # Largest batch accepted by the bulk endpoints
+    bulk_max_items: int = 1000
+
+    # Messages buffered per websocket before the slow consumer policy applies
+    ws_queue_size: int = 256
+    # What to do when a websocket's queue is full
+    ws_slow_consumer_policy: Literal["drop_oldest", "drop_newest", "disconnect"] = "drop_oldest"
+
+    # Seconds websocket events are held so bursts for one entity collapse to its
+    # latest state; 0 sends every event immediately
+    ws_coalesce_window_seconds: float = 0.1
+
+    # Recent websocket events kept so reconnecting clients can catch up with ?since=
+    ws_replay_buffer_size: int = 1000
+
+    # Seconds between heartbeat pings to each websocket; 0 disables heartbeats and reaping
+    ws_ping_interval_seconds: float = 20.0
+    # Seconds a websocket has to answer a ping before it is treated as dead
+    ws_ping_timeout_seconds: float = 20.0
+    # Seconds without events or client messages before a websocket is closed; 0 disables
+    ws_idle_timeout_seconds: float = 3600.0
+    # Most websockets and event streams served at once by a worker; 0 means no limit
+    ws_max_connections: int = 1000
+
+    # Seconds between keep-alive comments on idle /events streams
+    sse_heartbeat_seconds: float = 15.0
+
+    # How websocket events reach other worker processes (see app.core.broadcast);
+    # use "sqlite" when running more than one worker
+    broadcast_backend: Literal["memory", "sqlite"] = "memory"
+    # Event log shared by workers with the sqlite backend
+    broadcast_sqlite_path: str = "./okr-events.db"
+    # Seconds between event log polls with the sqlite backend
+    broadcast_poll_interval_seconds: float = 0.05
+    # Seconds events are kept in the event log
+    broadcast_retention_seconds: float = 300.0
+
+    # Outbox events published per dispatcher transaction (see app.core.outbox)
+    outbox_batch_size: int = 100
+    # Seconds between outbox polls when no local commit wakes the dispatcher,
+    # e.g. for events written by another worker or before a crash
+    outbox_poll_interval_seconds: float = 1.0
+    # Seconds a dispatcher may hold a batch before another worker retries it,
+    # bounding the delay for events of a dispatcher that crashed mid-batch
+    outbox_claim_timeout_seconds: float = 30.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
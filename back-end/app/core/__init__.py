@@ -6,6 +6,7 @@ from app.core.exceptions import (
     IntegrityError,
     InvalidFieldError,
     NotFoundError,
+    ServiceUnavailableError,
     ValidationError,
 )
 
@@ -16,4 +17,5 @@ __all__ = [
     "DatabaseError",
     "IntegrityError",
     "InvalidFieldError",
+    "ServiceUnavailableError",
 ]
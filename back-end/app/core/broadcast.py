@@ -0,0 +1,191 @@
+"""Broadcast backends that carry websocket events between processes.
+
+``ConnectionManager.broadcast`` publishes through a backend, and the
+backend hands each event to every process's ``ConnectionManager.deliver``
+together with its sequence number:
+
+- ``memory``: delivers straight to the local manager. Only correct with a
+  single worker process.
+- ``sqlite``: appends events to a table in a separate SQLite file that
+  every worker tails, so events published by one uvicorn worker reach
+  sockets held by all of them without an external broker. The row id is
+  the sequence number, so it is the same in every worker.
+
+The backend is chosen with ``Settings.broadcast_backend``.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+Deliver = Callable[[dict[str, Any], Sequence[str], int], Awaitable[None]]
+
+# Kept out of app.database.Base so the event log never lands in the main database
+_metadata = MetaData()
+
+broadcast_events = Table(
+    "broadcast_events",
+    _metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("topics", Text, nullable=False),
+    Column("payload", Text, nullable=False),
+    Column("created_at", Float, nullable=False, index=True),
+    # Never reuse ids after pruning, or tailing workers would skip new events
+    sqlite_autoincrement=True,
+)
+
+
+class BroadcastBackend(ABC):
+    """Carries published events to every process's local delivery."""
+
+    def __init__(self) -> None:
+        self._deliver: Deliver | None = None
+        # Sequence number of the newest event published by any process
+        self.last_seq = 0
+
+    async def start(self, deliver: Deliver) -> None:
+        """Begin delivering events published by any process."""
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        """Stop delivering events."""
+        self._deliver = None
+
+    @abstractmethod
+    async def publish(self, message: dict[str, Any], topics: Sequence[str]) -> None:
+        """Publish an event to all processes."""
+
+    def statistics(self) -> dict[str, Any]:
+        """Report backend-specific counters."""
+        return {"backend": type(self).__name__, "lastSeq": self.last_seq}
+
+
+class MemoryBackend(BroadcastBackend):
+    """Delivers events within this process only."""
+
+    async def publish(self, message: dict[str, Any], topics: Sequence[str]) -> None:
+        self.last_seq += 1
+        if self._deliver is not None:
+            await self._deliver(message, topics, self.last_seq)
+
+
+class SQLiteBackend(BroadcastBackend):
+    """Shares events between local workers through a SQLite event table.
+
+    Each publish is one INSERT. Every worker polls for rows newer than the
+    last one it delivered, so all workers (including the publisher)
+    deliver events in the same order. Rows older than the retention
+    period are pruned.
+    """
+
+    def __init__(self, path: str, poll_interval: float, retention: float) -> None:
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.delivered = 0
+        self._engine: AsyncEngine | None = None
+        self._tail: asyncio.Task[None] | None = None
+
+    def _get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(f"sqlite+aiosqlite:///{self.path}")
+        return self._engine
+
+    async def start(self, deliver: Deliver) -> None:
+        """Create the event table and tail it from the current end."""
+        await super().start(deliver)
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            await conn.run_sync(_metadata.create_all)
+            self.last_seq = await conn.scalar(
+                select(func.coalesce(func.max(broadcast_events.c.id), 0))
+            ) or 0
+        self._tail = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._tail is not None:
+            self._tail.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._tail
+            self._tail = None
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+        await super().stop()
+
+    async def publish(self, message: dict[str, Any], topics: Sequence[str]) -> None:
+        async with self._get_engine().begin() as conn:
+            await conn.execute(insert(broadcast_events).values(
+                topics=json.dumps(list(topics)),
+                payload=json.dumps(message),
+                created_at=time.time(),
+            ))
+
+    async def poll(self) -> int:
+        """Deliver events written since the last poll.
+
+        Returns:
+            Number of events delivered.
+        """
+        query = (
+            select(broadcast_events.c.id, broadcast_events.c.topics, broadcast_events.c.payload)
+            .where(broadcast_events.c.id > self.last_seq)
+            .order_by(broadcast_events.c.id)
+        )
+        async with self._get_engine().connect() as conn:
+            rows = (await conn.execute(query)).all()
+        for id, topics, payload in rows:
+            self.last_seq = id
+            if self._deliver is not None:
+                await self._deliver(json.loads(payload), json.loads(topics), id)
+        self.delivered += len(rows)
+        return len(rows)
+
+    async def prune(self) -> None:
+        """Delete events older than the retention period."""
+        cutoff = time.time() - self.retention
+        async with self._get_engine().begin() as conn:
+            await conn.execute(
+                delete(broadcast_events).where(broadcast_events.c.created_at < cutoff)
+            )
+
+    async def _run(self) -> None:
+        """Tail the event table until stopped."""
+        last_prune = time.monotonic()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+                if time.monotonic() - last_prune > self.retention:
+                    await self.prune()
+                    last_prune = time.monotonic()
+            except Exception:
+                logger.exception("Broadcast event poll failed | path=%s", self.path)
+
+    def statistics(self) -> dict[str, Any]:
+        return {**super().statistics(), "delivered": self.delivered}
+
+
+def create_backend() -> BroadcastBackend:
+    """Build the backend selected in settings."""
+    if settings.broadcast_backend == "sqlite":
+        return SQLiteBackend(
+            settings.broadcast_sqlite_path,
+            poll_interval=settings.broadcast_poll_interval_seconds,
+            retention=settings.broadcast_retention_seconds,
+        )
+    return MemoryBackend()
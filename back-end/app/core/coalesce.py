@@ -0,0 +1,129 @@
+"""Coalescing of high-frequency websocket events.
+
+Events are held per topic set for a short window. Within the window a
+newer event about the same entity replaces the older one, and whatever is
+left goes out as one ``{"type": "batch", "events": [...]}`` message (or
+unchanged, if only one event remains).
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+Publish = Callable[[dict[str, Any], Sequence[str]], Awaitable[None]]
+
+# Fields of an event's "data" that identify the entity it describes, in order of preference
+_ENTITY_FIELDS = ("id", "keyResultId", "groupId", "objectiveId")
+
+
+def entity_key(message: dict[str, Any]) -> Hashable:
+    """Identify the entity an event describes.
+
+    Events with no recognisable entity get a unique key, so they are
+    batched but never replaced.
+    """
+    data = message.get("data")
+    if isinstance(data, dict):
+        for field in _ENTITY_FIELDS:
+            if field in data:
+                return (message.get("type"), field, data[field])
+    return id(message)
+
+
+def _batch_message(events: list[dict[str, Any]]) -> dict[str, Any]:
+    return events[0] if len(events) == 1 else {"type": "batch", "events": events}
+
+
+def coalesce_events(
+    events: Iterable[tuple[dict[str, Any], Iterable[str]]],
+) -> list[tuple[dict[str, Any], tuple[str, ...]]]:
+    """Merge events the way one coalescing window would, without waiting.
+
+    Returns:
+        (message, topics) pairs, one per distinct topic set, in order of
+        first appearance.
+    """
+    pending: dict[tuple[str, ...], dict[Hashable, dict[str, Any]]] = {}
+    for message, topics in events:
+        by_entity = pending.setdefault(tuple(sorted(set(topics))), {})
+        key = entity_key(message)
+        by_entity.pop(key, None)
+        by_entity[key] = message
+    return [
+        (_batch_message(list(by_entity.values())), topic_key)
+        for topic_key, by_entity in pending.items()
+    ]
+
+
+class Coalescer:
+    """Buffers events per topic set and publishes them once per window."""
+
+    def __init__(self, window: float, publish: Publish) -> None:
+        self.window = window
+        self._publish = publish
+        self._pending: dict[tuple[str, ...], dict[Hashable, dict[str, Any]]] = {}
+        self._timers: dict[tuple[str, ...], asyncio.Task[None]] = {}
+        self.received = 0
+        self.published = 0
+        self.failed = 0
+
+    async def add(self, message: dict[str, Any], topics: Sequence[str]) -> None:
+        """Queue an event, publishing immediately if coalescing is disabled."""
+        self.received += 1
+        topic_key = tuple(sorted(set(topics)))
+        if self.window <= 0:
+            self.published += 1
+            await self._publish(message, topic_key)
+            return
+
+        pending = self._pending.get(topic_key)
+        if pending is None:
+            pending = self._pending[topic_key] = {}
+            self._timers[topic_key] = asyncio.create_task(self._flush_later(topic_key))
+        key = entity_key(message)
+        # Latest state wins and moves to the end, keeping batches in update order
+        pending.pop(key, None)
+        pending[key] = message
+
+    async def _flush_later(self, topic_key: tuple[str, ...]) -> None:
+        await asyncio.sleep(self.window)
+        self._timers.pop(topic_key, None)
+        # Nothing awaits this task, so a failure would otherwise go unreported
+        try:
+            await self._flush(topic_key)
+        except Exception:
+            self.failed += 1
+            logger.exception("Coalesced event publish failed | topics=%s", ",".join(topic_key))
+
+    async def _flush(self, topic_key: tuple[str, ...]) -> None:
+        """Publish what is pending for one topic set."""
+        pending = self._pending.pop(topic_key, None)
+        if not pending:
+            return
+        message = _batch_message(list(pending.values()))
+        self.published += 1
+        await self._publish(message, topic_key)
+
+    async def flush(self) -> None:
+        """Publish everything pending now, without waiting for the windows."""
+        for topic_key in list(self._pending):
+            timer = self._timers.pop(topic_key, None)
+            if timer is not None:
+                timer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await timer
+            await self._flush(topic_key)
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "window": self.window,
+            "pendingTopics": len(self._pending),
+            "received": self.received,
+            "published": self.published,
+            "failed": self.failed,
+        }
@@ -0,0 +1,114 @@
+"""Per-table cache of list counts for the ``estimate`` count strategy."""
+
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Select, event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+
+_PENDING_KEY = "count_cache_tables"
+
+
+class CountCache:
+    """Caches count query results per table until a write touches the table.
+
+    Entries also expire after ``ttl`` seconds so writes made outside this
+    process are eventually reflected. At most ``max_entries`` counts are
+    kept, evicting the least recently used first, since every distinct
+    filter or search value is a separate entry.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, tuple[Any, ...]], tuple[float, int]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _key(count_query: Select[int]) -> tuple[Any, ...]:
+        """Build a cache key from the count query SQL and its parameters."""
+        compiled = count_query.compile()
+        return (str(compiled), tuple(sorted(compiled.params.items())))
+
+    def get(self, table: str, count_query: Select[int]) -> int | None:
+        """Return the cached count for a query, or None if missing or expired."""
+        key = (table, self._key(count_query))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, table: str, count_query: Select[int], value: int) -> None:
+        """Store the count for a query."""
+        if self.max_entries <= 0:
+            return
+        key = (table, self._key(count_query))
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop all cached counts for the given tables."""
+        names = set(tables)
+        for key in [key for key in self._entries if key[0] in names]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached counts."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+count_cache = CountCache(
+    ttl=settings.count_cache_ttl_seconds, max_entries=settings.count_cache_max_entries
+)
+
+
+def _pending_tables(session: Session) -> set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())  # type: ignore[no-any-return]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context: Any) -> None:
+    """Record tables touched by ORM unit-of-work writes."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            _pending_tables(session).add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state: ORMExecuteState) -> None:
+    """Record tables touched by bulk INSERT/UPDATE/DELETE statements."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name:
+            _pending_tables(orm_execute_state.session).add(name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session: Session) -> None:
+    """Invalidate cached counts once writes are durable."""
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        count_cache.invalidate(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tables(session: Session) -> None:
+    """Forget writes that were rolled back."""
+    session.info.pop(_PENDING_KEY, None)
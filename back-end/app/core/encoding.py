@@ -0,0 +1,72 @@
+"""Wire encodings for websocket events.
+
+Clients pick an encoding with a websocket subprotocol: ``okr.msgpack`` for
+MessagePack binary frames (when the optional ``msgpack`` package is
+installed) or ``okr.json`` / no subprotocol for JSON text frames.
+
+Each event is wrapped in an ``EncodedMessage`` that encodes it at most
+once per encoding, and the same buffer is sent to every subscriber.
+Compression (permessage-deflate) is negotiated by the ASGI server.
+"""
+
+import importlib
+import importlib.util
+import json
+from collections.abc import Callable, Sequence
+from types import ModuleType
+from typing import Any, Literal
+
+# Optional dependency
+msgpack: ModuleType | None = (
+    importlib.import_module("msgpack") if importlib.util.find_spec("msgpack") else None
+)
+
+Encoding = Literal["json", "msgpack"]
+
+JSON_SUBPROTOCOL = "okr.json"
+MSGPACK_SUBPROTOCOL = "okr.msgpack"
+
+
+def _encode_json(message: dict[str, Any]) -> str:
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_msgpack(message: dict[str, Any]) -> bytes:
+    assert msgpack is not None
+    return msgpack.packb(message)  # type: ignore[no-any-return]
+
+
+_ENCODERS: dict[Encoding, Callable[[dict[str, Any]], str | bytes]] = {
+    "json": _encode_json,
+    "msgpack": _encode_msgpack,
+}
+
+
+def negotiate(offered: Sequence[str]) -> tuple[str | None, Encoding]:
+    """Choose a subprotocol and encoding from those a client offered.
+
+    Returns:
+        Tuple of (subprotocol to accept, or None; encoding to use).
+    """
+    if MSGPACK_SUBPROTOCOL in offered and msgpack is not None:
+        return MSGPACK_SUBPROTOCOL, "msgpack"
+    if JSON_SUBPROTOCOL in offered:
+        return JSON_SUBPROTOCOL, "json"
+    return None, "json"
+
+
+class EncodedMessage:
+    """A message encoded lazily, at most once per encoding."""
+
+    __slots__ = ("message", "_encoded")
+
+    def __init__(self, message: dict[str, Any]) -> None:
+        self.message = message
+        self._encoded: dict[Encoding, str | bytes] = {}
+
+    def encode(self, encoding: Encoding) -> str | bytes:
+        """Return the message in the given encoding, encoding it on first use."""
+        data = self._encoded.get(encoding)
+        if data is None:
+            data = self._encoded[encoding] = _ENCODERS[encoding](self.message)
+        return data
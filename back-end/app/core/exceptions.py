@@ -146,3 +146,19 @@ class InvalidFieldError(AppError):
                 "operation": operation,
             },
         )
+
+
+class ServiceUnavailableError(AppError):
+    """Server is at capacity or temporarily unable to serve the request (503)."""
+
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            error_code="SERVICE_UNAVAILABLE",
+            status_code=503,
+            details=details,
+        )
@@ -0,0 +1,174 @@
+"""Process-wide index of the group tree.
+
+``Group.parent_id`` is the only stored hierarchy, so ancestor chains and
+subtrees would otherwise take one query per level. The index holds every
+group's parent and children in memory. It is loaded with a single query
+on first use, updated by a flush hook as groups are created, moved or
+deleted, and reloaded when a bulk statement touches ``groups`` or after
+``ttl`` seconds, so changes made by other workers are eventually seen.
+"""
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+from app.models.group import Group
+
+_PENDING_KEY = "group_hierarchy_changes"
+# Pending changes are (group id, parent id) pairs; a deleted group gets _DELETED
+# as its parent, and writes whose rows are unknown add _RELOAD
+_DELETED = object()
+_RELOAD = "reload"
+
+
+class GroupHierarchy:
+    """Parent and children of every group."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._parent: dict[int, int | None] = {}
+        self._children: dict[int, set[int]] = {}
+        self._loaded_at: float | None = None
+        # Number of changes applied so far, to detect writes during a load
+        self.generation = 0
+
+    @property
+    def loaded(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        return self.ttl <= 0 or time.monotonic() - self._loaded_at <= self.ttl
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Load the tree unless a current copy is held."""
+        while not self.loaded:
+            generation = self.generation
+            rows = (await session.execute(select(Group.id, Group.parent_id))).tuples().all()
+            # A commit applied during the query may be missing from the rows
+            if generation == self.generation:
+                self._install(rows)
+
+    def _install(self, rows: Any) -> None:
+        self._parent = dict(rows)
+        self._children = {}
+        for id, parent_id in self._parent.items():
+            self._children.setdefault(id, set())
+            if parent_id is not None:
+                self._children.setdefault(parent_id, set()).add(id)
+        self._loaded_at = time.monotonic()
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._parent
+
+    def parent_of(self, id: int) -> int | None:
+        """Return the parent of a group, or None for a root."""
+        return self._parent.get(id)
+
+    def ancestors(self, id: int) -> list[int]:
+        """Return the ancestors of a group, nearest first."""
+        found: list[int] = []
+        seen = {id}
+        parent = self._parent.get(id)
+        # Trees stored before cycle checks existed may still loop
+        while parent is not None and parent not in seen:
+            found.append(parent)
+            seen.add(parent)
+            parent = self._parent.get(parent)
+        return found
+
+    def descendants(self, id: int) -> list[int]:
+        """Return every group below a group, breadth first."""
+        return list(self._walk_subtree(id))
+
+    def _walk_subtree(self, id: int) -> Iterator[int]:
+        seen = {id}
+        queue = deque(sorted(self._children.get(id, ())))
+        while queue:
+            child = queue.popleft()
+            if child in seen:
+                continue
+            seen.add(child)
+            yield child
+            queue.extend(sorted(self._children.get(child, ())))
+
+    def apply(self, changes: list[Any]) -> None:
+        """Apply committed group changes in order."""
+        self.generation += 1
+        if not self.loaded:
+            return
+        for change in changes:
+            if change == _RELOAD:
+                self._loaded_at = None
+                return
+            id, parent_id = change
+            self._detach(id)
+            if parent_id is _DELETED:
+                # ON DELETE SET NULL turns the children into roots
+                for child in self._children.pop(id, set()):
+                    self._parent[child] = None
+                self._parent.pop(id, None)
+            else:
+                self._parent[id] = parent_id
+                self._children.setdefault(id, set())
+                if parent_id is not None:
+                    self._children.setdefault(parent_id, set()).add(id)
+
+    def _detach(self, id: int) -> None:
+        parent_id = self._parent.get(id)
+        if parent_id is not None:
+            self._children.get(parent_id, set()).discard(id)
+
+    def clear(self) -> None:
+        """Drop the tree so the next use reloads it."""
+        self.generation += 1
+        self._parent.clear()
+        self._children.clear()
+        self._loaded_at = None
+
+
+group_hierarchy = GroupHierarchy(ttl=settings.group_hierarchy_ttl_seconds)
+
+
+def _pending_changes(session: Session) -> list[Any]:
+    return session.info.setdefault(_PENDING_KEY, [])  # type: ignore[no-any-return]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_group_changes(session: Session, flush_context: Any) -> None:
+    """Record groups created, moved or deleted by the unit of work."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Group):
+            continue
+        if obj in session.deleted:
+            _pending_changes(session).append((obj.id, _DELETED))
+        elif obj in session.new or inspect(obj).attrs.parent_id.history.has_changes():
+            _pending_changes(session).append((obj.id, obj.parent_id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_group_statements(orm_execute_state: ORMExecuteState) -> None:
+    """Reload the tree after bulk statements on ``groups``."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None) == Group.__tablename__:
+            _pending_changes(orm_execute_state.session).append(_RELOAD)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_group_changes(session: Session) -> None:
+    """Update the index once changes are durable."""
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        group_hierarchy.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_group_changes(session: Session) -> None:
+    """Forget changes that were rolled back."""
+    session.info.pop(_PENDING_KEY, None)
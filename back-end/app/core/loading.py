@@ -0,0 +1,39 @@
+"""Strict loading mode: fail on implicit relationship loads.
+
+Repositories declare the relationships each query needs through load
+profiles. In strict mode any lazy load that slips past them raises
+``LazyLoadError`` instead of silently issuing extra SELECTs, which makes
+missing loader options show up in tests.
+
+Strict mode is on when ``Settings.strict_loading`` is set, or per session
+with ``info={STRICT_LOADING_KEY: True}``.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+
+STRICT_LOADING_KEY = "strict_loading"
+
+
+class LazyLoadError(RuntimeError):
+    """A relationship was lazy loaded while strict loading was enabled."""
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _forbid_lazy_loads(execute_state: ORMExecuteState) -> None:
+    """Reject lazy loads issued by attribute access in strict mode."""
+    if not execute_state.is_select:
+        return
+    state = execute_state.lazy_loaded_from
+    if state is None:
+        return
+    if not execute_state.session.info.get(STRICT_LOADING_KEY, settings.strict_loading):
+        return
+    path = execute_state.loader_strategy_path
+    attribute = path[-1] if path else state.class_.__name__
+    raise LazyLoadError(
+        f"Unexpected lazy load of {attribute} for identity {state.identity}; "
+        "add it to the query's load profile"
+    )
@@ -0,0 +1,203 @@
+"""Background dispatcher for the transactional outbox.
+
+``app.models.outbox`` records change events in ``outbox_events`` as part
+of each write transaction. The dispatcher drains that table in batches
+and publishes the events through the broadcast backend, so requests
+never wait on websocket fan-out and events of committed changes survive
+a crash before they were sent.
+
+A batch is first claimed in a short write transaction, which stamps
+``claimed_until`` so dispatchers in other workers skip it. The events
+are then published without holding the writer connection (merged per
+entity like ``app.core.coalesce`` does when ``coalesce`` is set), and only
+deleted once the backend has accepted all of them. If publishing fails
+the claim is released; if the process dies, the claim expires after
+``outbox_claim_timeout_seconds``. Either way the batch is sent again
+later (at-least-once delivery). Topics of the objective an event
+belongs to are resolved once per batch when it is claimed.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Executable, delete, event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.coalesce import coalesce_events
+from app.core.logging import get_logger
+from app.core.websockets import manager
+from app.models.outbox import OUTBOX_PENDING_KEY, OutboxEvent
+from app.repositories.ownership import OwnershipRepository
+
+logger = get_logger(__name__)
+
+Publish = Callable[[dict[str, Any], Iterable[str]], Awaitable[None]]
+
+
+class OutboxDispatcher:
+    """Publishes committed outbox events in id order."""
+
+    def __init__(
+        self,
+        publish: Publish,
+        batch_size: int = settings.outbox_batch_size,
+        poll_interval: float = settings.outbox_poll_interval_seconds,
+        claim_timeout: float = settings.outbox_claim_timeout_seconds,
+        coalesce: bool = False,
+    ) -> None:
+        self._publish = publish
+        self.coalesce = coalesce
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.claim_timeout = claim_timeout
+        self.dispatched = 0
+        self.failures = 0
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def dispatch(self, session: AsyncSession) -> int:
+        """Publish and remove one batch of pending events.
+
+        Returns:
+            Number of events published.
+        """
+        batch = await self._claim(session)
+        if not batch:
+            return 0
+        ids = [id for id, _, _ in batch]
+        messages: list[tuple[dict[str, Any], Iterable[str]]] = [
+            (message, topics) for _, message, topics in batch
+        ]
+        if self.coalesce:
+            messages = list(coalesce_events(messages))
+        try:
+            for message, topics in messages:
+                await self._publish(message, topics)
+        except Exception:
+            await self._release(session, ids)
+            raise
+        await self._commit(session, delete(OutboxEvent).where(OutboxEvent.id.in_(ids)))
+        self.dispatched += len(batch)
+        return len(batch)
+
+    async def _claim(self, session: AsyncSession) -> list[tuple[int, dict[str, Any], set[str]]]:
+        """Claim the oldest unclaimed events, returning (id, message, topics) in id order."""
+        now = datetime.utcnow()
+        claimable = (
+            select(OutboxEvent.id)
+            .where(or_(OutboxEvent.claimed_until.is_(None), OutboxEvent.claimed_until < now))
+            .order_by(OutboxEvent.id)
+            .limit(self.batch_size)
+        )
+        try:
+            result = await session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(claimable.scalar_subquery()))
+                .values(claimed_until=now + timedelta(seconds=self.claim_timeout))
+                .returning(OutboxEvent)
+                .execution_options(synchronize_session=False)
+            )
+            events = sorted(result.scalars().all(), key=lambda e: e.id)
+            objective_ids = {e.objective_id for e in events if e.objective_id is not None}
+            topics = await OwnershipRepository(session).get_objective_topics(objective_ids)
+            batch = []
+            for outbox_event in events:
+                event_topics = set(outbox_event.topics)
+                if outbox_event.objective_id is not None:
+                    event_topics |= topics[outbox_event.objective_id]
+                batch.append((outbox_event.id, outbox_event.to_message(), event_topics))
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        return batch
+
+    async def _release(self, session: AsyncSession, ids: list[int]) -> None:
+        """Make events claimable again after a failed publish."""
+        try:
+            await self._commit(
+                session,
+                update(OutboxEvent).where(OutboxEvent.id.in_(ids)).values(claimed_until=None),
+            )
+        except Exception:
+            # The claim still expires on its own
+            logger.exception("Releasing outbox claim failed | events=%d", len(ids))
+
+    @staticmethod
+    async def _commit(session: AsyncSession, statement: Executable) -> None:
+        """Run one write statement in its own transaction."""
+        try:
+            await session.execute(statement.execution_options(synchronize_session=False))
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    def notify(self) -> None:
+        """Wake the dispatcher after a commit that wrote outbox rows."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Start draining the outbox in the background."""
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        """Stop the background task; undelivered events stay in the table."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._wake = None
+
+    async def _run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Dispatch until the outbox is empty, then wait for a commit or the poll interval."""
+        assert self._wake is not None
+        while True:
+            # Cleared before dispatching so a commit during the batch is not missed
+            self._wake.clear()
+            try:
+                async with session_factory() as session:
+                    count = await self.dispatch(session)
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                self.failures += 1
+                count = 0
+            if count < self.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "batchSize": self.batch_size,
+            "dispatched": self.dispatched,
+            "failures": self.failures,
+        }
+
+
+# Published straight through the backend, since the coalescing window would
+# report events as sent before they are; each batch is merged the same way instead
+outbox_dispatcher = OutboxDispatcher(
+    manager.publish, coalesce=settings.ws_coalesce_window_seconds > 0
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session) -> None:
+    """Dispatch new events right away instead of at the next poll."""
+    if session.info.pop(OUTBOX_PENDING_KEY, False):
+        outbox_dispatcher.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_flag(session: Session) -> None:
+    session.info.pop(OUTBOX_PENDING_KEY, None)
@@ -0,0 +1,175 @@
+"""Process-wide directory of objective owner names.
+
+Ownerships point at users, roles or groups without a foreign key, so
+every objective view resolves owner names separately. The directory
+keeps names keyed by ``(OwnerType, id)``: it is filled lazily by
+``OwnershipRepository`` and kept current by a flush hook that records
+created, renamed and deleted owners and applies them on commit. Bulk
+statements on an owner table drop every name of that type. Names expire
+after ``ttl`` seconds and are then reloaded, so renames made by other
+worker processes are eventually seen.
+
+Names read from the database are only stored if no change was applied
+while they were being read, so a concurrent rename is never overwritten
+with the old name.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+from app.models import Group, Role, User
+from app.models.associations import OwnerType
+
+_PENDING_KEY = "owner_name_changes"
+_PENDING_TYPES_KEY = "owner_name_invalidated_types"
+
+OwnerKey = tuple[OwnerType, int]
+
+OWNER_MODELS: dict[OwnerType, type[User] | type[Role] | type[Group]] = {
+    OwnerType.USER: User,
+    OwnerType.ROLE: Role,
+    OwnerType.GROUP: Group,
+}
+_OWNER_TYPES = {model: owner_type for owner_type, model in OWNER_MODELS.items()}
+_OWNER_TABLES = {model.__tablename__: owner_type for owner_type, model in OWNER_MODELS.items()}
+
+
+class OwnerNameDirectory:
+    """LRU of owner names, bounded by entry count and age."""
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Key -> (time stored, name)
+        self._names: OrderedDict[OwnerKey, tuple[float, str]] = OrderedDict()
+        # Number of changes applied so far, to detect renames during a read
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, keys: Iterable[OwnerKey]) -> tuple[dict[OwnerKey, str], set[OwnerKey]]:
+        """Split owners into known names and keys that must be loaded.
+
+        Returns:
+            Tuple of (names found, keys missing from the directory).
+        """
+        found: dict[OwnerKey, str] = {}
+        missing: set[OwnerKey] = set()
+        now = time.monotonic()
+        for key in keys:
+            entry = self._names.get(key)
+            if entry is not None and self.ttl > 0 and now - entry[0] > self.ttl:
+                del self._names[key]
+                entry = None
+            if entry is None:
+                missing.add(key)
+            else:
+                self._names.move_to_end(key)
+                found[key] = entry[1]
+        self.hits += len(found)
+        self.misses += len(missing)
+        return found, missing
+
+    def fill(self, names: Mapping[OwnerKey, str], generation: int) -> None:
+        """Store names loaded from the database.
+
+        Args:
+            names: Loaded names.
+            generation: ``generation`` read before the names were queried;
+                if it moved since, the names may be stale and are dropped.
+        """
+        if generation == self.generation:
+            self._store(names)
+
+    def apply(self, changes: Mapping[OwnerKey, str | None]) -> None:
+        """Apply committed creates and renames, or deletes for ``None`` names."""
+        self.generation += 1
+        for key, name in changes.items():
+            if name is None:
+                self._names.pop(key, None)
+            else:
+                self._store({key: name})
+
+    def invalidate(self, owner_type: OwnerType) -> None:
+        """Drop every name of one owner type."""
+        self.generation += 1
+        for key in [key for key in self._names if key[0] == owner_type]:
+            del self._names[key]
+
+    def _store(self, names: Mapping[OwnerKey, str]) -> None:
+        now = time.monotonic()
+        for key, name in names.items():
+            self._names[key] = (now, name)
+            self._names.move_to_end(key)
+        while len(self._names) > self.max_entries:
+            self._names.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all names."""
+        self.generation += 1
+        self._names.clear()
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._names),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+owner_names = OwnerNameDirectory(
+    max_entries=settings.owner_name_cache_size, ttl=settings.owner_name_ttl_seconds
+)
+
+
+def _pending_changes(session: Session) -> dict[OwnerKey, str | None]:
+    return session.info.setdefault(_PENDING_KEY, {})  # type: ignore[no-any-return]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_owner_changes(session: Session, flush_context: Any) -> None:
+    """Record owners created, renamed or deleted by the unit of work."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        owner_type = _OWNER_TYPES.get(type(obj))
+        if owner_type is None:
+            continue
+        if obj in session.deleted:
+            _pending_changes(session)[(owner_type, obj.id)] = None
+        elif obj in session.new or inspect(obj).attrs.name.history.has_changes():
+            _pending_changes(session)[(owner_type, obj.id)] = obj.name
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_owner_statements(orm_execute_state: ORMExecuteState) -> None:
+    """Record owner tables written by bulk statements, whose rows are unknown."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        owner_type = _OWNER_TABLES.get(getattr(table, "name", None))  # type: ignore[arg-type]
+        if owner_type is not None:
+            orm_execute_state.session.info.setdefault(_PENDING_TYPES_KEY, set()).add(owner_type)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_owner_changes(session: Session) -> None:
+    """Update the directory once changes are durable."""
+    for owner_type in session.info.pop(_PENDING_TYPES_KEY, ()):
+        owner_names.invalidate(owner_type)
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        owner_names.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_owner_changes(session: Session) -> None:
+    """Forget changes that were rolled back."""
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_TYPES_KEY, None)
@@ -0,0 +1,89 @@
+"""Pagination helpers: count strategies and opaque keyset cursor tokens."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Literal
+
+from app.core.exceptions import ValidationError
+
+# How list endpoints compute the total count:
+# - exact: counted in the page query with a window function
+# - estimate: served from a per-table cache invalidated by writes
+# - none: not computed; responses carry a has-more flag instead
+CountMode = Literal["exact", "estimate", "none"]
+
+
+@dataclass(frozen=True)
+class CursorPosition:
+    """Decoded keyset position.
+
+    Attributes:
+        ordering: Ordering string the cursor was issued for (e.g. "-name").
+        value: Ordering column value of the boundary row.
+        id: Primary key of the boundary row (tie-breaker).
+        backwards: Whether the cursor pages towards the start of the list.
+    """
+
+    ordering: str
+    value: Any
+    id: int
+    backwards: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a column value to a JSON-safe representation."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(position: CursorPosition) -> str:
+    """Encode a cursor position as an opaque URL-safe token.
+
+    Args:
+        position: Keyset position to encode.
+
+    Returns:
+        Base64url token without padding.
+    """
+    payload = {
+        "o": position.ordering,
+        "v": _encode_value(position.value),
+        "i": position.id,
+        "b": position.backwards,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> CursorPosition:
+    """Decode an opaque cursor token.
+
+    Args:
+        token: Token previously produced by encode_cursor.
+
+    Returns:
+        Decoded cursor position. Date values are returned as ISO strings and
+        must be coerced by the caller using the ordering column type.
+
+    Raises:
+        ValidationError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return CursorPosition(
+            ordering=str(payload["o"]),
+            value=payload["v"],
+            id=int(payload["i"]),
+            backwards=bool(payload.get("b", False)),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise ValidationError(
+            message="Invalid pagination cursor",
+            field="cursor",
+            value=token,
+        ) from exc
@@ -0,0 +1,70 @@
+"""Serialized response bodies for hot detail routes.
+
+Entries are keyed by route path and the version ETag from
+``app.core.versions``, so a write to anything the response was built
+from changes the ETag and the stale body is never served again; it is
+replaced by the next load of that route or evicted. Total size is
+bounded, evicting the least recently used routes first.
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+from app.config import settings
+
+
+class ResponseCache:
+    """LRU of JSON bodies, one per route path, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, view: str, etag: str) -> bytes | None:
+        """Return the body cached for ``view`` if it was stored under ``etag``."""
+        entry = self._entries.get(view)
+        if entry is None or entry[0] != etag:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(view)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, view: str, etag: str, content: bytes) -> None:
+        """Store the body of ``view`` at ``etag``, replacing any older one."""
+        if len(content) > self.max_bytes:
+            return
+        self._discard(view)
+        self._entries[view] = (etag, content)
+        self._size += len(content)
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    def _discard(self, view: str) -> None:
+        entry = self._entries.pop(view, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def clear(self) -> None:
+        """Drop all cached bodies."""
+        self._entries.clear()
+        self._size = 0
+
+    def statistics(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+response_cache = ResponseCache(max_bytes=settings.response_cache_max_bytes)
@@ -0,0 +1,199 @@
+"""SQLite storage profiles applied to every new connection.
+
+A profile is a set of PRAGMAs (journal mode, durability, cache sizing,
+lock waiting and constraint enforcement). The active profile is chosen by
+``Settings.storage_profile`` and installed on each engine with
+``install_storage_profile``. Planner statistics are kept fresh by
+``run_periodic_optimize``.
+"""
+
+import asyncio
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+StorageProfileName = Literal["dev", "test", "prod"]
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """PRAGMA values applied when a connection is opened.
+
+    Attributes:
+        journal_mode: Journal mode; WAL lets readers run alongside the writer.
+        synchronous: Fsync level; NORMAL is durable across crashes in WAL mode.
+        cache_size: Page cache size; negative values are KiB.
+        mmap_size: Bytes of the database file to memory-map.
+        temp_store: Where temporary tables and indexes live.
+        busy_timeout: Milliseconds to wait for a lock before failing.
+        foreign_keys: Whether foreign key constraints are enforced.
+    """
+
+    journal_mode: str
+    synchronous: str
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    busy_timeout: int
+    foreign_keys: bool
+
+
+STORAGE_PROFILES: dict[StorageProfileName, StorageProfile] = {
+    "dev": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-16_000,
+        mmap_size=64 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5_000,
+        foreign_keys=True,
+    ),
+    # Throwaway databases: skip durability entirely
+    "test": StorageProfile(
+        journal_mode="MEMORY",
+        synchronous="OFF",
+        cache_size=-8_000,
+        mmap_size=0,
+        temp_store="MEMORY",
+        busy_timeout=1_000,
+        foreign_keys=True,
+    ),
+    "prod": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout=5_000,
+        foreign_keys=True,
+    ),
+}
+
+# PRAGMAs reported by current_storage_settings, in profile field order
+_REPORTED_PRAGMAS = tuple(StorageProfile.__dataclass_fields__)
+
+# PRAGMA synchronous / temp_store report numeric codes
+_SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+_TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+@dataclass
+class MaintenanceStatus:
+    """When planner statistics were last refreshed."""
+
+    last_analyze_at: datetime | None = None
+    last_optimize_at: datetime | None = None
+
+
+maintenance_status = MaintenanceStatus()
+
+
+def apply_storage_profile(dbapi_connection: Any, profile: StorageProfile) -> None:
+    """Execute a profile's PRAGMAs on a raw DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode = {profile.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous = {profile.synchronous}")
+        cursor.execute(f"PRAGMA cache_size = {profile.cache_size:d}")
+        cursor.execute(f"PRAGMA mmap_size = {profile.mmap_size:d}")
+        cursor.execute(f"PRAGMA temp_store = {profile.temp_store}")
+        cursor.execute(f"PRAGMA busy_timeout = {profile.busy_timeout:d}")
+        cursor.execute(f"PRAGMA foreign_keys = {'ON' if profile.foreign_keys else 'OFF'}")
+    finally:
+        cursor.close()
+
+
+def install_storage_profile(
+    target: AsyncEngine,
+    profile: StorageProfile,
+    *,
+    read_only: bool = False,
+) -> None:
+    """Apply a profile to every connection an engine opens.
+
+    Args:
+        target: Engine to configure. Non-SQLite engines are left untouched.
+        profile: PRAGMA values to apply.
+        read_only: Also set ``query_only`` so the connection rejects writes.
+    """
+    if target.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(target.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        apply_storage_profile(dbapi_connection, profile)
+        if read_only:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA query_only = ON")
+            cursor.close()
+
+
+def _display(name: str, value: Any) -> Any:
+    """Convert a PRAGMA result to the form used in profiles."""
+    if name == "synchronous":
+        return _SYNCHRONOUS_NAMES.get(value, value)
+    if name == "temp_store":
+        return _TEMP_STORE_NAMES.get(value, value)
+    if name == "journal_mode":
+        return str(value).upper()
+    if name == "foreign_keys":
+        return bool(value)
+    return value
+
+
+async def current_storage_settings(target: AsyncEngine) -> dict[str, Any]:
+    """Read the PRAGMA values active on one of an engine's connections."""
+    if target.dialect.name != "sqlite":
+        return {}
+    async with target.connect() as conn:
+        values = {}
+        for name in _REPORTED_PRAGMAS:
+            value = (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+            values[name] = _display(name, value)
+        return values
+
+
+def profile_settings(profile: StorageProfile) -> dict[str, Any]:
+    """Get a profile's configured values keyed by PRAGMA name."""
+    return asdict(profile)
+
+
+async def analyze_if_missing(target: AsyncEngine) -> None:
+    """Run ANALYZE once if the database has never collected statistics."""
+    if target.dialect.name != "sqlite":
+        return
+    async with target.begin() as conn:
+        has_stats = (
+            await conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            )
+        ).first()
+        if not has_stats:
+            await conn.execute(text("ANALYZE"))
+            maintenance_status.last_analyze_at = datetime.now(UTC)
+
+
+async def optimize(target: AsyncEngine) -> None:
+    """Let SQLite refresh statistics for tables whose query patterns changed."""
+    if target.dialect.name != "sqlite":
+        return
+    async with target.begin() as conn:
+        await conn.execute(text("PRAGMA optimize"))
+    maintenance_status.last_optimize_at = datetime.now(UTC)
+
+
+async def run_periodic_optimize(target: AsyncEngine, interval: float) -> None:
+    """Run ``PRAGMA optimize`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await optimize(target)
+        except Exception:
+            logger.exception("PRAGMA optimize failed")
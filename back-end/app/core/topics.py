@@ -0,0 +1,40 @@
+"""Topic names for websocket subscriptions.
+
+Change events are published to the topics of the entities they affect:
+
+- ``objective:{id}``: the objective and its key results
+- ``group:{id}``: objectives owned by the group
+- ``organization:{id}``: objectives owned by the organization's groups or users
+- ``user:{id}:assigned``: objectives assigned to the user directly, via a
+  role or via a group
+
+``*`` matches every event and is the default subscription, so clients that
+never subscribe keep receiving everything.
+"""
+
+import re
+
+ALL_TOPICS = "*"
+
+_TOPIC_PATTERN = re.compile(r"(?:objective|group|organization):\d+|user:\d+:assigned|\*")
+
+
+def objective_topic(objective_id: int) -> str:
+    return f"objective:{objective_id}"
+
+
+def group_topic(group_id: int) -> str:
+    return f"group:{group_id}"
+
+
+def organization_topic(organization_id: int) -> str:
+    return f"organization:{organization_id}"
+
+
+def user_assigned_topic(user_id: int) -> str:
+    return f"user:{user_id}:assigned"
+
+
+def is_valid_topic(topic: str) -> bool:
+    """Check a client-supplied topic name."""
+    return _TOPIC_PATTERN.fullmatch(topic) is not None
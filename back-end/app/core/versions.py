@@ -0,0 +1,160 @@
+"""Version counters behind the ``ETag`` headers of hot GET routes.
+
+Every committed write bumps the version of each entity it touched, keyed
+by ``(table, id)``, and of the entity's table as a whole, keyed by
+``(table, None)``. A route builds a weak ETag from the versions its
+response depends on before loading anything, so a request whose
+``If-None-Match`` still matches is answered with 304 without touching
+the ORM or Pydantic.
+
+Changes made through the unit of work are captured by a flush hook,
+which also bumps the rows an entity points at through foreign keys (a
+key result write bumps its objective). Bulk and Core statements only
+bump their table; code issuing them marks the entities it knows about
+with ``mark_written``.
+
+Versions are process-local. ETags embed a per-process nonce and roll
+over every ``ttl`` seconds, so writes made by other workers are
+eventually noticed, as with the count cache.
+"""
+
+import hashlib
+import secrets
+import time
+from collections.abc import Iterable
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import settings
+
+_PENDING_KEY = "entity_version_keys"
+
+# (table, id) for an entity, (table, None) for the whole table
+VersionKey = tuple[str, int | None]
+
+
+class VersionRegistry:
+    """Monotonic version counters per entity and per table."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._nonce = secrets.token_hex(4)
+        self._versions: dict[VersionKey, int] = {}
+        self._links: dict[str, frozenset[VersionKey]] = {}
+        # Number of bumps so far, to tell whether anything changed during a load
+        self.clock = 0
+
+    def version(self, table: str, id: int | None = None) -> int:
+        """Return the current version of an entity or table."""
+        return self._versions.get((table, id), 0)
+
+    def bump(self, keys: Iterable[VersionKey]) -> None:
+        """Advance the given entities and their tables by one version."""
+        keys = set(keys)
+        keys |= {(table, None) for table, _ in keys}
+        for key in keys:
+            self._versions[key] = self._versions.get(key, 0) + 1
+        self.clock += 1
+
+    def link(self, view: str, dependencies: Iterable[VersionKey]) -> None:
+        """Make ETags of ``view`` also cover entities its response embeds.
+
+        Used for data joined in without a foreign key, such as owner names.
+        Links are only known after loading a response, so an ETag built
+        from the new links is only valid for that response if ``clock``
+        did not move during the load.
+
+        Args:
+            view: Route path the response was served for.
+            dependencies: Entities or tables the response was built from.
+        """
+        self._links[view] = frozenset(dependencies)
+
+    def etag(self, view: str, *keys: VersionKey) -> str:
+        """Build a weak ETag from the versions of ``keys`` and ``view``'s links."""
+        covered = sorted(
+            (key, self._versions.get(key, 0))
+            for key in chain(keys, self._links.get(view, ()))
+        )
+        epoch = int(time.time() // self.ttl) if self.ttl > 0 else 0
+        payload = repr((view, epoch, covered)).encode()
+        digest = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        return f'W/"{self._nonce}-{digest}"'
+
+    def clear(self) -> None:
+        """Forget all versions and links."""
+        self._versions.clear()
+        self._links.clear()
+
+
+entity_versions = VersionRegistry(ttl=settings.etag_ttl_seconds)
+
+
+def _pending_keys(session: Session | AsyncSession) -> set[VersionKey]:
+    return session.info.setdefault(_PENDING_KEY, set())  # type: ignore[no-any-return]
+
+
+def mark_written(session: Session | AsyncSession, table: str, ids: Iterable[int]) -> None:
+    """Bump entities written by a bulk statement once the session commits."""
+    _pending_keys(session).update((table, id) for id in ids)
+
+
+def _written_keys(obj: Any) -> set[VersionKey]:
+    """Keys of a flushed entity, the rows its foreign keys point at and its link tables."""
+    state = inspect(obj)
+    mapper = state.mapper
+    table = mapper.local_table
+    identity = state.identity
+    keys: set[VersionKey] = {
+        (table.name, identity[0] if identity and len(identity) == 1 else None)
+    }
+    for column in table.columns:
+        if not column.foreign_keys:
+            continue
+        history = state.attrs[mapper.get_property_by_column(column).key].history
+        for foreign_key in column.foreign_keys:
+            keys.update(
+                (foreign_key.column.table.name, value)
+                for value in chain(history.sum(), history.deleted)
+                if value is not None
+            )
+    for relationship in mapper.relationships:
+        secondary = relationship.secondary
+        if secondary is not None and state.attrs[relationship.key].history.has_changes():
+            keys.add((secondary.name, None))
+    return keys
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_entities(session: Session, flush_context: Any) -> None:
+    """Record entities written by the unit of work."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if hasattr(obj, "__tablename__"):
+            _pending_keys(session).update(_written_keys(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state: ORMExecuteState) -> None:
+    """Record tables written by bulk INSERT/UPDATE/DELETE statements."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        name = getattr(getattr(orm_execute_state.statement, "table", None), "name", None)
+        if name:
+            _pending_keys(orm_execute_state.session).add((name, None))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_entities(session: Session) -> None:
+    """Publish new versions once writes are durable."""
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys:
+        entity_versions.bump(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_entities(session: Session) -> None:
+    """Forget writes that were rolled back."""
+    session.info.pop(_PENDING_KEY, None)
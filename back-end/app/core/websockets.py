@@ -1,40 +1,491 @@
-from typing import Any
+"""WebSocket connection management and fan-out.
+
+Each connection has a bounded outbound queue drained by its own writer
+task, so ``broadcast`` only enqueues and never waits on a socket. When a
+client cannot keep up and its queue fills, the slow consumer policy
+decides whether to drop its oldest message, drop the new one, or
+disconnect it.
+
+Connections subscribe to topics (see ``app.core.topics``) and a
+topic-to-connections index routes each event only to matching
+subscribers.
+
+``broadcast`` coalesces events for a short window (see
+``app.core.coalesce``) and publishes them through the configured broadcast
+backend (see ``app.core.broadcast``), which calls ``deliver`` in every
+worker process. ``deliver`` wraps each event in one ``EncodedMessage``
+shared by all recipients, so it is serialized once per wire encoding
+rather than once per socket.
+
+Every delivered event carries a ``seq`` number and is kept in a bounded
+replay buffer. A reconnecting client passes the last ``seq`` it saw and
+receives only the events it missed, or a ``resync_required`` message when
+they are no longer buffered.
+
+A reaper task sends every websocket a ``{"type": "ping"}`` message each
+ping interval and closes sockets that do not answer with
+``{"action": "pong"}`` within the ping timeout, or that have seen no
+events or client messages for the idle timeout. Sockets dropped silently
+by NAT or proxies therefore leave the subscriber index within one ping
+interval plus the timeout. Once ``max_connections`` are open, new clients
+are turned away.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from fastapi import WebSocket
 
+from app.config import settings
+from app.core.broadcast import BroadcastBackend, MemoryBackend, create_backend
+from app.core.coalesce import Coalescer
+from app.core.encoding import EncodedMessage, Encoding
+from app.core.exceptions import ServiceUnavailableError
+from app.core.logging import get_logger
+from app.core.topics import ALL_TOPICS
+
+logger = get_logger(__name__)
+
+SlowConsumerPolicy = Literal["drop_oldest", "drop_newest", "disconnect"]
+
+# Close code sent to clients disconnected for falling behind ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+# Close code sent to clients turned away because the server is at capacity
+AT_CAPACITY_CLOSE_CODE = 1013
+# Close code sent to clients reaped for missing pings or idling ("going away")
+REAPED_CLOSE_CODE = 1001
+
+PING_MESSAGE = EncodedMessage({"type": "ping"})
+
+
+@dataclass(frozen=True, slots=True)
+class BufferedEvent:
+    """A delivered event kept for replay."""
+
+    seq: int
+    topics: frozenset[str]
+    message: EncodedMessage
+
+
+class Connection:
+    """A subscriber with its outbound queue and counters.
+
+    Websocket connections are drained by a writer task. Event streams
+    (``websocket`` is None) are drained by whoever opened them, e.g. the
+    SSE endpoint.
+    """
+
+    def __init__(
+        self, websocket: WebSocket | None, queue_size: int, encoding: Encoding
+    ) -> None:
+        self.websocket = websocket
+        self.encoding = encoding
+        self.queue: asyncio.Queue[EncodedMessage] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.closed = False
+        self.topics: set[str] = set()
+        self.writer: asyncio.Task[None] | None = None
+        # Monotonic time of the last event or client message, for the idle deadline
+        self.last_active = time.monotonic()
+        # Monotonic time of the unanswered ping, if any
+        self.ping_sent_at: float | None = None
+
+    @property
+    def key(self) -> "WebSocket | Connection":
+        """Key identifying this subscriber in ``ConnectionManager.active_connections``."""
+        return self.websocket if self.websocket is not None else self
+
+
+# A websocket, or the Connection object of an event stream
+Client = WebSocket | Connection
+
 
 class ConnectionManager:
     """Manages active WebSocket connections."""
 
-    def __init__(self) -> None:
-        self.active_connections: set[WebSocket] = set()
+    def __init__(
+        self,
+        queue_size: int = settings.ws_queue_size,
+        policy: SlowConsumerPolicy = settings.ws_slow_consumer_policy,
+        backend: BroadcastBackend | None = None,
+        coalesce_window: float = settings.ws_coalesce_window_seconds,
+        replay_size: int = settings.ws_replay_buffer_size,
+        ping_interval: float = settings.ws_ping_interval_seconds,
+        ping_timeout: float = settings.ws_ping_timeout_seconds,
+        idle_timeout: float = settings.ws_idle_timeout_seconds,
+        max_connections: int = settings.ws_max_connections,
+    ) -> None:
+        self.queue_size = queue_size
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.replay: deque[BufferedEvent] = deque(maxlen=replay_size)
+        self.last_seq = 0
+        self.backend = backend or MemoryBackend()
+        self.coalescer = Coalescer(coalesce_window, self.publish)
+        self._started = False
+        self.policy = policy
+        self.active_connections: dict[Client, Connection] = {}
+        self.subscribers: dict[str, set[Connection]] = {}
+        self.dropped_messages = 0
+        self.slow_disconnects = 0
+        self.rejected_connections = 0
+        self.reaped_connections = 0
+        self._closing: set[asyncio.Task[None]] = set()
+        self._reaper: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start receiving events from the broadcast backend and reaping dead sockets."""
+        if not self._started:
+            await self.backend.start(self.deliver)
+            self.last_seq = max(self.last_seq, self.backend.last_seq)
+            self._started = True
+            if self.ping_interval > 0:
+                self._reaper = asyncio.create_task(self._reap_forever())
+
+    @property
+    def at_capacity(self) -> bool:
+        """Whether ``max_connections`` subscribers are already open."""
+        return 0 < self.max_connections <= len(self.active_connections)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        topics: Iterable[str] = (ALL_TOPICS,),
+        subprotocol: str | None = None,
+        encoding: Encoding = "json",
+        since: int | None = None,
+    ) -> bool:
+        """Accept connection, subscribe it to ``topics`` and start its writer task.
+
+        Args:
+            websocket: Incoming socket.
+            topics: Initial subscriptions.
+            subprotocol: Negotiated subprotocol to confirm to the client.
+            encoding: Wire encoding for messages to this socket.
+            since: Last sequence number the client saw; missed events are
+                replayed before live ones.
+
+        Returns:
+            False if the server was at capacity and the socket was closed.
+        """
+        if subprotocol is None:
+            await websocket.accept()
+        else:
+            await websocket.accept(subprotocol=subprotocol)
+        if self.at_capacity:
+            # Accept first so the client sees a close code it can back off on
+            logger.warning("Rejecting websocket at capacity | max=%d", self.max_connections)
+            self.rejected_connections += 1
+            await self._close(websocket, AT_CAPACITY_CLOSE_CODE)
+            return False
+        connection = Connection(websocket, self.queue_size, encoding)
+        connection.writer = asyncio.create_task(self._write(connection))
+        self.active_connections[websocket] = connection
+        self.subscribe(websocket, topics)
+        if since is not None:
+            self._replay(connection, since)
+        return True
+
+    def open_stream(self, topics: Iterable[str], since: int | None = None) -> Connection:
+        """Register a subscriber whose queue the caller drains, e.g. an SSE response.
+
+        Args:
+            topics: Subscriptions.
+            since: Last sequence number the client saw, for replay.
+
+        Returns:
+            The stream's connection; pass it to ``disconnect`` when done.
+
+        Raises:
+            ServiceUnavailableError: If the server is at capacity.
+        """
+        if self.at_capacity:
+            self.rejected_connections += 1
+            raise ServiceUnavailableError(
+                "Too many open event connections",
+                details={"max_connections": self.max_connections},
+            )
+        connection = Connection(None, self.queue_size, "json")
+        self.active_connections[connection] = connection
+        self.subscribe(connection, topics)
+        if since is not None:
+            self._replay(connection, since)
+        return connection
+
+    def _replay(self, connection: Connection, since: int) -> None:
+        """Queue buffered events after ``since`` that match the connection's topics.
+
+        Sends ``resync_required`` instead if any of those events has left
+        the buffer, or if ``since`` is from a sequence this server never
+        issued (e.g. before a restart).
+        """
+        oldest = self.replay[0].seq if self.replay else self.last_seq + 1
+        if since > self.last_seq or since < oldest - 1:
+            self._enqueue(connection, EncodedMessage(
+                {"type": "resync_required", "seq": self.last_seq}
+            ))
+            return
+        everything = ALL_TOPICS in connection.topics
+        for event in self.replay:
+            if event.seq > since and (everything or event.topics & connection.topics):
+                self._enqueue(connection, event.message)
+
+    def disconnect(self, client: Client) -> None:
+        """Remove connection and its subscriptions, and stop its writer."""
+        connection = self.active_connections.pop(client, None)
+        if connection is None:
+            return
+        connection.closed = True
+        self._drop_subscriptions(connection, set(connection.topics))
+        if connection.writer is not None:
+            connection.writer.cancel()
+
+    def received(self, client: Client, heartbeat: bool = False) -> None:
+        """Record a message from a client, answering any outstanding ping.
+
+        Args:
+            client: Sender.
+            heartbeat: True for pongs, which prove the socket is alive but do
+                not postpone the idle deadline.
+        """
+        connection = self.active_connections.get(client)
+        if connection is None:
+            return
+        connection.ping_sent_at = None
+        if not heartbeat:
+            connection.last_active = time.monotonic()
 
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept connection and add to set."""
-        await websocket.accept()
-        self.active_connections.add(websocket)
+    def subscribe(self, client: Client, topics: Iterable[str]) -> set[str]:
+        """Add topic subscriptions for a connection.
 
-    def disconnect(self, websocket: WebSocket) -> None:
-        """Remove connection from set (O(1) operation)."""
-        self.active_connections.discard(websocket)
+        Returns:
+            The connection's topics after the change.
+        """
+        connection = self.active_connections.get(client)
+        if connection is None:
+            return set()
+        for topic in topics:
+            connection.topics.add(topic)
+            self.subscribers.setdefault(topic, set()).add(connection)
+        return set(connection.topics)
+
+    def unsubscribe(self, client: Client, topics: Iterable[str]) -> set[str]:
+        """Remove topic subscriptions for a connection.
+
+        Returns:
+            The connection's topics after the change.
+        """
+        connection = self.active_connections.get(client)
+        if connection is None:
+            return set()
+        self._drop_subscriptions(connection, set(topics))
+        return set(connection.topics)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast JSON message to all active connections.
+    def _drop_subscriptions(self, connection: Connection, topics: set[str]) -> None:
+        """Remove a connection from the index for the given topics."""
+        for topic in topics & connection.topics:
+            connection.topics.discard(topic)
+            subscribers = self.subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self.subscribers[topic]
 
-        Failed connections are removed from the active set.
+    async def send(self, client: Client, message: dict[str, Any]) -> None:
+        """Queue a message for one connection, e.g. a reply to a client request."""
+        connection = self.active_connections.get(client)
+        if connection is not None:
+            self._enqueue(connection, EncodedMessage(message))
+
+    async def broadcast(self, message: dict[str, Any], topics: Iterable[str] = ()) -> None:
+        """Publish a JSON message to subscribers of any of ``topics`` in every worker.
+
+        The message may be held for the coalescing window and merged with
+        other events for the same topics.
         """
-        failed_connections: list[WebSocket] = []
+        await self.coalescer.add(message, list(topics))
 
-        for connection in self.active_connections:
+    async def publish(self, message: dict[str, Any], topics: Iterable[str] = ()) -> None:
+        """Publish a JSON message through the backend now, skipping the coalescing window.
+
+        Returns once the backend has accepted the message, so callers that
+        must not lose it can wait for that before acting on its delivery.
+        """
+        await self.start()
+        await self.backend.publish(message, list(topics))
+
+    async def deliver(self, message: dict[str, Any], topics: Sequence[str], seq: int) -> None:
+        """Queue a message for local subscribers of any of ``topics``.
+
+        The message is stamped with ``seq`` and kept for replay.
+        Connections subscribed to ``*`` receive every message. Never waits
+        on a socket; full queues are handled by the slow consumer policy.
+        """
+        payload = EncodedMessage({**message, "seq": seq})
+        self.replay.append(BufferedEvent(seq, frozenset(topics), payload))
+        self.last_seq = max(self.last_seq, seq)
+
+        recipients: set[Connection] = set(self.subscribers.get(ALL_TOPICS, ()))
+        for topic in topics:
+            recipients |= self.subscribers.get(topic, set())
+        now = time.monotonic()
+        for connection in recipients:
+            connection.last_active = now
+            self._enqueue(connection, payload)
+
+    def _enqueue(self, connection: Connection, message: EncodedMessage) -> None:
+        """Add a message to one connection's queue, applying the policy if full."""
+        try:
+            connection.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        connection.dropped += 1
+        self.dropped_messages += 1
+        if self.policy == "drop_oldest":
+            connection.queue.get_nowait()
+            connection.queue.task_done()
+            connection.queue.put_nowait(message)
+        elif self.policy == "disconnect":
+            logger.warning("Disconnecting slow event consumer | queued=%d", self.queue_size)
+            self.slow_disconnects += 1
+            self.disconnect(connection.key)
+            if connection.websocket is not None:
+                self._close_later(connection.websocket, SLOW_CONSUMER_CLOSE_CODE)
+
+    def _close_later(self, websocket: WebSocket, code: int) -> None:
+        """Close a socket in a tracked background task."""
+        task = asyncio.create_task(self._close(websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        """Close a socket, ignoring clients that are already gone."""
+        with contextlib.suppress(Exception):
+            await websocket.close(code=code)
+
+    async def _write(self, connection: Connection) -> None:
+        """Send queued messages to one socket until it fails or is cancelled."""
+        websocket = connection.websocket
+        assert websocket is not None
+        try:
+            while True:
+                message = await connection.queue.get()
+                try:
+                    data = message.encode(connection.encoding)
+                    if isinstance(data, bytes):
+                        await websocket.send_bytes(data)
+                    else:
+                        await websocket.send_text(data)
+                finally:
+                    connection.queue.task_done()
+        except Exception:
+            # The socket is gone; stop tracking it
+            self.disconnect(websocket)
+
+    def reap(self, now: float | None = None) -> int:
+        """Close dead or idle websockets and ping the rest.
+
+        A socket is dead if a ping has gone unanswered for ``ping_timeout``
+        seconds and idle if it has had no events or client messages for
+        ``idle_timeout`` seconds. Event streams are skipped; their owner
+        detects disconnects itself.
+
+        Returns:
+            Number of sockets closed.
+        """
+        now = time.monotonic() if now is None else now
+        reaped = 0
+        for connection in list(self.active_connections.values()):
+            websocket = connection.websocket
+            if websocket is None:
+                continue
+            if connection.ping_sent_at is not None:
+                expired = now - connection.ping_sent_at > self.ping_timeout
+                reason = "ping timeout"
+            else:
+                expired = 0 < self.idle_timeout < now - connection.last_active
+                reason = "idle"
+            if expired:
+                logger.info("Reaping websocket | reason=%s", reason)
+                self.disconnect(websocket)
+                self._close_later(websocket, REAPED_CLOSE_CODE)
+                reaped += 1
+            elif connection.ping_sent_at is None:
+                connection.ping_sent_at = now
+                self._enqueue(connection, PING_MESSAGE)
+        self.reaped_connections += reaped
+        return reaped
+
+    async def _reap_forever(self) -> None:
+        """Run ``reap`` every ping interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.ping_interval)
             try:
-                await connection.send_json(message)
+                self.reap()
             except Exception:
-                failed_connections.append(connection)
+                logger.exception("Websocket reaping failed")
+
+    async def drain(self) -> None:
+        """Flush coalesced events and wait until queued messages are handed to sockets."""
+        await self.coalescer.flush()
+        for connection in list(self.active_connections.values()):
+            await connection.queue.join()
 
-        # Clean up failed connections
-        for connection in failed_connections:
-            self.active_connections.discard(connection)
+    async def close(self) -> None:
+        """Stop the backend and all writer tasks, e.g. on application shutdown."""
+        await self.coalescer.flush()
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        if self._started:
+            await self.backend.stop()
+            self._started = False
+        writers = [c.writer for c in self.active_connections.values() if c.writer is not None]
+        for connection in self.active_connections.values():
+            connection.closed = True
+        self.active_connections.clear()
+        self.subscribers.clear()
+        for writer in writers:
+            writer.cancel()
+        await asyncio.gather(*writers, return_exceptions=True)
 
+    def statistics(self) -> dict[str, Any]:
+        """Report connection count, queue depths and drop counters."""
+        connections = list(self.active_connections.values())
+        depths = [c.queue.qsize() for c in connections]
+        return {
+            "connections": len(depths),
+            "streams": sum(1 for c in connections if c.websocket is None),
+            "topics": len(self.subscribers),
+            "queueSize": self.queue_size,
+            "policy": self.policy,
+            "queuedMessages": sum(depths),
+            "maxQueueDepth": max(depths, default=0),
+            "droppedMessages": self.dropped_messages,
+            "slowDisconnects": self.slow_disconnects,
+            "maxConnections": self.max_connections,
+            "rejectedConnections": self.rejected_connections,
+            "reapedConnections": self.reaped_connections,
+            "pingInterval": self.ping_interval,
+            "pingTimeout": self.ping_timeout,
+            "idleTimeout": self.idle_timeout,
+            "lastSeq": self.last_seq,
+            "replayBuffered": len(self.replay),
+            "coalescing": self.coalescer.statistics(),
+            "broadcast": self.backend.statistics(),
+        }
 
-manager = ConnectionManager()
 
+manager = ConnectionManager(backend=create_backend())
@@ -1,14 +1,55 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
+from app.core import loading  # noqa: F401  (registers the strict loading listener)
+from app.core.storage import STORAGE_PROFILES, install_storage_profile
+
+
+def _is_memory_database(url: str) -> bool:
+    """Check whether the URL points at a private in-memory SQLite database."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
 
+
+storage_profile = STORAGE_PROFILES[settings.storage_profile]
+
+# Writer: a single dedicated connection. Write transactions queue on pool
+# checkout, so SQLite never sees two writers from this process at once.
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=settings.sql_echo,
+    **(
+        {}
+        if _is_memory_database(settings.database_url)
+        else {"pool_size": 1, "max_overflow": 0, "pool_timeout": settings.db_write_timeout}
+    ),
 )
+install_storage_profile(engine, storage_profile)
+
+# Readers: a pool of connections restricted to queries. An in-memory database
+# is private to its connection, so readers share the writer there.
+read_engine: AsyncEngine
+if _is_memory_database(settings.database_url):
+    read_engine = engine
+else:
+    read_engine = create_async_engine(
+        settings.database_url,
+        echo=settings.sql_echo,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=0,
+        pool_timeout=settings.db_read_timeout,
+    )
+    install_storage_profile(read_engine, storage_profile, read_only=True)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -16,12 +57,19 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session on the serialized writer connection."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -29,6 +77,46 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Explicit name for routes that write
+get_write_db = get_db
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a read-only session from the reader pool."""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def _pool_status(target: AsyncEngine) -> dict[str, Any]:
+    """Collect connection counters for an engine's pool."""
+    pool = target.pool
+    stats: dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            stats[name] = counter()
+    return stats
+
+
+def pool_statistics() -> dict[str, Any]:
+    """Report reader and writer pool usage."""
+    return {
+        "writer": _pool_status(engine),
+        "reader": _pool_status(read_engine),
+        "sharedReaderWriter": read_engine is engine,
+    }
+
+
 async def create_tables() -> None:
+    from app.models.assignment import ensure_assignments
+    from app.models.progress import ensure_objective_aggregates
+    from app.models.search import create_search_indexes
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_objective_aggregates)
+        await conn.run_sync(ensure_assignments)
+        await conn.run_sync(create_search_indexes)
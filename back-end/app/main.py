@@ -1,5 +1,7 @@
 """FastAPI application entry point."""
 
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -9,8 +11,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.core.logging import setup_logging
 from app.core.middleware import error_handler_middleware
-from app.database import create_tables
+from app.core.outbox import outbox_dispatcher
+from app.core.storage import analyze_if_missing, run_periodic_optimize
+from app.core.websockets import manager
+from app.database import AsyncSessionLocal, create_tables, engine
 from app.routers import (
+    diagnostics,
+    events,
     groups,
     keyresults,
     kpis,
@@ -36,8 +43,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan context manager."""
     # Startup: create database tables
     await create_tables()
+    await analyze_if_missing(engine)
+    await manager.start()
+    await outbox_dispatcher.start(AsyncSessionLocal)
+    optimizer = None
+    if settings.storage_optimize_interval_seconds > 0:
+        optimizer = asyncio.create_task(
+            run_periodic_optimize(engine, settings.storage_optimize_interval_seconds)
+        )
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: stop dispatching, then websocket writers and background maintenance
+    await outbox_dispatcher.stop()
+    await manager.close()
+    if optimizer is not None:
+        optimizer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await optimizer
 
 
 app = FastAPI(
@@ -83,6 +104,8 @@ app.include_router(reactions.router)
 app.include_router(recurring.router)
 app.include_router(streaks.router)
 app.include_router(ws.router)
+app.include_router(events.router)
+app.include_router(diagnostics.router)
 
 
 @app.get("/")
@@ -1,3 +1,4 @@
+from app.models.assignment import UserObjectiveAssignment
 from app.models.associations import (
     GroupCascadedObjective,
     ObjectiveOwnership,
@@ -15,10 +16,13 @@ from app.models.keyresult import KeyResult
 from app.models.kpi import Kpi
 from app.models.objective import Objective
 from app.models.organization import Organization
+from app.models.outbox import OutboxEvent
 from app.models.poll import Choice, Question
+from app.models.progress import sync_objective_progress
 from app.models.reaction import Reaction
 from app.models.recurring_schedule import RecurringSchedule
 from app.models.role import Role
+from app.models.search import SEARCHABLE_TABLES, fts_table_name
 from app.models.user import User
 
 __all__ = [
@@ -34,13 +38,18 @@ __all__ = [
     "Choice",
     "Reaction",
     "RecurringSchedule",
+    "OutboxEvent",
     "ObjectiveOwnership",
     "OwnerType",
     "GroupCascadedObjective",
+    "UserObjectiveAssignment",
     "user_organizations",
     "group_organizations",
     "user_groups",
     "user_roles",
     "group_roles",
     "group_delegates",
+    "sync_objective_progress",
+    "SEARCHABLE_TABLES",
+    "fts_table_name",
 ]
@@ -0,0 +1,188 @@
+"""Materialized objective assignments per user.
+
+``user_objective_assignments`` holds one row for every way a user is
+assigned an objective: directly (``via_type`` user), through one of
+their roles or through one of their groups. "My OKRs" is then a range
+scan of the primary key instead of resolving roles, groups and
+ownerships on every request.
+
+Rows are kept current in the transaction of the change that affects
+them: ``OwnershipRepository`` when ownerships are added or removed,
+``MembershipRepository`` when users join or leave roles and groups, and
+a flush hook when a role or group is deleted. Deleted users and
+objectives are handled by ON DELETE CASCADE. ``rebuild_assignments``
+recomputes the table from scratch, e.g. after seeding.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import (
+    Connection,
+    Delete,
+    Enum,
+    ForeignKey,
+    Index,
+    Insert,
+    Integer,
+    delete,
+    event,
+    exists,
+    insert,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.database import Base
+from app.models.associations import ObjectiveOwnership, OwnerType, user_groups, user_roles
+from app.models.group import Group
+from app.models.role import Role
+from app.models.user import User
+
+
+class UserObjectiveAssignment(Base):
+    """One path by which a user is assigned an objective."""
+
+    __tablename__ = "user_objective_assignments"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    objective_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("objectives.id", ondelete="CASCADE"), primary_key=True
+    )
+    via_type: Mapped[OwnerType] = mapped_column(
+        Enum(OwnerType, name="owner_type_enum"), primary_key=True
+    )
+    # The user itself, or the role or group that owns the objective
+    via_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    __table_args__ = (
+        # Finds the rows to drop when an ownership or membership goes away
+        Index("ix_user_objective_assignments_via", "via_type", "via_id", "objective_id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"UserObjectiveAssignment(user_id={self.user_id}, objective_id={self.objective_id}, "
+            f"via_type={self.via_type}, via_id={self.via_id})"
+        )
+
+
+_assignment = UserObjectiveAssignment
+_COLUMNS = ["user_id", "objective_id", "via_type", "via_id"]
+
+# Membership tables linking users to each owner type that is not a user
+_MEMBERS = {
+    OwnerType.ROLE: (user_roles.c.role_id, user_roles.c.user_id),
+    OwnerType.GROUP: (user_groups.c.group_id, user_groups.c.user_id),
+}
+
+
+def _via(owner_type: OwnerType) -> Any:
+    return literal(owner_type, _assignment.__table__.c.via_type.type)
+
+
+def _insert_ignoring_existing() -> Insert:
+    return insert(_assignment).prefix_with("OR IGNORE")
+
+
+def assign_ownership(objective_id: int, owner_type: OwnerType, owner_id: int) -> Insert:
+    """Statement adding the users an objective reaches through a new ownership."""
+    values = (literal(objective_id), _via(owner_type), literal(owner_id))
+    if owner_type == OwnerType.USER:
+        rows = select(literal(owner_id), *values)
+    else:
+        owner_column, user_column = _MEMBERS[owner_type]
+        rows = select(user_column, *values).where(owner_column == owner_id)
+    return _insert_ignoring_existing().from_select(_COLUMNS, rows)
+
+
+def unassign_ownership(objective_id: int, owner_type: OwnerType, owner_id: int) -> Delete:
+    """Statement removing the assignments of a removed ownership."""
+    return delete(_assignment).where(
+        _assignment.via_type == owner_type,
+        _assignment.via_id == owner_id,
+        _assignment.objective_id == objective_id,
+    )
+
+
+def assign_membership(user_id: int, owner_type: OwnerType, owner_id: int) -> Insert:
+    """Statement adding the objectives owned by a role or group a user joined."""
+    ownerships = ObjectiveOwnership.__table__
+    rows = select(
+        literal(user_id), ownerships.c.objective_id, _via(owner_type), literal(owner_id)
+    ).where(
+        ownerships.c.owner_type == owner_type,
+        ownerships.c.owner_id == owner_id,
+    )
+    return _insert_ignoring_existing().from_select(_COLUMNS, rows)
+
+
+def unassign_membership(user_id: int, owner_type: OwnerType, owner_id: int) -> Delete:
+    """Statement removing the objectives a user had through a role or group they left."""
+    return delete(_assignment).where(
+        _assignment.via_type == owner_type,
+        _assignment.via_id == owner_id,
+        _assignment.user_id == user_id,
+    )
+
+
+def rebuild_assignments(connection: Connection) -> None:
+    """Recompute every assignment from ownerships and memberships."""
+    ownerships = ObjectiveOwnership.__table__
+    users = User.__table__
+    # Ownerships outlive their owners, so only existing users are assigned
+    direct = (
+        select(
+            users.c.id, ownerships.c.objective_id, ownerships.c.owner_type, ownerships.c.owner_id
+        )
+        .join_from(ownerships, users, users.c.id == ownerships.c.owner_id)
+        .where(ownerships.c.owner_type == OwnerType.USER)
+    )
+    through_members = [
+        select(
+            user_column, ownerships.c.objective_id, ownerships.c.owner_type, ownerships.c.owner_id
+        )
+        .join_from(ownerships, owner_column.table, owner_column == ownerships.c.owner_id)
+        .where(ownerships.c.owner_type == owner_type)
+        for owner_type, (owner_column, user_column) in _MEMBERS.items()
+    ]
+    connection.execute(delete(_assignment))
+    connection.execute(
+        _insert_ignoring_existing().from_select(_COLUMNS, union_all(direct, *through_members))
+    )
+
+
+def ensure_assignments(connection: Connection) -> None:
+    """Backfill the table for databases created before it existed."""
+    has_ownerships = connection.scalar(select(exists(ObjectiveOwnership.__table__.select())))
+    has_assignments = connection.scalar(select(exists(select(_assignment))))
+    if has_ownerships and not has_assignments:
+        rebuild_assignments(connection)
+
+
+@event.listens_for(Session, "after_flush")
+def _unassign_deleted_owners(session: Session, flush_context: Any) -> None:
+    """Drop assignments through deleted roles and groups.
+
+    Their membership rows cascade away in the database, but ownerships
+    have no foreign key to the owner and stay behind.
+    """
+    deleted = [
+        (owner_type, obj.id)
+        for obj in session.deleted
+        for model, owner_type in ((Role, OwnerType.ROLE), (Group, OwnerType.GROUP))
+        if isinstance(obj, model)
+    ]
+    if deleted:
+        connection = session.connection()
+        for owner_type, owner_id in deleted:
+            connection.execute(
+                delete(_assignment).where(
+                    _assignment.via_type == owner_type, _assignment.via_id == owner_id
+                )
+            )
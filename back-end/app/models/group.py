@@ -42,7 +42,7 @@ class Group(Base):
         remote_side="Group.id",
         foreign_keys=[parent_id],
         back_populates="children",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # Child groups relationship
@@ -50,43 +50,49 @@ class Group(Base):
         "Group",
         back_populates="parent",
         foreign_keys=[parent_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     # Owner relationship
     owner: Mapped[User | None] = relationship(
         "User",
         foreign_keys=[owner_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # Delegates: users who can edit this group (besides the owner)
     delegates: Mapped[list[User]] = relationship(
         "User",
         secondary=group_delegates,
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
-    # Many-to-many relationships
+    # Many-to-many relationships. Never loaded implicitly: repositories
+    # attach the loader options each query needs (see load_profiles).
     users: Mapped[list[User]] = relationship(
         "User",
         secondary=user_groups,
         back_populates="groups",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     organizations: Mapped[list[Organization]] = relationship(
         "Organization",
         secondary=group_organizations,
         back_populates="groups",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     roles: Mapped[list[Role]] = relationship(
         "Role",
         secondary=group_roles,
         back_populates="groups",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
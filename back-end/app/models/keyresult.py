@@ -19,7 +19,7 @@ class KeyResult(Base):
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str] = mapped_column(String(100), nullable=False)
     objective_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("objectives.id"), nullable=False
+        Integer, ForeignKey("objectives.id"), nullable=False, index=True
     )
 
     target_value: Mapped[float | None] = mapped_column(
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, Integer, String
+from sqlalchemy import Boolean, Date, Float, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -27,6 +27,17 @@ class Objective(Base):
     # Completion status
     is_complete: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    # Key result aggregates, maintained by app.models.progress on every flush
+    progress_percentage: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False, index=True
+    )
+    keyresult_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    completed_keyresult_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
     keyresults: Mapped[list[KeyResult]] = relationship(
         "KeyResult", back_populates="objective", cascade="all, delete-orphan"
     )
@@ -37,17 +48,6 @@ class Objective(Base):
         lazy="selectin",
     )
 
-    @property
-    def progress_percentage(self) -> float:
-        """Calculate overall progress based on key results.
-
-        Returns the average progress of all key results, or 0 if no key results exist.
-        """
-        if not self.keyresults:
-            return 0.0
-        total_progress = sum(kr.progress_percentage for kr in self.keyresults)
-        return total_progress / len(self.keyresults)
-
     @property
     def celebration_trigger(self) -> str | None:
         """Determine if a celebration should be triggered based on progress.
@@ -0,0 +1,223 @@
+"""Transactional outbox of change events.
+
+Writes to objectives, key results, reactions, streaks and ownerships add
+rows to ``outbox_events`` in the same transaction, so an event exists if
+and only if its change committed. ``app.core.outbox`` drains the table
+into the websocket broadcast layer in the background.
+
+Changes made through the unit of work are captured by a flush hook.
+Bulk statements bypass it, so code issuing them adds events itself with
+``outbox_event``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from itertools import chain
+from typing import Any, Literal
+
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Integer,
+    String,
+    event,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.topics import group_topic, objective_topic, user_assigned_topic
+from app.database import Base
+from app.models.associations import ObjectiveOwnership, OwnerType
+from app.models.group_streak import GroupStreak
+from app.models.keyresult import KeyResult
+from app.models.objective import Objective
+from app.models.reaction import Reaction
+
+# Session.info flag set when a flush wrote outbox rows, so the commit can wake the dispatcher
+OUTBOX_PENDING_KEY = "outbox_pending"
+
+Action = Literal["created", "updated", "deleted"]
+
+
+class OutboxEvent(Base):
+    """A committed change waiting to be broadcast."""
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # Topics known when the change was written
+    topics: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    # Objective whose ownership topics are added when the event is dispatched
+    objective_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    # Set while a dispatcher publishes the event; other dispatchers skip it until then
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def to_message(self) -> dict[str, Any]:
+        """Build the websocket message for this event."""
+        return {"type": self.type, "action": self.action, "data": self.data}
+
+    def __repr__(self) -> str:
+        return f"OutboxEvent(id={self.id}, type={self.type}, action={self.action})"
+
+
+def outbox_event(
+    type: str,
+    action: Action,
+    data: dict[str, Any],
+    *,
+    topics: Iterable[str] = (),
+    objective_id: Any = None,
+) -> OutboxEvent:
+    """Build an event to add to the session alongside a change.
+
+    Args:
+        type: Message type, e.g. ``keyresult_update``.
+        action: What happened to the entity.
+        data: Message payload.
+        topics: Topics to publish to besides the objective's.
+        objective_id: Objective the change belongs to, or a scalar subquery
+            that selects it.
+    """
+    return OutboxEvent(
+        type=type, action=action, data=data, topics=sorted(set(topics)), objective_id=objective_id
+    )
+
+
+def owner_topics(owner_type: OwnerType, owner_id: int) -> list[str]:
+    """Topics of an objective owner itself, which outlive the ownership row."""
+    if owner_type == OwnerType.USER:
+        return [user_assigned_topic(owner_id)]
+    if owner_type == OwnerType.GROUP:
+        return [group_topic(owner_id)]
+    return []
+
+
+def _objective_row(objective: Objective, action: Action) -> dict[str, Any]:
+    return {
+        "type": "objective_update",
+        "action": action,
+        "data": {"id": objective.id},
+        "topics": [],
+        "objective_id": objective.id,
+    }
+
+
+def _keyresult_row(keyresult: KeyResult, action: Action) -> dict[str, Any]:
+    # A key result moved between objectives is announced to the old one too
+    moved_from = [
+        objective_topic(id)
+        for id in inspect(keyresult).attrs.objective_id.history.deleted
+        if id is not None and id != keyresult.objective_id
+    ]
+    return {
+        "type": "keyresult_update",
+        "action": action,
+        "data": {
+            "id": keyresult.id,
+            "objectiveId": keyresult.objective_id,
+            "progress": keyresult.progress_percentage,
+        },
+        "topics": moved_from,
+        "objective_id": keyresult.objective_id,
+    }
+
+
+def _ownership_row(ownership: ObjectiveOwnership, action: Action) -> dict[str, Any]:
+    owner_type = OwnerType(ownership.owner_type)
+    return {
+        "type": "ownership_update",
+        "action": action,
+        "data": {
+            "objectiveId": ownership.objective_id,
+            "ownerType": owner_type.value,
+            "ownerId": ownership.owner_id,
+        },
+        "topics": owner_topics(owner_type, ownership.owner_id),
+        "objective_id": ownership.objective_id,
+    }
+
+
+def _streak_row(streak: GroupStreak, action: Action) -> dict[str, Any]:
+    return {
+        "type": "streak_update",
+        "action": action,
+        "data": {
+            "groupId": streak.group_id,
+            "currentStreak": streak.current_streak,
+            "longestStreak": streak.longest_streak,
+        },
+        "topics": [group_topic(streak.group_id)],
+        "objective_id": None,
+    }
+
+
+def _reaction_row(reaction: Reaction, action: Action) -> dict[str, Any]:
+    # objective_id is filled in from the key result by the flush hook
+    return {
+        "type": "reaction_update",
+        "action": action,
+        "data": {"keyResultId": reaction.key_result_id},
+        "topics": [],
+        "objective_id": None,
+    }
+
+
+_ROW_BUILDERS: dict[type[Any], Callable[[Any, Action], dict[str, Any]]] = {
+    Objective: _objective_row,
+    KeyResult: _keyresult_row,
+    ObjectiveOwnership: _ownership_row,
+    GroupStreak: _streak_row,
+    Reaction: _reaction_row,
+}
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_changes(session: Session, flush_context: Any) -> None:
+    """Add outbox rows for tracked entities written in this flush."""
+    rows: list[dict[str, Any]] = []
+    added_events = False
+    changes: chain[tuple[Any, Action]] = chain(
+        ((obj, "created") for obj in session.new),
+        ((obj, "updated") for obj in session.dirty),
+        ((obj, "deleted") for obj in session.deleted),
+    )
+    for obj, action in changes:
+        if isinstance(obj, OutboxEvent):
+            added_events = True
+            continue
+        builder = _ROW_BUILDERS.get(type(obj))
+        if builder is None:
+            continue
+        if action == "updated" and not session.is_modified(obj, include_collections=False):
+            continue
+        rows.append(builder(obj, action))
+
+    if rows:
+        connection = session.connection()
+        reaction_keyresults = {
+            row["data"]["keyResultId"] for row in rows if row["type"] == "reaction_update"
+        }
+        if reaction_keyresults:
+            objective_of = dict(connection.execute(
+                select(KeyResult.id, KeyResult.objective_id)
+                .where(KeyResult.id.in_(reaction_keyresults))
+            ).tuples().all())
+            for row in rows:
+                if row["type"] == "reaction_update":
+                    row["objective_id"] = objective_of.get(row["data"]["keyResultId"])
+        now = datetime.utcnow()
+        connection.execute(insert(OutboxEvent), [{**row, "created_at": now} for row in rows])
+
+    if rows or added_events:
+        session.info[OUTBOX_PENDING_KEY] = True
+
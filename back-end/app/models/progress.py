@@ -0,0 +1,167 @@
+"""Materialized key result aggregates on objectives.
+
+``Objective.progress_percentage``, ``keyresult_count`` and
+``completed_keyresult_count`` are stored columns so objective lists can be
+sorted and filtered by progress without loading key results. They are
+recomputed for the affected objectives whenever a flush writes key results,
+using one grouped aggregate update over all of them.
+"""
+
+from collections.abc import Iterable
+from itertools import chain
+from typing import Any, cast
+
+from sqlalchemy import (
+    Connection,
+    Table,
+    case,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.util import identity_key
+
+from app.models.keyresult import KeyResult
+from app.models.objective import Objective
+
+# Key result fields that feed the objective aggregates
+_TRACKED_FIELDS = ("objective_id", "current_value", "target_value", "is_complete")
+
+# Stored aggregate columns, in the order rows are returned by _sync_chunk
+_AGGREGATE_COLUMNS = ("progress_percentage", "keyresult_count", "completed_keyresult_count")
+
+# Objectives updated per statement, well below SQLite's bound parameter limit
+_SYNC_CHUNK_SIZE = 500
+
+# SQL equivalent of KeyResult.progress_percentage
+keyresult_progress = case(
+    (KeyResult.target_value > 0, case(
+        (KeyResult.current_value / KeyResult.target_value * 100 >= 100, 100.0),
+        else_=func.coalesce(KeyResult.current_value, 0) / KeyResult.target_value * 100,
+    )),
+    else_=0.0,
+)
+
+# A key result counts as complete when checked off or at 100% progress
+keyresult_completed = or_(KeyResult.is_complete.is_(True), keyresult_progress >= 100)
+
+
+def sync_objective_progress(
+    connection: Connection,
+    objective_ids: Iterable[int],
+    session: Session | None = None,
+) -> None:
+    """Recompute stored aggregates for the given objectives.
+
+    Each chunk of objectives is updated by one grouped ``UPDATE ... FROM``
+    over their key results, plus one statement resetting objectives that
+    no longer have any.
+
+    Args:
+        connection: Synchronous connection in the current transaction.
+        objective_ids: Objectives whose key results changed.
+        session: Session whose in-memory objectives should be updated to
+            match, so callers never see stale aggregates.
+    """
+    ids = sorted(set(objective_ids))
+    for offset in range(0, len(ids), _SYNC_CHUNK_SIZE):
+        rows = _sync_chunk(connection, ids[offset : offset + _SYNC_CHUNK_SIZE])
+        if session is not None:
+            for objective_id, *values in rows:
+                instance = session.identity_map.get(identity_key(Objective, objective_id))
+                if instance is not None:
+                    for key, value in zip(_AGGREGATE_COLUMNS, values, strict=True):
+                        attributes.set_committed_value(instance, key, value)
+
+
+def _sync_chunk(connection: Connection, ids: list[int]) -> list[Any]:
+    """Update one chunk of objectives, returning (id, *aggregates) rows."""
+    objectives = cast(Table, Objective.__table__)
+    count = func.count()
+    aggregates = (
+        select(
+            KeyResult.objective_id,
+            count.label("keyresult_count"),
+            (func.sum(keyresult_progress) / count).label("progress_percentage"),
+            func.sum(case((keyresult_completed, 1), else_=0)).label("completed_keyresult_count"),
+        )
+        .where(KeyResult.objective_id.in_(ids))
+        .group_by(KeyResult.objective_id)
+        .subquery()
+    )
+    returning = [objectives.c.id, *(objectives.c[name] for name in _AGGREGATE_COLUMNS)]
+    rows = list(
+        connection.execute(
+            update(objectives)
+            .where(objectives.c.id == aggregates.c.objective_id)
+            .values({name: aggregates.c[name] for name in _AGGREGATE_COLUMNS})
+            .returning(*returning)
+        )
+    )
+    # Objectives left without key results are absent from the grouped rows
+    rows += connection.execute(
+        update(objectives)
+        .where(
+            objectives.c.id.in_(ids),
+            ~select(KeyResult.id).where(KeyResult.objective_id == objectives.c.id).exists(),
+        )
+        .values(progress_percentage=0.0, keyresult_count=0, completed_keyresult_count=0)
+        .returning(*returning)
+    )
+    return rows
+
+
+def _changed_objective_ids(keyresult: KeyResult, is_new_or_deleted: bool) -> set[int]:
+    """Collect objectives affected by a pending key result change."""
+    state = inspect(keyresult)
+    if not is_new_or_deleted and not any(
+        state.attrs[field].history.has_changes() for field in _TRACKED_FIELDS
+    ):
+        return set()
+    history = state.attrs.objective_id.history
+    ids = {keyresult.objective_id, *history.deleted}
+    return {i for i in ids if i is not None}
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_after_flush(session: Session, flush_context: Any) -> None:
+    """Refresh objective aggregates for key results written in this flush."""
+    objective_ids: set[int] = set()
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, KeyResult):
+            objective_ids |= _changed_objective_ids(obj, True)
+    for obj in session.dirty:
+        if isinstance(obj, KeyResult):
+            objective_ids |= _changed_objective_ids(obj, False)
+    if objective_ids:
+        sync_objective_progress(session.connection(), objective_ids, session)
+
+
+def ensure_objective_aggregates(connection: Connection) -> None:
+    """Add aggregate columns to databases created before they existed.
+
+    Newly added columns are backfilled from the current key results.
+    """
+    existing = {c["name"] for c in inspect(connection).get_columns("objectives")}
+    added = False
+    for name, ddl in (
+        ("progress_percentage", "FLOAT NOT NULL DEFAULT 0"),
+        ("keyresult_count", "INTEGER NOT NULL DEFAULT 0"),
+        ("completed_keyresult_count", "INTEGER NOT NULL DEFAULT 0"),
+    ):
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE objectives ADD COLUMN {name} {ddl}"))
+            added = True
+
+    tables = (cast(Table, Objective.__table__), cast(Table, KeyResult.__table__))
+    for index in chain.from_iterable(table.indexes for table in tables):
+        index.create(connection, checkfirst=True)
+
+    if added:
+        ids = connection.execute(select(Objective.__table__.c.id)).scalars().all()
+        sync_objective_progress(connection, ids)
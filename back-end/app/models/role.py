@@ -20,19 +20,22 @@ class Role(Base):
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str] = mapped_column(String(100), nullable=False)
 
-    # Many-to-many relationships
+    # Many-to-many relationships. Never loaded implicitly: repositories
+    # attach the loader options each query needs (see load_profiles).
     users: Mapped[list[User]] = relationship(
         "User",
         secondary=user_roles,
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     groups: Mapped[list[Group]] = relationship(
         "Group",
         secondary=group_roles,
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,117 @@
+"""SQLite FTS5 full-text indexes over name/description columns.
+
+Each searchable table gets an external-content FTS5 table named
+``<table>_fts`` that is kept in sync by triggers, so ORM writes, bulk
+statements and raw SQL all update the index.
+"""
+
+from typing import Any
+
+from sqlalchemy import Connection, Table, event, text
+
+from app.models.group import Group
+from app.models.keyresult import KeyResult
+from app.models.kpi import Kpi
+from app.models.objective import Objective
+from app.models.organization import Organization
+from app.models.role import Role
+from app.models.user import User
+
+SEARCH_COLUMNS: tuple[str, ...] = ("name", "description")
+
+SEARCHABLE_TABLES: tuple[Table, ...] = tuple(
+    model.__table__  # type: ignore[misc]
+    for model in (Objective, KeyResult, User, Group, Role, Organization, Kpi)
+)
+
+
+def fts_table_name(table_name: str) -> str:
+    """Get the FTS5 table name for a searchable table."""
+    return f"{table_name}_fts"
+
+
+def fts_query(term: str) -> str:
+    """Convert user input into a safe FTS5 prefix query.
+
+    Each whitespace-separated token is quoted so FTS5 operators in the input
+    are treated as plain text, and marked as a prefix so partial words match.
+
+    Args:
+        term: Raw search input.
+
+    Returns:
+        FTS5 MATCH expression.
+    """
+    tokens = term.split()
+    return " ".join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
+
+def _create_statements(table_name: str) -> list[str]:
+    """Build DDL for the FTS5 table and its sync triggers."""
+    fts = fts_table_name(table_name)
+    cols = ", ".join(SEARCH_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{table_name}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END",
+    ]
+
+
+def create_search_index(connection: Connection, table_name: str) -> None:
+    """Create the FTS5 index for a table if missing and populate it.
+
+    Args:
+        connection: Synchronous connection inside a transaction.
+        table_name: Searchable table name.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    fts = fts_table_name(table_name)
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": fts},
+    ).first()
+    for statement in _create_statements(table_name):
+        connection.execute(text(statement))
+    if not exists:
+        # Index rows that predate the FTS table
+        connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def drop_search_index(connection: Connection, table_name: str) -> None:
+    """Drop the FTS5 index for a table (triggers are dropped with the table)."""
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(text(f"DROP TABLE IF EXISTS {fts_table_name(table_name)}"))
+
+
+def create_search_indexes(connection: Connection) -> None:
+    """Ensure every searchable table has an FTS5 index.
+
+    Needed for databases created before full-text search was added, where
+    the ``after_create`` hooks below never fired.
+    """
+    for table in SEARCHABLE_TABLES:
+        create_search_index(connection, table.name)
+
+
+def _after_create(target: Table, connection: Connection, **kw: Any) -> None:
+    create_search_index(connection, target.name)
+
+
+def _before_drop(target: Table, connection: Connection, **kw: Any) -> None:
+    drop_search_index(connection, target.name)
+
+
+for _table in SEARCHABLE_TABLES:
+    event.listen(_table, "after_create", _after_create)
+    event.listen(_table, "before_drop", _before_drop)
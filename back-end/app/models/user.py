@@ -21,26 +21,30 @@ class User(Base):
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str] = mapped_column(String(100), nullable=False)
 
-    # Many-to-many relationships
+    # Many-to-many relationships. Never loaded implicitly: repositories
+    # attach the loader options each query needs (see load_profiles).
     organizations: Mapped[list[Organization]] = relationship(
         "Organization",
         secondary=user_organizations,
         back_populates="users",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     groups: Mapped[list[Group]] = relationship(
         "Group",
         secondary=user_groups,
         back_populates="users",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     roles: Mapped[list[Role]] = relationship(
         "Role",
         secondary=user_roles,
         back_populates="users",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,14 +1,37 @@
 """Base repository with generic CRUD operations."""
 
-from typing import Any, Generic, TypeVar, cast
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from typing import Any, ClassVar, Generic, TypeVar, cast
 
 from pydantic import BaseModel
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.elements import ColumnClause, SQLCoreOperations
 
-from app.core.exceptions import InvalidFieldError, NotFoundError
+from app.core.counts import count_cache
+from app.core.exceptions import InvalidFieldError, NotFoundError, ValidationError
+from app.core.pagination import CountMode, CursorPosition, decode_cursor, encode_cursor
+from app.core.versions import mark_written
 from app.database import Base
+from app.models.search import SEARCH_COLUMNS, fts_query, fts_table_name
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -25,8 +48,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         allowed_filter_fields: Whitelist of fields allowed for filtering.
         default_order_field: Default field to order by.
         default_order_desc: Whether to order descending by default.
+        searchable: Whether the model has a full-text index for ``search``.
+        load_profiles: Loader options per named load profile. List queries
+            and write results use "list"; single-item reads use "detail";
+            "delete" loads what the ORM cascades through on delete.
+            Relationships not named in the profile are not loaded.
     """
 
+    load_profiles: ClassVar[dict[str, Sequence[ExecutableOption]]] = {}
+
     def __init__(
         self,
         model: type[ModelType],
@@ -36,6 +66,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         allowed_filter_fields: list[str],
         default_order_field: str = "name",
         default_order_desc: bool = False,
+        searchable: bool = False,
     ) -> None:
         self.model = model
         self.db = db
@@ -43,6 +74,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self.allowed_filter_fields = allowed_filter_fields
         self.default_order_field = default_order_field
         self.default_order_desc = default_order_desc
+        self.searchable = searchable
 
     @property
     def _model_name(self) -> str:
@@ -50,9 +82,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return self.model.__name__
 
     @property
-    def _id_column(self) -> InstrumentedAttribute[int]:
+    def _id_column(self) -> ColumnElement[int]:
         """Get the id column for the model."""
-        return cast(InstrumentedAttribute[int], getattr(self.model, "id"))
+        return cast(ColumnElement[int], getattr(self.model, "id"))
 
     def _validate_order_field(self, field: str) -> str:
         """Validate ordering field against whitelist.
@@ -86,6 +118,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         return cast(InstrumentedAttribute[Any], getattr(self.model, field))
 
+    def _resolve_ordering(self, ordering: str | None) -> tuple[str, bool]:
+        """Resolve an ordering string to a field name and direction.
+
+        Args:
+            ordering: Ordering string (e.g., "name" or "-name"), or None for default.
+
+        Returns:
+            Tuple of (field name, descending flag).
+        """
+        if ordering:
+            return self._validate_order_field(ordering), ordering.startswith("-")
+        return self.default_order_field, self.default_order_desc
+
     def _apply_ordering(self, query: Select[tuple[ModelType]], ordering: str | None) -> Select[tuple[ModelType]]:
         """Apply ordering to query.
 
@@ -96,26 +141,131 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Query with ordering applied.
         """
-        if ordering:
-            clean_field = self._validate_order_field(ordering)
-            attr = self._get_model_attr(clean_field)
-            if ordering.startswith("-"):
-                return query.order_by(attr.desc())
-            return query.order_by(attr)
-
-        # Default ordering
-        attr = self._get_model_attr(self.default_order_field)
-        if self.default_order_desc:
+        field, descending = self._resolve_ordering(ordering)
+        attr = self._get_model_attr(field)
+        if descending:
             return query.order_by(attr.desc())
         return query.order_by(attr)
 
+    def _apply_keyset_ordering(
+        self,
+        query: Select[tuple[ModelType]],
+        field: str,
+        descending: bool,
+    ) -> Select[tuple[ModelType]]:
+        """Order by the given field with id as a unique tie-breaker.
+
+        Args:
+            query: Base select query.
+            field: Ordering field name.
+            descending: Whether to scan in descending order.
+
+        Returns:
+            Query with deterministic ordering applied.
+        """
+        columns: list[SQLCoreOperations[Any]] = [self._get_model_attr(field)]
+        if field != "id":
+            columns.append(self._id_column)
+        return query.order_by(*(c.desc() if descending else c for c in columns))
+
+    def _coerce_cursor_value(self, field: str, value: Any) -> Any:
+        """Convert a decoded cursor value back to the column's Python type.
+
+        Args:
+            field: Ordering field name.
+            value: JSON-decoded value from the cursor.
+
+        Returns:
+            Value suitable for binding against the column.
+        """
+        if value is None:
+            return None
+        python_type = self._get_model_attr(field).type.python_type
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+        except (TypeError, ValueError) as exc:
+            raise ValidationError(
+                message="Invalid pagination cursor",
+                field="cursor",
+                value=value,
+            ) from exc
+        return value
+
+    def _keyset_condition(
+        self,
+        field: str,
+        value: Any,
+        last_id: int,
+        descending: bool,
+    ) -> ColumnElement[bool]:
+        """Build the seek predicate for rows strictly after a keyset position.
+
+        SQLite sorts NULLs first in ascending order and last in descending
+        order, so nullable columns need an explicit NULL branch.
+
+        Args:
+            field: Ordering field name.
+            value: Ordering value of the boundary row.
+            last_id: Id of the boundary row.
+            descending: Whether the scan runs in descending order.
+
+        Returns:
+            Boolean SQL expression for the WHERE clause.
+        """
+        id_col = self._id_column
+        if field == "id":
+            return id_col < last_id if descending else id_col > last_id
+
+        attr = self._get_model_attr(field)
+        nullable = bool(getattr(attr.property.columns[0], "nullable", False))
+
+        if value is None:
+            if descending:
+                return and_(attr.is_(None), id_col < last_id)
+            return or_(and_(attr.is_(None), id_col > last_id), attr.is_not(None))
+
+        if descending:
+            condition = tuple_(attr, id_col) < tuple_(value, last_id)
+            return or_(condition, attr.is_(None)) if nullable else condition
+        return tuple_(attr, id_col) > tuple_(value, last_id)
+
+    def _encode_position(
+        self,
+        item: ModelType | Row[Any],
+        field: str,
+        ordering_key: str,
+        backwards: bool,
+    ) -> str:
+        """Encode a cursor pointing at the given row.
+
+        Args:
+            item: Boundary model instance, or row when columns are projected.
+            field: Ordering field name.
+            ordering_key: Ordering string stored in the cursor.
+            backwards: Whether the cursor pages towards the start.
+
+        Returns:
+            Opaque cursor token.
+        """
+        return encode_cursor(
+            CursorPosition(
+                ordering=ordering_key,
+                value=getattr(item, self._get_model_attr(field).key),
+                id=getattr(item, "id"),
+                backwards=backwards,
+            )
+        )
+
     def _apply_text_filter(
         self,
         query: Select[tuple[ModelType]],
-        count_query: Select[tuple[int]],
+        count_query: Select[int],
         field: str,
         value: str,
-    ) -> tuple[Select[tuple[ModelType]], Select[tuple[int]]]:
+    ) -> tuple[Select[tuple[ModelType]], Select[int]]:
         """Apply ilike text filter to both queries.
 
         Args:
@@ -140,10 +290,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def _apply_exact_filter(
         self,
         query: Select[tuple[ModelType]],
-        count_query: Select[tuple[int]],
+        count_query: Select[int],
         field: str,
         value: Any,
-    ) -> tuple[Select[tuple[ModelType]], Select[tuple[int]]]:
+    ) -> tuple[Select[tuple[ModelType]], Select[int]]:
         """Apply exact match filter to both queries.
 
         Args:
@@ -162,9 +312,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def _apply_filters(
         self,
         query: Select[tuple[ModelType]],
-        count_query: Select[tuple[int]],
+        count_query: Select[int],
         filters: dict[str, Any],
-    ) -> tuple[Select[tuple[ModelType]], Select[tuple[int]]]:
+    ) -> tuple[Select[tuple[ModelType]], Select[int]]:
         """Apply multiple filters to both queries.
 
         Args:
@@ -181,21 +331,86 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     query, count_query = self._apply_text_filter(query, count_query, field, value)
         return query, count_query
 
-    def _build_base_queries(self) -> tuple[Select[tuple[ModelType]], Select[tuple[int]]]:
+    def _apply_search(
+        self,
+        query: Select[tuple[ModelType]],
+        count_query: Select[int],
+        term: str,
+    ) -> tuple[Select[tuple[ModelType]], Select[int], ColumnElement[Any] | None]:
+        """Restrict both queries to full-text matches for the search term.
+
+        On SQLite the FTS5 index is joined in and its bm25 score returned for
+        ranking. Other databases fall back to substring matching on the
+        indexed columns and return no rank.
+
+        Args:
+            query: Main select query.
+            count_query: Count query for pagination.
+            term: Raw search input.
+
+        Returns:
+            Tuple of (filtered query, filtered count query, rank column or None).
+
+        Raises:
+            ValidationError: If the model does not support search.
+        """
+        if not self.searchable:
+            raise ValidationError(
+                message=f"Search is not supported for {self._model_name}",
+                field="search",
+                value=term,
+            )
+
+        if self.db.get_bind().dialect.name != "sqlite":
+            condition = or_(
+                *(self._get_model_attr(c).ilike(f"%{term}%") for c in SEARCH_COLUMNS)
+            )
+            return query.where(condition), count_query.where(condition), None
+
+        fts_name = fts_table_name(self.model.__tablename__)
+        fts = table(fts_name, column("rowid"))
+        fts_ref: ColumnClause[Any] = literal_column(fts_name)
+        matches = (
+            select(fts.c.rowid.label("rowid"), func.bm25(fts_ref).label("rank"))
+            .where(fts_ref.op("MATCH")(fts_query(term)))
+            .subquery()
+        )
+        onclause = matches.c.rowid == self._id_column
+        return query.join(matches, onclause), count_query.join(matches, onclause), matches.c.rank
+
+    def _projection(self, columns: Sequence[str], *required: str) -> list[str]:
+        """Add the columns pagination needs to a projection, keeping order."""
+        return list(dict.fromkeys([*columns, "id", *required]))
+
+    def _load_options(self, profile: str) -> Sequence[ExecutableOption]:
+        """Get the loader options for a named load profile."""
+        return self.load_profiles.get(profile, ())
+
+    def _build_base_queries(
+        self, columns: Sequence[str] | None = None
+    ) -> tuple[Select[Any], Select[int]]:
         """Build base select and count queries.
 
+        Args:
+            columns: Attribute names to select as plain rows. When omitted,
+                model instances are loaded with the "list" load profile.
+
         Returns:
             Tuple of (select query, count query).
         """
-        query = select(self.model)
+        if columns:
+            query: Select[Any] = select(*(self._get_model_attr(c) for c in columns))
+        else:
+            query = select(self.model).options(*self._load_options("list"))
         count_query = select(func.count()).select_from(self.model)
         return query, count_query
 
-    async def get_by_id(self, id: int) -> ModelType:
+    async def get_by_id(self, id: int, profile: str = "detail") -> ModelType:
         """Get single item by ID.
 
         Args:
             id: Primary key ID.
+            profile: Load profile naming the relationships to load.
 
         Returns:
             Model instance.
@@ -203,13 +418,39 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             NotFoundError: If item not found.
         """
-        query = select(self.model).where(self._id_column == id)  # type: ignore[arg-type]
+        query = (
+            select(self.model)
+            .options(*self._load_options(profile))
+            .where(self._id_column == id)
+        )
         result = await self.db.execute(query)
         item = result.scalar_one_or_none()
         if not item:
             raise NotFoundError(self._model_name, id)
         return item
 
+    async def _count(self, count_query: Select[int], count: CountMode) -> int | None:
+        """Run or look up the total count according to the count strategy.
+
+        Args:
+            count_query: Filtered count query.
+            count: Count strategy.
+
+        Returns:
+            Total count, or None when counting is disabled.
+        """
+        if count == "none":
+            return None
+        table = self.model.__tablename__
+        if count == "estimate":
+            cached = count_cache.get(table, count_query)
+            if cached is not None:
+                return cached
+        total_count: int = (await self.db.execute(count_query)).scalar_one()
+        if count == "estimate":
+            count_cache.set(table, count_query, total_count)
+        return total_count
+
     async def get_list(
         self,
         *,
@@ -217,7 +458,10 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         page_size: int = 10,
         ordering: str | None = None,
         filters: dict[str, Any] | None = None,
-    ) -> tuple[list[ModelType], int]:
+        count: CountMode = "exact",
+        search: str | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None, bool]:
         """Get paginated list of items.
 
         Args:
@@ -225,30 +469,144 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             page_size: Number of items per page.
             ordering: Ordering string (e.g., "name" or "-name").
             filters: Dictionary of field -> value filters.
+            count: Count strategy. "exact" counts in the page query with a
+                window function, "estimate" serves a cached per-table count,
+                and "none" skips counting.
+            search: Full-text search term. Without an explicit ordering,
+                matches are ranked by relevance.
+            columns: Attribute names to select. Items are then rows with
+                those columns (plus ``id``) instead of model instances.
 
         Returns:
-            Tuple of (list of items, total count).
+            Tuple of (list of items, total count or None, whether more items follow).
         """
-        query, count_query = self._build_base_queries()
+        if columns:
+            columns = self._projection(columns)
+        query, count_query = self._build_base_queries(columns)
 
         # Apply filters
         if filters:
             query, count_query = self._apply_filters(query, count_query, filters)
 
-        # Apply ordering
-        query = self._apply_ordering(query, ordering)
+        rank = None
+        if search and search.strip():
+            query, count_query, rank = self._apply_search(query, count_query, search)
 
-        # Get total count
-        total_count = await self.db.scalar(count_query) or 0
+        # Apply ordering (best matches first when searching)
+        if rank is not None and not ordering:
+            query = query.order_by(rank, self._id_column)
+        else:
+            query = self._apply_ordering(query, ordering)
 
-        # Apply pagination
+        # Apply pagination, fetching one extra row to detect a next page
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_size + 1)
+
+        total_count: int | None
+        if count == "exact":
+            windowed = query.add_columns(func.count().over().label("total_count"))
+            rows = (await self.db.execute(windowed)).all()
+            items = list(rows) if columns else [row[0] for row in rows]
+            if rows:
+                total_count = rows[0].total_count
+            elif offset:
+                # Past the last page: the window saw no rows, so count directly
+                total_count = await self._count(count_query, "exact")
+            else:
+                total_count = 0
+        else:
+            result = await self.db.execute(query)
+            items = list(result.all() if columns else result.scalars().all())
+            total_count = await self._count(count_query, count)
+
+        has_more = len(items) > page_size
+        return items[:page_size], total_count, has_more
+
+    async def get_list_by_cursor(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: int = 10,
+        ordering: str | None = None,
+        filters: dict[str, Any] | None = None,
+        count: CountMode = "exact",
+        search: str | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None, str | None, str | None]:
+        """Get a page of items using keyset (cursor) pagination.
 
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
+        Instead of skipping rows with OFFSET, the query seeks past the last
+        seen (ordering value, id) pair so every page costs the same.
+
+        Args:
+            cursor: Opaque cursor from a previous page, or None for the first page.
+            page_size: Number of items per page.
+            ordering: Ordering string (e.g., "name" or "-name").
+            filters: Dictionary of field -> value filters.
+            count: Count strategy. The seek predicate rules out a window
+                count, so "exact" runs a separate count query.
+            search: Full-text search term. Keyset pages keep the requested
+                ordering, so matches are not ranked by relevance.
+            columns: Attribute names to select. Items are then rows with
+                those columns (plus ``id`` and the ordering column).
+
+        Returns:
+            Tuple of (list of items, total count or None, next cursor, previous cursor).
+
+        Raises:
+            ValidationError: If the cursor is malformed or was issued for a
+                different ordering.
+        """
+        field, descending = self._resolve_ordering(ordering)
+        ordering_key = f"-{field}" if descending else field
+
+        position = decode_cursor(cursor) if cursor else None
+        if position is not None and position.ordering != ordering_key:
+            raise ValidationError(
+                message="Pagination cursor does not match the requested ordering",
+                field="cursor",
+                value=cursor,
+            )
+        backwards = position.backwards if position is not None else False
+        scan_descending = descending != backwards
+
+        if columns:
+            columns = self._projection(columns, self._get_model_attr(field).key)
+        query, count_query = self._build_base_queries(columns)
+
+        # Apply filters
+        if filters:
+            query, count_query = self._apply_filters(query, count_query, filters)
+
+        if search and search.strip():
+            query, count_query, _ = self._apply_search(query, count_query, search)
+
+        # Seek past the cursor position
+        if position is not None:
+            value = self._coerce_cursor_value(field, position.value)
+            query = query.where(self._keyset_condition(field, value, position.id, scan_descending))
+
+        query = self._apply_keyset_ordering(query, field, scan_descending)
+
+        total_count = await self._count(count_query, count)
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(query.limit(page_size + 1))
+        items: list[Any] = list(result.all() if columns else result.scalars().all())
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        if backwards:
+            items.reverse()
+
+        next_cursor: str | None = None
+        previous_cursor: str | None = None
+        if items:
+            if has_more or backwards:
+                next_cursor = self._encode_position(items[-1], field, ordering_key, False)
+            if (has_more and backwards) or (position is not None and not backwards):
+                previous_cursor = self._encode_position(items[0], field, ordering_key, True)
 
-        return items, total_count
+        return items, total_count, next_cursor, previous_cursor
 
     async def create(self, data: CreateSchemaType) -> ModelType:
         """Create new item.
@@ -262,8 +620,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         item = self.model(**data.model_dump())
         self.db.add(item)
         await self.db.commit()
-        await self.db.refresh(item)
-        return item
+        return await self._reload(item)
 
     async def update(self, id: int, data: UpdateSchemaType) -> ModelType:
         """Update existing item.
@@ -278,15 +635,35 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             NotFoundError: If item not found.
         """
-        item = await self.get_by_id(id)
+        item = await self.db.get(self.model, id)
+        if not item:
+            raise NotFoundError(self._model_name, id)
 
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(item, field, value)
 
         await self.db.commit()
-        await self.db.refresh(item)
-        return item
+        return await self._reload(item)
+
+    async def _reload(self, item: ModelType, profile: str = "list") -> ModelType:
+        """Refresh an item from the database with a load profile applied.
+
+        Args:
+            item: Persistent model instance.
+            profile: Load profile naming the relationships to load.
+
+        Returns:
+            The same instance with columns and profile relationships refreshed.
+        """
+        query = (
+            select(self.model)
+            .options(*self._load_options(profile))
+            .where(self._id_column == getattr(item, "id"))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one()
 
     async def delete(self, id: int) -> None:
         """Delete item by ID.
@@ -297,7 +674,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             NotFoundError: If item not found.
         """
-        item = await self.get_by_id(id)
+        item = await self.get_by_id(id, profile="delete")
         await self.db.delete(item)
         await self.db.commit()
 
@@ -310,6 +687,102 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             True if item exists, False otherwise.
         """
-        query = select(func.count()).select_from(self.model).where(self._id_column == id)  # type: ignore[arg-type]
+        query = select(func.count()).select_from(self.model).where(self._id_column == id)
         count = await self.db.scalar(query)
         return bool(count and count > 0)
+
+    async def existing_ids(self, ids: Iterable[int]) -> set[int]:
+        """Return which of the given IDs exist, using one IN query.
+
+        Args:
+            ids: Primary key IDs to look up.
+
+        Returns:
+            The subset of ``ids`` present in the table.
+        """
+        wanted = set(ids)
+        if not wanted:
+            return set()
+        query = select(self._id_column).where(self._id_column.in_(wanted))
+        return set((await self.db.scalars(query)).all())
+
+    async def get_many(self, ids: Sequence[int], profile: str = "list") -> list[ModelType]:
+        """Load items by ID, refreshing any already in the session.
+
+        Args:
+            ids: Primary key IDs.
+            profile: Load profile naming the relationships to load.
+
+        Returns:
+            Items found, in the order of ``ids``.
+        """
+        if not ids:
+            return []
+        query = (
+            select(self.model)
+            .options(*self._load_options(profile))
+            .where(self._id_column.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        items = (await self.db.scalars(query)).all()
+        by_id: dict[int, ModelType] = {getattr(item, "id"): item for item in items}
+        return [by_id[id] for id in ids if id in by_id]
+
+    def _to_row(self, data: BaseModel, *, partial: bool = False) -> dict[str, Any]:
+        """Convert a create or update schema to column values.
+
+        Args:
+            data: Create or update schema.
+            partial: Only include fields that were explicitly set.
+
+        Returns:
+            Dictionary of column name -> value.
+        """
+        return data.model_dump(exclude_unset=partial)
+
+    async def bulk_create(self, items: Sequence[CreateSchemaType]) -> list[int]:
+        """Insert items with a single executemany INSERT.
+
+        Does not commit; the caller commits the batch as one transaction.
+
+        Args:
+            items: Create schemas.
+
+        Returns:
+            New primary keys, in the order of ``items``.
+        """
+        if not items:
+            return []
+        rows = [self._to_row(item) for item in items]
+        statement = insert(self.model).returning(self._id_column, sort_by_parameter_order=True)
+        result = await self.db.execute(statement, rows)
+        ids = list(result.scalars().all())
+        mark_written(self.db, self.model.__tablename__, ids)
+        return ids
+
+    async def bulk_update(self, changes: Sequence[tuple[int, UpdateSchemaType]]) -> None:
+        """Apply partial updates with a single executemany UPDATE by primary key.
+
+        Does not commit. Rows must exist; check with ``existing_ids`` first.
+
+        Args:
+            changes: (id, update schema) pairs; only fields set on each schema are written.
+        """
+        rows = [{"id": id, **self._to_row(data, partial=True)} for id, data in changes]
+        rows = [row for row in rows if len(row) > 1]
+        if rows:
+            await self.db.execute(update(self.model), rows)
+            mark_written(self.db, self.model.__tablename__, (row["id"] for row in rows))
+
+    async def bulk_delete(self, ids: Sequence[int]) -> None:
+        """Delete items with one DELETE ... WHERE id IN statement.
+
+        Does not commit. Dependent rows are removed by the database's
+        ON DELETE actions, not the ORM cascade.
+
+        Args:
+            ids: Primary key IDs.
+        """
+        if ids:
+            await self.db.execute(delete(self.model).where(self._id_column.in_(ids)))
+            mark_written(self.db, self.model.__tablename__, ids)
@@ -1,11 +1,13 @@
 """Choice repository for polls."""
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ValidationError
+from app.core.pagination import CountMode
 from app.models.poll import Choice, Question
 from app.repositories.base import BaseRepository
 from app.schemas.poll import ChoiceCreate, ChoiceUpdate
@@ -56,6 +58,27 @@ class ChoiceRepository(BaseRepository[Choice, ChoiceCreate, ChoiceUpdate]):
         await self._validate_question_exists(data.question_id)
         return await super().create(data)
 
+    def _apply_filters(
+        self,
+        query: Select[tuple[Choice]],
+        count_query: Select[int],
+        filters: dict[str, Any],
+    ) -> tuple[Select[tuple[Choice]], Select[int]]:
+        """Apply text filters plus an exact question_id filter.
+
+        Args:
+            query: Main select query.
+            count_query: Count query for pagination.
+            filters: Dictionary of field -> value filters.
+
+        Returns:
+            Tuple of (filtered query, filtered count query).
+        """
+        question_id = filters.get("question_id")
+        if question_id is not None:
+            query, count_query = self._apply_exact_filter(query, count_query, "question_id", question_id)
+        return super()._apply_filters(query, count_query, filters)
+
     async def get_list(
         self,
         *,
@@ -63,8 +86,11 @@ class ChoiceRepository(BaseRepository[Choice, ChoiceCreate, ChoiceUpdate]):
         page_size: int = 10,
         ordering: str | None = None,
         filters: dict[str, Any] | None = None,
+        count: CountMode = "exact",
+        search: str | None = None,
         question_id: int | None = None,
-    ) -> tuple[list[Choice], int]:
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None, bool]:
         """Get paginated list of choices with optional question filter.
 
         Args:
@@ -72,32 +98,23 @@ class ChoiceRepository(BaseRepository[Choice, ChoiceCreate, ChoiceUpdate]):
             page_size: Number of items per page.
             ordering: Ordering string (e.g., "id" or "-id").
             filters: Dictionary of field -> value filters.
-            question_id: Optional question ID to filter by.
+            count: Count strategy ("exact", "estimate" or "none").
+            search: Full-text search term.
+            question_id: Optional question ID to filter by; one already in
+                ``filters`` is kept when None.
+            columns: Attribute names to select as rows instead of models.
 
         Returns:
-            Tuple of (list of items, total count).
+            Tuple of (list of items, total count or None, whether more items follow).
         """
-        query, count_query = self._build_base_queries()
-
-        # Apply question_id filter if provided
         if question_id is not None:
-            query, count_query = self._apply_exact_filter(query, count_query, "question_id", question_id)
-
-        # Apply text filters
-        if filters:
-            query, count_query = self._apply_filters(query, count_query, filters)
-
-        # Apply ordering
-        query = self._apply_ordering(query, ordering)
-
-        # Get total count
-        total_count = await self.db.scalar(count_query) or 0
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total_count
+            filters = {**(filters or {}), "question_id": question_id}
+        return await super().get_list(
+            page=page,
+            page_size=page_size,
+            ordering=ordering,
+            filters=filters,
+            count=count,
+            search=search,
+            columns=columns,
+        )
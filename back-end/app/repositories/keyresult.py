@@ -1,13 +1,18 @@
 """KeyResult repository with objective relationship handling."""
 
+from collections.abc import Iterable, Sequence
+from typing import Any
 
-from sqlalchemy import Select, func, select
+from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.versions import mark_written
 from app.models.keyresult import KeyResult
 from app.models.objective import Objective
+from app.models.progress import sync_objective_progress
 from app.repositories.base import BaseRepository
 from app.schemas.keyresult import KeyResultCreate, KeyResultUpdate
 
@@ -15,6 +20,12 @@ from app.schemas.keyresult import KeyResultCreate, KeyResultUpdate
 class KeyResultRepository(BaseRepository[KeyResult, KeyResultCreate, KeyResultUpdate]):
     """Repository for KeyResult model with objective validation."""
 
+    # KeyResultResponse shows the objective name
+    load_profiles = {
+        "list": (selectinload(KeyResult.objective),),
+        "detail": (selectinload(KeyResult.objective),),
+    }
+
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(
             model=KeyResult,
@@ -22,36 +33,10 @@ class KeyResultRepository(BaseRepository[KeyResult, KeyResultCreate, KeyResultUp
             allowed_order_fields=["id", "name", "description", "target_value", "current_value"],
             allowed_filter_fields=["name", "description"],
             default_order_field="name",
+            searchable=True,
         )
-
-    def _build_base_queries(self) -> tuple[Select[tuple[KeyResult]], Select[tuple[int]]]:
-        """Build base queries with eager loading for objective."""
-        query = select(KeyResult).options(selectinload(KeyResult.objective))
-        count_query = select(func.count()).select_from(KeyResult)
-        return query, count_query
-
-    async def get_by_id(self, id: int) -> KeyResult:
-        """Get key result by ID with eager-loaded objective.
-
-        Args:
-            id: Primary key ID.
-
-        Returns:
-            KeyResult with objective loaded.
-
-        Raises:
-            NotFoundError: If key result not found.
-        """
-        query = (
-            select(KeyResult)
-            .options(selectinload(KeyResult.objective))
-            .where(KeyResult.id == id)
-        )
-        result = await self.db.execute(query)
-        item = result.scalar_one_or_none()
-        if not item:
-            raise NotFoundError(self._model_name, id)
-        return item
+        # Objectives whose aggregates were recomputed by bulk writes
+        self.touched_objective_ids: set[int] = set()
 
     async def _validate_objective_exists(self, objective_id: int) -> None:
         """Validate that the objective exists.
@@ -97,10 +82,7 @@ class KeyResultRepository(BaseRepository[KeyResult, KeyResultCreate, KeyResultUp
         )
         self.db.add(item)
         await self.db.commit()
-        await self.db.refresh(item)
-
-        # Reload with objective
-        return await self.get_by_id(item.id)
+        return await self._reload(item)
 
     async def update(self, id: int, data: KeyResultUpdate) -> KeyResult:
         """Update key result with field mapping and objective validation.
@@ -116,7 +98,9 @@ class KeyResultRepository(BaseRepository[KeyResult, KeyResultCreate, KeyResultUp
             NotFoundError: If key result not found.
             ValidationError: If new objective not found.
         """
-        item = await self.get_by_id(id)
+        item = await self.db.get(KeyResult, id)
+        if not item:
+            raise NotFoundError(self._model_name, id)
 
         update_data = data.model_dump(exclude_unset=True)
 
@@ -130,7 +114,59 @@ class KeyResultRepository(BaseRepository[KeyResult, KeyResultCreate, KeyResultUp
             setattr(item, field, value)
 
         await self.db.commit()
-        await self.db.refresh(item)
+        return await self._reload(item)
+
+    def _to_row(self, data: BaseModel, *, partial: bool = False) -> dict[str, Any]:
+        """Convert a schema to column values, mapping ``objective`` to ``objective_id``."""
+        row = super()._to_row(data, partial=partial)
+        if "objective" in row:
+            row["objective_id"] = row.pop("objective")
+        return row
+
+    async def objective_ids_for(self, ids: Iterable[int]) -> set[int]:
+        """Return the objectives the given key results belong to.
+
+        Args:
+            ids: Key result IDs.
+
+        Returns:
+            Distinct objective IDs.
+        """
+        wanted = set(ids)
+        if not wanted:
+            return set()
+        query = select(KeyResult.objective_id).where(KeyResult.id.in_(wanted)).distinct()
+        return set((await self.db.scalars(query)).all())
 
-        # Reload with objective
-        return await self.get_by_id(item.id)
+    async def _sync_objectives(self, objective_ids: set[int]) -> None:
+        """Recompute aggregates after a bulk statement.
+
+        Bulk statements bypass the flush hook that normally keeps
+        ``Objective.progress_percentage`` and the key result counts current.
+        """
+        if not objective_ids:
+            return
+        await self.db.run_sync(
+            lambda session: sync_objective_progress(session.connection(), objective_ids, session)
+        )
+        mark_written(self.db, "objectives", objective_ids)
+        self.touched_objective_ids |= objective_ids
+
+    async def bulk_create(self, items: Sequence[KeyResultCreate]) -> list[int]:
+        """Insert key results and refresh their objectives' aggregates."""
+        ids = await super().bulk_create(items)
+        await self._sync_objectives({item.objective for item in items})
+        return ids
+
+    async def bulk_update(self, changes: Sequence[tuple[int, KeyResultUpdate]]) -> None:
+        """Update key results and refresh aggregates of old and new objectives."""
+        affected = await self.objective_ids_for(id for id, _ in changes)
+        affected |= {data.objective for _, data in changes if data.objective is not None}
+        await super().bulk_update(changes)
+        await self._sync_objectives(affected)
+
+    async def bulk_delete(self, ids: Sequence[int]) -> None:
+        """Delete key results and refresh their objectives' aggregates."""
+        affected = await self.objective_ids_for(ids)
+        await super().bulk_delete(ids)
+        await self._sync_objectives(affected)
@@ -17,4 +17,5 @@ class KPIRepository(BaseRepository[Kpi, KpiCreate, KpiUpdate]):
             allowed_order_fields=["id", "name", "description"],
             allowed_filter_fields=["name", "description"],
             default_order_field="name",
+            searchable=True,
         )
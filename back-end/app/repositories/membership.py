@@ -4,9 +4,12 @@ from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.group_hierarchy import group_hierarchy
 from app.models import Group, Objective, Organization, Role, User
+from app.models.assignment import assign_membership, unassign_membership
 from app.models.associations import (
     GroupCascadedObjective,
+    OwnerType,
     group_delegates,
     group_organizations,
     group_roles,
@@ -146,6 +149,7 @@ class MembershipRepository:
 
         stmt = user_groups.insert().values(user_id=user_id, group_id=group_id)
         await self.db.execute(stmt)
+        await self.db.execute(assign_membership(user_id, OwnerType.GROUP, group_id))
         await self.db.commit()
 
     async def remove_user_from_group(self, user_id: int, group_id: int) -> None:
@@ -157,6 +161,7 @@ class MembershipRepository:
         result = await self.db.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundError("Membership", f"user:{user_id}-group:{group_id}")
+        await self.db.execute(unassign_membership(user_id, OwnerType.GROUP, group_id))
         await self.db.commit()
 
     async def get_group_users(self, group_id: int) -> list[User]:
@@ -191,6 +196,7 @@ class MembershipRepository:
 
         stmt = user_roles.insert().values(user_id=user_id, role_id=role_id)
         await self.db.execute(stmt)
+        await self.db.execute(assign_membership(user_id, OwnerType.ROLE, role_id))
         await self.db.commit()
 
     async def remove_role_from_user(self, user_id: int, role_id: int) -> None:
@@ -202,6 +208,7 @@ class MembershipRepository:
         result = await self.db.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundError("Role assignment", f"user:{user_id}-role:{role_id}")
+        await self.db.execute(unassign_membership(user_id, OwnerType.ROLE, role_id))
         await self.db.commit()
 
     async def get_user_roles(self, user_id: int) -> list[Role]:
@@ -389,10 +396,8 @@ class MembershipRepository:
         await self._validate_objective_exists(objective_id)
 
         # Validate parent-child relationship
-        child_query = select(Group).where(Group.id == child_group_id)
-        result = await self.db.execute(child_query)
-        child_group = result.scalar_one()
-        if child_group.parent_id != parent_group_id:
+        await group_hierarchy.ensure_loaded(self.db)
+        if group_hierarchy.parent_of(child_group_id) != parent_group_id:
             raise ValidationError(
                 message="The specified child group is not a child of the parent group",
                 field="child_group_id",
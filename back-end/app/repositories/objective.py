@@ -1,11 +1,15 @@
 """Objective repository with eager loading support."""
 
-from sqlalchemy import Select, func, select
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
-from app.core.exceptions import NotFoundError
+from app.models.keyresult import KeyResult
 from app.models.objective import Objective
+from app.models.outbox import Action, outbox_event
 from app.repositories.base import BaseRepository
 from app.schemas.objective import ObjectiveCreate, ObjectiveUpdate
 
@@ -13,53 +17,62 @@ from app.schemas.objective import ObjectiveCreate, ObjectiveUpdate
 class ObjectiveRepository(BaseRepository[Objective, ObjectiveCreate, ObjectiveUpdate]):
     """Repository for Objective model with eager loading for key results."""
 
+    # Progress is stored on the objective, so list pages and write results
+    # do not need key results
+    load_profiles = {
+        "detail": (selectinload(Objective.keyresults), selectinload(Objective.ownerships)),
+        "delete": (selectinload(Objective.keyresults),),
+    }
+
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(
             model=Objective,
             db=db,
-            allowed_order_fields=["id", "name", "description", "start_date", "end_date"],
+            allowed_order_fields=["id", "name", "description", "start_date", "end_date", "progress"],
             allowed_filter_fields=["name", "description"],
             default_order_field="name",
+            searchable=True,
         )
 
-    def _build_base_queries(self) -> tuple[Select[tuple[Objective]], Select[tuple[int]]]:
-        """Build base queries with eager loading for keyresults.
+    def _get_model_attr(self, field: str) -> InstrumentedAttribute[Any]:
+        """Get model attribute, mapping "progress" to the stored aggregate.
+
+        Args:
+            field: Field name.
 
         Returns:
-            Tuple of (select query with eager loading, count query).
+            SQLAlchemy column attribute.
         """
-        query = select(Objective).options(
-            selectinload(Objective.keyresults),
-            selectinload(Objective.ownerships),
-        )
-        count_query = select(func.count()).select_from(Objective)
-        return query, count_query
-
-    async def get_by_id(self, id: int) -> Objective:
-        """Get objective by ID with eager-loaded relationships.
+        if field == "progress":
+            field = "progress_percentage"
+        return super()._get_model_attr(field)
+
+    def _apply_filters(
+        self,
+        query: Select[tuple[Objective]],
+        count_query: Select[int],
+        filters: dict[str, Any],
+    ) -> tuple[Select[tuple[Objective]], Select[int]]:
+        """Apply text filters plus progress range filters.
 
         Args:
-            id: Primary key ID.
+            query: Main select query.
+            count_query: Count query for pagination.
+            filters: Dictionary of field -> value filters. ``progress_min`` and
+                ``progress_max`` bound the stored progress percentage (inclusive).
 
         Returns:
-            Objective with keyresults loaded.
-
-        Raises:
-            NotFoundError: If objective not found.
+            Tuple of (filtered query, filtered count query).
         """
-        query = (
-            select(Objective)
-            .options(
-                selectinload(Objective.keyresults),
-                selectinload(Objective.ownerships),
-            )
-            .where(Objective.id == id)
-        )
-        result = await self.db.execute(query)
-        item = result.scalar_one_or_none()
-        if not item:
-            raise NotFoundError(self._model_name, id)
-        return item
+        progress_min = filters.get("progress_min")
+        if progress_min is not None:
+            condition = Objective.progress_percentage >= progress_min
+            query, count_query = query.where(condition), count_query.where(condition)
+        progress_max = filters.get("progress_max")
+        if progress_max is not None:
+            condition = Objective.progress_percentage <= progress_max
+            query, count_query = query.where(condition), count_query.where(condition)
+        return super()._apply_filters(query, count_query, filters)
 
     async def get_by_id_with_keyresults(self, id: int) -> Objective:
         """Get objective with eager-loaded key results and ownerships.
@@ -73,59 +86,36 @@ class ObjectiveRepository(BaseRepository[Objective, ObjectiveCreate, ObjectiveUp
         Raises:
             NotFoundError: If objective not found.
         """
-        query = (
-            select(Objective)
-            .options(
-                selectinload(Objective.keyresults),
-                selectinload(Objective.ownerships),
-            )
-            .where(Objective.id == id)
+        return await self.get_by_id(id, profile="detail")
+
+    def _record_bulk_events(self, ids: Sequence[int], action: Action) -> None:
+        """Add outbox events for objectives written by a bulk statement."""
+        self.db.add_all(
+            outbox_event("objective_update", action, {"id": id}, objective_id=id) for id in ids
         )
-        result = await self.db.execute(query)
-        item = result.scalar_one_or_none()
-        if not item:
-            raise NotFoundError(self._model_name, id)
-        return item
 
-    async def create(self, data: ObjectiveCreate) -> Objective:
-        """Create new objective.
+    async def bulk_create(self, items: Sequence[ObjectiveCreate]) -> list[int]:
+        """Insert objectives and record their events."""
+        ids = await super().bulk_create(items)
+        self._record_bulk_events(ids, "created")
+        return ids
 
-        Args:
-            data: ObjectiveCreate schema.
+    async def bulk_update(self, changes: Sequence[tuple[int, ObjectiveUpdate]]) -> None:
+        """Update objectives and record their events."""
+        await super().bulk_update(changes)
+        self._record_bulk_events([id for id, _ in changes], "updated")
 
-        Returns:
-            Created Objective.
-        """
-        item = Objective(
-            name=data.name,
-            description=data.description,
-            start_date=data.start_date,
-            end_date=data.end_date,
-        )
-        self.db.add(item)
-        await self.db.commit()
-        await self.db.commit()
-        return await self.get_by_id(item.id)
+    async def bulk_delete(self, ids: Sequence[int]) -> None:
+        """Delete objectives and their key results.
 
-    async def update(self, id: int, data: ObjectiveUpdate) -> Objective:
-        """Update objective.
+        ``key_results.objective_id`` has no ON DELETE action, so key results
+        are removed first; reactions, schedules and ownerships cascade in
+        the database.
 
         Args:
-            id: Primary key ID.
-            data: ObjectiveUpdate schema.
-
-        Returns:
-            Updated Objective.
-
-        Raises:
-            NotFoundError: If objective not found.
+            ids: Objective IDs.
         """
-        item = await self.get_by_id(id)
-        update_data = data.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(item, field, value)
-
-        await self.db.commit()
-        await self.db.refresh(item)
-        return item
+        if ids:
+            await self.db.execute(delete(KeyResult).where(KeyResult.objective_id.in_(ids)))
+        await super().bulk_delete(ids)
+        self._record_bulk_events(ids, "deleted")
@@ -1,14 +1,31 @@
 """Repository for managing objective ownership."""
 
+from collections.abc import Iterable
 from typing import Literal
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, distinct, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.owner_names import OWNER_MODELS, OwnerKey, owner_names
+from app.core.topics import (
+    group_topic,
+    objective_topic,
+    organization_topic,
+    user_assigned_topic,
+)
+from app.core.versions import mark_written
 from app.models import Group, Objective, Role, User
-from app.models.associations import ObjectiveOwnership, OwnerType, user_groups, user_roles
+from app.models.assignment import UserObjectiveAssignment, assign_ownership, unassign_ownership
+from app.models.associations import (
+    ObjectiveOwnership,
+    OwnerType,
+    group_organizations,
+    user_groups,
+    user_organizations,
+    user_roles,
+)
+from app.models.outbox import outbox_event, owner_topics
 
 
 class OwnershipRepository:
@@ -65,6 +82,7 @@ class OwnershipRepository:
             owner_id=owner_id,
         )
         self.db.add(ownership)
+        await self.db.execute(assign_ownership(objective_id, owner_type_enum, owner_id))
         await self.db.commit()
         await self.db.refresh(ownership)
         return ownership
@@ -97,6 +115,16 @@ class OwnershipRepository:
                 "Ownership",
                 f"objective:{objective_id}-{owner_type}:{owner_id}",
             )
+        await self.db.execute(unassign_ownership(objective_id, owner_type_enum, owner_id))
+        # A bulk delete skips the flush hooks, so record the event and version here
+        mark_written(self.db, "objectives", [objective_id])
+        self.db.add(outbox_event(
+            "ownership_update",
+            "deleted",
+            {"objectiveId": objective_id, "ownerType": owner_type, "ownerId": owner_id},
+            topics=owner_topics(owner_type_enum, owner_id),
+            objective_id=objective_id,
+        ))
         await self.db.commit()
 
     async def get_objective_ownerships(
@@ -117,112 +145,55 @@ class OwnershipRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    async def get_user_objectives(
-        self, user_id: int
-    ) -> tuple[list[Objective], dict[int, list[str]], dict[int, list[str]]]:
-        """Get all objectives assigned to a user (directly, via roles, via groups).
+    async def get_user_assignments(
+        self, user_id: int, offset: int = 0, limit: int | None = None
+    ) -> list[tuple[Objective, OwnerType, int]]:
+        """Get the objectives assigned to a user and how each one reaches them.
+
+        Reads ``user_objective_assignments``, which holds direct, role and
+        group assignments, so this is one range scan of its primary key.
 
         Args:
             user_id: User ID.
+            offset: Objectives to skip, in objective ID order.
+            limit: Most objectives to return; None returns all of them.
 
         Returns:
-            Tuple of:
-                - List of all assigned objectives
-                - Dict mapping objective_id to role names
-                - Dict mapping objective_id to group names
-        """
-        await self._validate_user_exists(user_id)
+            (objective, via type, via id) rows ordered by objective ID; an
+            objective appears once per assignment path.
 
-        # Get user's roles
-        role_query = (
-            select(Role)
-            .join(user_roles, Role.id == user_roles.c.role_id)
-            .where(user_roles.c.user_id == user_id)
-        )
-        role_result = await self.db.execute(role_query)
-        user_role_ids = [r.id for r in role_result.scalars().all()]
-
-        # Get user's groups
-        group_query = (
-            select(Group)
-            .join(user_groups, Group.id == user_groups.c.group_id)
-            .where(user_groups.c.user_id == user_id)
+        Raises:
+            NotFoundError: If the user does not exist.
+        """
+        assignment = UserObjectiveAssignment
+        query = (
+            select(Objective, assignment.via_type, assignment.via_id)
+            .join(assignment, assignment.objective_id == Objective.id)
+            .where(assignment.user_id == user_id)
+            .order_by(assignment.objective_id, assignment.via_type, assignment.via_id)
         )
-        group_result = await self.db.execute(group_query)
-        user_group_ids = [g.id for g in group_result.scalars().all()]
-
-        # Build conditions for objectives
-        conditions = [
-            (ObjectiveOwnership.owner_type == OwnerType.USER)
-            & (ObjectiveOwnership.owner_id == user_id)
-        ]
-
-        if user_role_ids:
-            conditions.append(
-                (ObjectiveOwnership.owner_type == OwnerType.ROLE)
-                & (ObjectiveOwnership.owner_id.in_(user_role_ids))
+        if limit is not None:
+            page = (
+                select(assignment.objective_id)
+                .where(assignment.user_id == user_id)
+                .distinct()
+                .order_by(assignment.objective_id)
+                .offset(offset)
+                .limit(limit)
             )
-
-        if user_group_ids:
-            conditions.append(
-                (ObjectiveOwnership.owner_type == OwnerType.GROUP)
-                & (ObjectiveOwnership.owner_id.in_(user_group_ids))
-            )
-
-        # Get all matching ownerships
-        from sqlalchemy import or_
-
-        ownership_query = select(ObjectiveOwnership).where(or_(*conditions))
-        ownership_result = await self.db.execute(ownership_query)
-        ownerships = list(ownership_result.scalars().all())
-
-        # Collect objective IDs and track assignment source
-        objective_ids = set()
-        role_assignments: dict[int, list[str]] = {}
-        group_assignments: dict[int, list[str]] = {}
-
-        for ownership in ownerships:
-            objective_ids.add(ownership.objective_id)
-            if (
-                ownership.owner_type == OwnerType.ROLE
-                and ownership.owner_id in user_role_ids
-            ):
-                # Get role name
-                role_name_query = select(Role.name).where(
-                    Role.id == ownership.owner_id
-                )
-                role_name = await self.db.scalar(role_name_query)
-                if role_name:
-                    role_assignments.setdefault(ownership.objective_id, []).append(
-                        role_name
-                    )
-            elif (
-                ownership.owner_type == OwnerType.GROUP
-                and ownership.owner_id in user_group_ids
-            ):
-                # Get group name
-                group_name_query = select(Group.name).where(
-                    Group.id == ownership.owner_id
-                )
-                group_name = await self.db.scalar(group_name_query)
-                if group_name:
-                    group_assignments.setdefault(ownership.objective_id, []).append(
-                        group_name
-                    )
-
-        # Get objectives
-        if not objective_ids:
-            return [], {}, {}
-
-        objectives_query = (
-            select(Objective)
-            .options(selectinload(Objective.keyresults))
-            .where(Objective.id.in_(objective_ids))
+            query = query.where(assignment.objective_id.in_(page.scalar_subquery()))
+        result = await self.db.execute(query)
+        rows = [(objective, via_type, via_id) for objective, via_type, via_id in result]
+        if not rows:
+            await self._validate_user_exists(user_id)
+        return rows
+
+    async def count_user_objectives(self, user_id: int) -> int:
+        """Count the distinct objectives assigned to a user."""
+        query = select(func.count(distinct(UserObjectiveAssignment.objective_id))).where(
+            UserObjectiveAssignment.user_id == user_id
         )
-        objectives_result = await self.db.execute(objectives_query)
-        objectives = list(objectives_result.scalars().all())
-
-        return objectives, role_assignments, group_assignments
+        return await self.db.scalar(query) or 0
 
     async def get_owner_name(
         self, owner_type: Literal["user", "role", "group"], owner_id: int
@@ -236,14 +207,8 @@ class OwnershipRepository:
         Returns:
             Owner name or None if not found.
         """
-        model_map = {
-            "user": User,
-            "role": Role,
-            "group": Group,
-        }
-        model = model_map[owner_type]
-        query = select(model.name).where(model.id == owner_id)  # type: ignore[arg-type]
-        return await self.db.scalar(query)
+        key = (OwnerType(owner_type), owner_id)
+        return (await self.resolve_owner_names([key])).get(key)
 
     async def get_owner_names_bulk(
         self, ownerships: list[ObjectiveOwnership]
@@ -256,35 +221,88 @@ class OwnershipRepository:
         Returns:
             Dict mapping (owner_type, owner_id) to owner name.
         """
-        if not ownerships:
-            return {}
-
-        # Group by owner type
-        user_ids = [o.owner_id for o in ownerships if o.owner_type == OwnerType.USER]
-        role_ids = [o.owner_id for o in ownerships if o.owner_type == OwnerType.ROLE]
-        group_ids = [o.owner_id for o in ownerships if o.owner_type == OwnerType.GROUP]
-
-        result: dict[tuple[str, int], str] = {}
-
-        if user_ids:
-            query = select(User.id, User.name).where(User.id.in_(user_ids))
-            users = await self.db.execute(query)
-            for user_id, name in users:
-                result[("user", user_id)] = name
-
-        if role_ids:
-            query = select(Role.id, Role.name).where(Role.id.in_(role_ids))
-            roles = await self.db.execute(query)
-            for role_id, name in roles:
-                result[("role", role_id)] = name
-
-        if group_ids:
-            query = select(Group.id, Group.name).where(Group.id.in_(group_ids))
-            groups = await self.db.execute(query)
-            for group_id, name in groups:
-                result[("group", group_id)] = name
-
-        return result
+        names = await self.resolve_owner_names(
+            (OwnerType(o.owner_type), o.owner_id) for o in ownerships
+        )
+        return {(owner_type.value, id): name for (owner_type, id), name in names.items()}
+
+    async def resolve_owner_names(self, keys: Iterable[OwnerKey]) -> dict[OwnerKey, str]:
+        """Resolve owner names from the directory, loading missing ones per owner type."""
+        names, missing = owner_names.lookup(set(keys))
+        if not missing:
+            return names
+
+        generation = owner_names.generation
+        loaded: dict[OwnerKey, str] = {}
+        for owner_type, model in OWNER_MODELS.items():
+            ids = [id for key_type, id in missing if key_type == owner_type]
+            if ids:
+                query = select(model.id, model.name).where(model.id.in_(ids))
+                for id, name in await self.db.execute(query):
+                    loaded[(owner_type, id)] = name
+        owner_names.fill(loaded, generation)
+        return names | loaded
+
+    async def get_objective_topics(self, objective_ids: Iterable[int]) -> dict[int, set[str]]:
+        """Get the websocket topics that events about each objective go to.
+
+        Resolves owners to their groups, organizations and assigned users
+        with one query per association table, however many objectives.
+
+        Args:
+            objective_ids: Objective IDs.
+
+        Returns:
+            Dict mapping objective_id to topic names.
+        """
+        ids = set(objective_ids)
+        topics: dict[int, set[str]] = {id: {objective_topic(id)} for id in ids}
+        if not ids:
+            return topics
+
+        query = select(
+            ObjectiveOwnership.objective_id, ObjectiveOwnership.owner_type, ObjectiveOwnership.owner_id
+        ).where(ObjectiveOwnership.objective_id.in_(ids))
+        ownerships = (await self.db.execute(query)).all()
+
+        owned_by: dict[tuple[OwnerType, int], set[int]] = {}
+        for objective_id, owner_type, owner_id in ownerships:
+            owned_by.setdefault((owner_type, owner_id), set()).add(objective_id)
+
+        def owner_ids(owner_type: OwnerType) -> set[int]:
+            return {owner_id for kind, owner_id in owned_by if kind == owner_type}
+
+        user_ids, role_ids, group_ids = (
+            owner_ids(OwnerType.USER), owner_ids(OwnerType.ROLE), owner_ids(OwnerType.GROUP)
+        )
+
+        for user_id in user_ids:
+            for objective_id in owned_by[(OwnerType.USER, user_id)]:
+                topics[objective_id].add(user_assigned_topic(user_id))
+        for group_id in group_ids:
+            for objective_id in owned_by[(OwnerType.GROUP, group_id)]:
+                topics[objective_id].add(group_topic(group_id))
+
+        # Users assigned through a role or group, and organizations of owning groups/users
+        related = [
+            (OwnerType.ROLE, role_ids, user_roles.c.role_id, user_roles.c.user_id,
+             user_assigned_topic),
+            (OwnerType.GROUP, group_ids, user_groups.c.group_id, user_groups.c.user_id,
+             user_assigned_topic),
+            (OwnerType.GROUP, group_ids, group_organizations.c.group_id,
+             group_organizations.c.organization_id, organization_topic),
+            (OwnerType.USER, user_ids, user_organizations.c.user_id,
+             user_organizations.c.organization_id, organization_topic),
+        ]
+        for owner_type, owners, owner_column, related_column, topic_name in related:
+            if not owners:
+                continue
+            query = select(owner_column, related_column).where(owner_column.in_(owners))
+            for owner_id, related_id in (await self.db.execute(query)).all():
+                for objective_id in owned_by[(owner_type, owner_id)]:
+                    topics[objective_id].add(topic_name(related_id))
+
+        return topics
 
     # -------------------- Validation Helpers --------------------
 
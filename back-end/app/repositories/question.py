@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.poll import Question
 from app.repositories.base import BaseRepository
@@ -12,6 +13,9 @@ from app.schemas.poll import QuestionCreate, QuestionUpdate
 class QuestionRepository(BaseRepository[Question, QuestionCreate, QuestionUpdate]):
     """Repository for Question model."""
 
+    # Choices are deleted with their question
+    load_profiles = {"delete": (selectinload(Question.choices),)}
+
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(
             model=Question,
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models import KeyResult, User
+from app.models.outbox import outbox_event
 from app.models.reaction import Reaction
 
 
@@ -66,6 +67,15 @@ class ReactionRepository:
         result = await self.db.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundError("Reaction", f"{key_result_id}-{user_id}-{emoji}")
+        # A bulk delete skips the flush hook, so record the event here
+        self.db.add(outbox_event(
+            "reaction_update",
+            "deleted",
+            {"keyResultId": key_result_id},
+            objective_id=select(KeyResult.objective_id)
+            .where(KeyResult.id == key_result_id)
+            .scalar_subquery(),
+        ))
         await self.db.commit()
 
     async def get_reactions_for_key_result(
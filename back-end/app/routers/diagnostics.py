@@ -0,0 +1,58 @@
+"""Diagnostics endpoints for inspecting runtime database and websocket state."""
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.config import settings
+from app.core.outbox import outbox_dispatcher
+from app.core.owner_names import owner_names
+from app.core.response_cache import response_cache
+from app.core.storage import current_storage_settings, maintenance_status, profile_settings
+from app.core.websockets import manager
+from app.database import engine, pool_statistics, read_engine, storage_profile
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get("/pool")
+async def get_pool_statistics() -> dict[str, Any]:
+    """Get reader and writer connection pool usage."""
+    return pool_statistics()
+
+
+@router.get("/storage")
+async def get_storage_settings() -> dict[str, Any]:
+    """Get the configured storage profile and the PRAGMAs actually in effect."""
+    return {
+        "profile": settings.storage_profile,
+        "configured": profile_settings(storage_profile),
+        "writer": await current_storage_settings(engine),
+        "reader": await current_storage_settings(read_engine),
+        "lastAnalyzeAt": maintenance_status.last_analyze_at,
+        "lastOptimizeAt": maintenance_status.last_optimize_at,
+    }
+
+
+@router.get("/websockets")
+async def get_websocket_statistics() -> dict[str, Any]:
+    """Get websocket connection count, queue depths and drop counters."""
+    return manager.statistics()
+
+
+@router.get("/outbox")
+async def get_outbox_statistics() -> dict[str, Any]:
+    """Get outbox dispatcher counters."""
+    return outbox_dispatcher.statistics()
+
+
+@router.get("/response-cache")
+async def get_response_cache_statistics() -> dict[str, Any]:
+    """Get serialized response cache size and hit counters."""
+    return response_cache.statistics()
+
+
+@router.get("/owner-names")
+async def get_owner_name_statistics() -> dict[str, Any]:
+    """Get owner name directory size and hit counters."""
+    return owner_names.statistics()
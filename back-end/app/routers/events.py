@@ -0,0 +1,80 @@
+"""Server-Sent Events feed of the change events sent over websockets."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.core.encoding import EncodedMessage
+from app.core.topics import ALL_TOPICS, is_valid_topic
+from app.core.websockets import Connection, manager
+
+router = APIRouter(tags=["events"])
+
+
+def format_event(message: EncodedMessage) -> str:
+    """Format one event as an SSE frame, using its seq as the event id."""
+    payload = message.encode("json")
+    assert isinstance(payload, str)
+    lines = []
+    seq = message.message.get("seq")
+    if seq is not None:
+        lines.append(f"id: {seq}")
+    lines.append(f"event: {message.message.get('type', 'message')}")
+    lines.append(f"data: {payload}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def event_stream(
+    connection: Connection,
+    heartbeat: float,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """Yield SSE frames from a manager stream until the client goes away.
+
+    A comment line is sent whenever no event arrives for ``heartbeat``
+    seconds, which keeps proxies from timing the connection out.
+    """
+    try:
+        while not connection.closed:
+            try:
+                message = await asyncio.wait_for(connection.queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                if await is_disconnected():
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            connection.queue.task_done()
+            yield format_event(message)
+    finally:
+        manager.disconnect(connection)
+
+
+@router.get("/events")
+async def stream_events(
+    request: Request,
+    topics: str | None = Query(None),
+    since: int | None = Query(None),
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """Stream change events as Server-Sent Events.
+
+    ``topics`` filters events like websocket subscriptions (comma separated,
+    default all). Browsers resume with the ``Last-Event-ID`` header after a
+    reconnect; ``since`` does the same for clients that cannot set it. Both
+    replay missed events or send a ``resync_required`` event.
+    """
+    requested = [t for t in (topics or ALL_TOPICS).split(",") if t and is_valid_topic(t)]
+    resume_from = since
+    if last_event_id is not None and last_event_id.isdigit():
+        resume_from = int(last_event_id)
+
+    await manager.start()
+    connection = manager.open_stream(requested, since=resume_from)
+    return StreamingResponse(
+        event_stream(connection, settings.sse_heartbeat_seconds, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
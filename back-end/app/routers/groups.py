@@ -2,40 +2,74 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
-from app.schemas.group import GroupCreate, GroupResponse, GroupUpdate
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
+from app.routers.utils import conditional_get
+from app.schemas.group import (
+    GroupCreate,
+    GroupDetailResponse,
+    GroupRef,
+    GroupResponse,
+    GroupUpdate,
+)
 from app.services.group import GroupService
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
+# Membership tables joined into group responses; written by Core statements
+_MEMBERSHIP_TABLES = ("user_groups", "group_roles", "group_organizations", "group_delegates")
+
 
 def get_service(db: AsyncSession = Depends(get_db)) -> GroupService:
     """Dependency to get GroupService instance."""
     return GroupService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> GroupService:
+    """Dependency to get GroupService instance on a read-only session."""
+    return GroupService(db)
+
+
 @router.get("/", response_model=None)
 async def list_groups(
     request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: GroupService = Depends(get_service),
-) -> dict[str, Any]:
-    """List all groups with pagination, ordering, and filtering."""
+    search: str | None = Query(None),
+    service: GroupService = Depends(get_read_service),
+) -> dict[str, Any] | Response:
+    """List all groups with pagination, ordering, filtering, and full-text search.
+
+    Answers 304 when ``If-None-Match`` carries the current ETag.
+    """
     filters = {"name": name, "description": description}
-    return await service.get_list(
+    tables = ("groups", "users", "roles", "organizations", *_MEMBERSHIP_TABLES)
+    return await conditional_get(
         request,
-        page=page,
-        page_size=page_size,
-        ordering=ordering,
-        filters=filters,
+        response,
+        [(table, None) for table in tables],
+        lambda: service.get_list(
+            request,
+            page=page,
+            page_size=page_size,
+            ordering=ordering,
+            cursor=cursor,
+            count=count,
+            fields=fields,
+            search=search,
+            filters=filters,
+        ),
     )
 
 
@@ -48,13 +82,49 @@ async def create_group(
     return await service.create(group)
 
 
-@router.get("/{group_id}/", response_model=GroupResponse)
+@router.get("/{group_id}/", response_model=GroupDetailResponse)
 async def get_group(
     group_id: int,
-    service: GroupService = Depends(get_service),
-) -> GroupResponse:
-    """Get a group by ID."""
-    return await service.get_by_id(group_id)
+    request: Request,
+    response: Response,
+    service: GroupService = Depends(get_read_service),
+) -> GroupDetailResponse | Response:
+    """Get a group by ID with its children and delegates.
+
+    Answers 304 when ``If-None-Match`` carries the current ETag.
+    """
+    # Writes to children bump this group through their parent_id; the rest needs links
+    return await conditional_get(
+        request,
+        response,
+        [("groups", group_id), *((table, None) for table in _MEMBERSHIP_TABLES)],
+        lambda: service.get_detail(group_id),
+        lambda group: [
+            *(("groups", parent.id) for parent in (group.parent,) if parent is not None),
+            *(("users", owner.id) for owner in (group.owner,) if owner is not None),
+            *(("users", user.id) for user in (*group.users, *group.delegates)),
+            *(("roles", role.id) for role in group.roles),
+            *(("organizations", organization.id) for organization in group.organizations),
+        ],
+    )
+
+
+@router.get("/{group_id}/ancestors", response_model=list[GroupRef])
+async def get_group_ancestors(
+    group_id: int,
+    service: GroupService = Depends(get_read_service),
+) -> list[GroupRef]:
+    """Get the parent chain of a group, nearest parent first."""
+    return await service.get_ancestors(group_id)
+
+
+@router.get("/{group_id}/descendants", response_model=list[GroupRef])
+async def get_group_descendants(
+    group_id: int,
+    service: GroupService = Depends(get_read_service),
+) -> list[GroupRef]:
+    """Get all groups below a group, breadth first."""
+    return await service.get_descendants(group_id)
 
 
 @router.put("/{group_id}/", response_model=GroupResponse)
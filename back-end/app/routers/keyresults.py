@@ -6,8 +6,15 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
-from app.schemas.keyresult import KeyResultCreate, KeyResultResponse, KeyResultUpdate
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
+from app.schemas.bulk import BulkDeleteRequest, BulkRequest, BulkResponse
+from app.schemas.keyresult import (
+    KeyResultCreate,
+    KeyResultProgressBatch,
+    KeyResultResponse,
+    KeyResultUpdate,
+)
 from app.services.keyresult import KeyResultService
 
 router = APIRouter(prefix="/keyresults", tags=["keyresults"])
@@ -18,23 +25,36 @@ def get_service(db: AsyncSession = Depends(get_db)) -> KeyResultService:
     return KeyResultService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> KeyResultService:
+    """Dependency to get KeyResultService instance on a read-only session."""
+    return KeyResultService(db)
+
+
 @router.get("/", response_model=None)
 async def list_keyresults(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: KeyResultService = Depends(get_service),
+    search: str | None = Query(None),
+    service: KeyResultService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all key results with pagination, ordering, and filtering."""
+    """List all key results with pagination, ordering, filtering, and full-text search."""
     filters = {"name": name, "description": description}
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -48,10 +68,46 @@ async def create_keyresult(
     return await service.create(keyresult)
 
 
+@router.post("/bulk/", response_model=BulkResponse[KeyResultResponse])
+async def bulk_create_keyresults(
+    payload: BulkRequest,
+    service: KeyResultService = Depends(get_service),
+) -> BulkResponse[KeyResultResponse]:
+    """Create many key results in one transaction, reporting each item's outcome."""
+    return await service.bulk_create(payload.items)
+
+
+@router.patch("/bulk/", response_model=BulkResponse[KeyResultResponse])
+async def bulk_update_keyresults(
+    payload: BulkRequest,
+    service: KeyResultService = Depends(get_service),
+) -> BulkResponse[KeyResultResponse]:
+    """Partially update many key results in one transaction; each item carries its id."""
+    return await service.bulk_update(payload.items)
+
+
+@router.delete("/bulk/", response_model=BulkResponse[KeyResultResponse])
+async def bulk_delete_keyresults(
+    payload: BulkDeleteRequest,
+    service: KeyResultService = Depends(get_service),
+) -> BulkResponse[KeyResultResponse]:
+    """Delete many key results in one transaction."""
+    return await service.bulk_delete(payload.ids)
+
+
+@router.post("/progress:batch", response_model=BulkResponse[KeyResultResponse])
+async def apply_keyresult_progress(
+    payload: KeyResultProgressBatch,
+    service: KeyResultService = Depends(get_service),
+) -> BulkResponse[KeyResultResponse]:
+    """Apply many current_value/is_complete readings in one transaction."""
+    return await service.apply_progress(payload.updates)
+
+
 @router.get("/{keyresult_id}/", response_model=KeyResultResponse)
 async def get_keyresult(
     keyresult_id: int,
-    service: KeyResultService = Depends(get_service),
+    service: KeyResultService = Depends(get_read_service),
 ) -> KeyResultResponse:
     """Get a key result by ID."""
     return await service.get_by_id(keyresult_id)
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
 from app.schemas.kpi import KpiCreate, KpiResponse, KpiUpdate
 from app.services.kpi import KPIService
 
@@ -18,23 +19,36 @@ def get_service(db: AsyncSession = Depends(get_db)) -> KPIService:
     return KPIService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> KPIService:
+    """Dependency to get KPIService instance on a read-only session."""
+    return KPIService(db)
+
+
 @router.get("/", response_model=None)
 async def list_kpis(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: KPIService = Depends(get_service),
+    search: str | None = Query(None),
+    service: KPIService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all KPIs with pagination, ordering, and filtering."""
+    """List all KPIs with pagination, ordering, filtering, and full-text search."""
     filters = {"name": name, "description": description}
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -51,7 +65,7 @@ async def create_kpi(
 @router.get("/{kpi_id}/", response_model=KpiResponse)
 async def get_kpi(
     kpi_id: int,
-    service: KPIService = Depends(get_service),
+    service: KPIService = Depends(get_read_service),
 ) -> KpiResponse:
     """Get a KPI by ID."""
     return await service.get_by_id(kpi_id)
@@ -1,9 +1,10 @@
 """Membership router endpoints for managing organizational relationships."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.routers.utils import conditional_get
 from app.schemas.membership import (
     GroupMembersResponse,
     MembershipResponse,
@@ -20,6 +21,11 @@ def get_service(db: AsyncSession = Depends(get_db)) -> MembershipService:
     return MembershipService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> MembershipService:
+    """Dependency to get MembershipService instance on a read-only session."""
+    return MembershipService(db)
+
+
 # -------------------- User-Organization --------------------
 
 
@@ -56,7 +62,7 @@ async def remove_user_from_organization(
 )
 async def get_organization_members(
     organization_id: int,
-    service: MembershipService = Depends(get_service),
+    service: MembershipService = Depends(get_read_service),
 ) -> OrganizationMembersResponse:
     """Get all users and groups in an organization."""
     return await service.get_organization_members(organization_id)
@@ -128,7 +134,7 @@ async def remove_user_from_group(
 )
 async def get_group_members(
     group_id: int,
-    service: MembershipService = Depends(get_service),
+    service: MembershipService = Depends(get_read_service),
 ) -> GroupMembersResponse:
     """Get all users and roles in a group."""
     return await service.get_group_members(group_id)
@@ -170,10 +176,24 @@ async def remove_role_from_user(
 )
 async def get_user_memberships(
     user_id: int,
-    service: MembershipService = Depends(get_service),
-) -> UserMembershipsResponse:
-    """Get all memberships (roles and groups) for a user."""
-    return await service.get_user_memberships(user_id)
+    request: Request,
+    response: Response,
+    service: MembershipService = Depends(get_read_service),
+) -> UserMembershipsResponse | Response:
+    """Get all memberships (roles and groups) for a user.
+
+    Answers 304 when ``If-None-Match`` carries the current ETag.
+    """
+    return await conditional_get(
+        request,
+        response,
+        [("user_roles", None), ("user_groups", None)],
+        lambda: service.get_user_memberships(user_id),
+        lambda memberships: [
+            *(("roles", role.id) for role in memberships.roles),
+            *(("groups", group.id) for group in memberships.groups),
+        ],
+    )
 
 
 # -------------------- Group-Role --------------------
@@ -2,11 +2,14 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
+from app.routers.utils import conditional_get
+from app.schemas.bulk import BulkDeleteRequest, BulkRequest, BulkResponse
 from app.schemas.objective import (
     ObjectiveCreate,
     ObjectiveResponse,
@@ -17,29 +20,52 @@ from app.services.objective import ObjectiveService
 
 router = APIRouter(prefix="/objectives", tags=["objectives"])
 
+# Tables whose names are embedded for each owner type
+_OWNER_TABLES = {"user": "users", "role": "roles", "group": "groups"}
+
 
 def get_service(db: AsyncSession = Depends(get_db)) -> ObjectiveService:
     """Dependency to get ObjectiveService instance."""
     return ObjectiveService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> ObjectiveService:
+    """Dependency to get ObjectiveService instance on a read-only session."""
+    return ObjectiveService(db)
+
+
 @router.get("/", response_model=None)
 async def list_objectives(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: ObjectiveService = Depends(get_service),
+    search: str | None = Query(None),
+    progress_min: float | None = Query(None, ge=0, le=100),
+    progress_max: float | None = Query(None, ge=0, le=100),
+    service: ObjectiveService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all objectives with pagination, ordering, and filtering."""
-    filters = {"name": name, "description": description}
+    """List all objectives with pagination, ordering, filtering, and full-text search."""
+    filters = {
+        "name": name,
+        "description": description,
+        "progress_min": progress_min,
+        "progress_max": progress_max,
+    }
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -53,13 +79,56 @@ async def create_objective(
     return await service.create(objective)
 
 
+@router.post("/bulk/", response_model=BulkResponse[ObjectiveResponse])
+async def bulk_create_objectives(
+    payload: BulkRequest,
+    service: ObjectiveService = Depends(get_service),
+) -> BulkResponse[ObjectiveResponse]:
+    """Create many objectives in one transaction, reporting each item's outcome."""
+    return await service.bulk_create(payload.items)
+
+
+@router.patch("/bulk/", response_model=BulkResponse[ObjectiveResponse])
+async def bulk_update_objectives(
+    payload: BulkRequest,
+    service: ObjectiveService = Depends(get_service),
+) -> BulkResponse[ObjectiveResponse]:
+    """Partially update many objectives in one transaction; each item carries its id."""
+    return await service.bulk_update(payload.items)
+
+
+@router.delete("/bulk/", response_model=BulkResponse[ObjectiveResponse])
+async def bulk_delete_objectives(
+    payload: BulkDeleteRequest,
+    service: ObjectiveService = Depends(get_service),
+) -> BulkResponse[ObjectiveResponse]:
+    """Delete many objectives in one transaction."""
+    return await service.bulk_delete(payload.ids)
+
+
 @router.get("/{objective_id}/", response_model=ObjectiveWithKeyResults)
 async def get_objective(
     objective_id: int,
-    service: ObjectiveService = Depends(get_service),
-) -> ObjectiveWithKeyResults:
-    """Get an objective by ID with its key results."""
-    return await service.get_by_id_with_keyresults(objective_id)
+    request: Request,
+    response: Response,
+    service: ObjectiveService = Depends(get_read_service),
+) -> ObjectiveWithKeyResults | Response:
+    """Get an objective by ID with its key results.
+
+    Answers 304 when ``If-None-Match`` carries the current ETag.
+    """
+    # Key results and ownerships bump the objective; owner names need links
+    return await conditional_get(
+        request,
+        response,
+        [("objectives", objective_id)],
+        lambda: service.get_by_id_with_keyresults(objective_id),
+        lambda objective: [
+            (_OWNER_TABLES[ownership.owner_type], ownership.owner_id)
+            for ownership in objective.ownerships
+        ],
+        cache=True,
+    )
 
 
 @router.put("/{objective_id}/", response_model=ObjectiveResponse)
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
 from app.schemas.organization import OrganizationCreate, OrganizationResponse, OrganizationUpdate
 from app.services.organization import OrganizationService
 
@@ -18,23 +19,36 @@ def get_service(db: AsyncSession = Depends(get_db)) -> OrganizationService:
     return OrganizationService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> OrganizationService:
+    """Dependency to get OrganizationService instance on a read-only session."""
+    return OrganizationService(db)
+
+
 @router.get("/", response_model=None)
 async def list_organizations(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: OrganizationService = Depends(get_service),
+    search: str | None = Query(None),
+    service: OrganizationService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all organizations with pagination, ordering, and filtering."""
+    """List all organizations with pagination, ordering, filtering, and full-text search."""
     filters = {"name": name, "description": description}
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -51,7 +65,7 @@ async def create_organization(
 @router.get("/{organization_id}/", response_model=OrganizationResponse)
 async def get_organization(
     organization_id: int,
-    service: OrganizationService = Depends(get_service),
+    service: OrganizationService = Depends(get_read_service),
 ) -> OrganizationResponse:
     """Get an organization by ID."""
     return await service.get_by_id(organization_id)
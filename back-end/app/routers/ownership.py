@@ -2,10 +2,11 @@
 
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.schemas.ownership import OwnershipCreate, OwnershipResponse, UserAssignedOKRs
 from app.services.ownership import OwnershipService
 
@@ -17,6 +18,11 @@ def get_service(db: AsyncSession = Depends(get_db)) -> OwnershipService:
     return OwnershipService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> OwnershipService:
+    """Dependency to get OwnershipService instance on a read-only session."""
+    return OwnershipService(db)
+
+
 @router.post(
     "/objectives/{objective_id}/owner",
     response_model=OwnershipResponse,
@@ -56,7 +62,7 @@ async def remove_objective_owner(
 )
 async def get_objective_owners(
     objective_id: int,
-    service: OwnershipService = Depends(get_service),
+    service: OwnershipService = Depends(get_read_service),
 ) -> list[OwnershipResponse]:
     """Get all owners of an objective."""
     return await service.get_objective_ownerships(objective_id)
@@ -68,7 +74,10 @@ async def get_objective_owners(
 )
 async def get_user_objectives(
     user_id: int,
-    service: OwnershipService = Depends(get_service),
+    request: Request,
+    page: int | None = Query(None, ge=1),
+    page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    service: OwnershipService = Depends(get_read_service),
 ) -> UserAssignedOKRs:
     """Get all objectives assigned to a user.
 
@@ -76,5 +85,8 @@ async def get_user_objectives(
     - individual: Directly assigned to the user
     - byRole: Assigned via roles the user has
     - byGroup: Assigned via groups the user belongs to
+
+    With ``page``, only that page of objectives (in ID order) is returned,
+    along with the total ``count`` and ``next``/``previous`` links.
     """
-    return await service.get_user_assigned_okrs(user_id)
+    return await service.get_user_assigned_okrs(user_id, request, page, page_size)
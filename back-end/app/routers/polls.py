@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
 from app.schemas.poll import (
     ChoiceCreate,
     ChoiceResponse,
@@ -31,6 +32,16 @@ def get_choice_service(db: AsyncSession = Depends(get_db)) -> ChoiceService:
     return ChoiceService(db)
 
 
+def get_read_question_service(db: AsyncSession = Depends(get_read_db)) -> QuestionService:
+    """Dependency to get QuestionService instance on a read-only session."""
+    return QuestionService(db)
+
+
+def get_read_choice_service(db: AsyncSession = Depends(get_read_db)) -> ChoiceService:
+    """Dependency to get ChoiceService instance on a read-only session."""
+    return ChoiceService(db)
+
+
 # Question endpoints
 
 
@@ -40,7 +51,10 @@ async def list_questions(
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
-    service: QuestionService = Depends(get_question_service),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
+    service: QuestionService = Depends(get_read_question_service),
 ) -> dict[str, Any]:
     """List all questions with pagination and ordering."""
     return await service.get_list(
@@ -48,6 +62,9 @@ async def list_questions(
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
     )
 
 
@@ -63,7 +80,7 @@ async def create_question(
 @router.get("/questions/{question_id}/", response_model=QuestionResponse)
 async def get_question(
     question_id: int,
-    service: QuestionService = Depends(get_question_service),
+    service: QuestionService = Depends(get_read_question_service),
 ) -> QuestionResponse:
     """Get a question by ID."""
     return await service.get_by_id(question_id)
@@ -97,8 +114,11 @@ async def list_choices(
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     question_id: int | None = Query(None),
-    service: ChoiceService = Depends(get_choice_service),
+    service: ChoiceService = Depends(get_read_choice_service),
 ) -> dict[str, Any]:
     """List all choices with pagination, ordering, and optional question filter."""
     return await service.get_list(
@@ -106,6 +126,9 @@ async def list_choices(
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
         question_id=question_id,
     )
 
@@ -122,7 +145,7 @@ async def create_choice(
 @router.get("/choices/{choice_id}/", response_model=ChoiceResponse)
 async def get_choice(
     choice_id: int,
-    service: ChoiceService = Depends(get_choice_service),
+    service: ChoiceService = Depends(get_read_choice_service),
 ) -> ChoiceResponse:
     """Get a choice by ID."""
     return await service.get_by_id(choice_id)
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.reaction import (
     EmojiType,
     KeyResultReactions,
@@ -66,7 +66,7 @@ async def remove_reaction(
 )
 async def get_reactions(
     key_result_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> KeyResultReactions:
     """Get all reactions for a key result with summary by emoji type."""
     service = ReactionService(db)
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.recurring import (
     DueTodayItem,
     RecurringScheduleCreate,
@@ -37,7 +37,7 @@ async def create_recurring_schedule(
 )
 async def get_recurring_schedule(
     key_result_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RecurringScheduleResponse | None:
     """Get the recurring schedule for a key result."""
     service = RecurringService(db)
@@ -77,7 +77,7 @@ async def delete_recurring_schedule(
 )
 async def get_due_today(
     group_id: int | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[DueTodayItem]:
     """Get all recurring items due today."""
     service = RecurringService(db)
@@ -90,7 +90,7 @@ async def get_due_today(
 )
 async def get_group_schedules(
     group_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[RecurringScheduleResponse]:
     """Get all recurring schedules for a group."""
     service = RecurringService(db)
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
 from app.schemas.role import RoleCreate, RoleResponse, RoleUpdate
 from app.services.role import RoleService
 
@@ -18,23 +19,36 @@ def get_service(db: AsyncSession = Depends(get_db)) -> RoleService:
     return RoleService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> RoleService:
+    """Dependency to get RoleService instance on a read-only session."""
+    return RoleService(db)
+
+
 @router.get("/", response_model=None)
 async def list_roles(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: RoleService = Depends(get_service),
+    search: str | None = Query(None),
+    service: RoleService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all roles with pagination, ordering, and filtering."""
+    """List all roles with pagination, ordering, filtering, and full-text search."""
     filters = {"name": name, "description": description}
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -51,7 +65,7 @@ async def create_role(
 @router.get("/{role_id}/", response_model=RoleResponse)
 async def get_role(
     role_id: int,
-    service: RoleService = Depends(get_service),
+    service: RoleService = Depends(get_read_service),
 ) -> RoleResponse:
     """Get a role by ID."""
     return await service.get_by_id(role_id)
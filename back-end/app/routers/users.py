@@ -2,11 +2,13 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
+from app.core.pagination import CountMode
+from app.database import get_db, get_read_db
+from app.routers.utils import conditional_get
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.services.user import UserService
 
@@ -18,23 +20,36 @@ def get_service(db: AsyncSession = Depends(get_db)) -> UserService:
     return UserService(db)
 
 
+def get_read_service(db: AsyncSession = Depends(get_read_db)) -> UserService:
+    """Dependency to get UserService instance on a read-only session."""
+    return UserService(db)
+
+
 @router.get("/", response_model=None)
 async def list_users(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
     ordering: str | None = Query(None),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    fields: str | None = Query(None),
     name: str | None = Query(None),
     description: str | None = Query(None),
-    service: UserService = Depends(get_service),
+    search: str | None = Query(None),
+    service: UserService = Depends(get_read_service),
 ) -> dict[str, Any]:
-    """List all users with pagination, ordering, and filtering."""
+    """List all users with pagination, ordering, filtering, and full-text search."""
     filters = {"name": name, "description": description}
     return await service.get_list(
         request,
         page=page,
         page_size=page_size,
         ordering=ordering,
+        cursor=cursor,
+        count=count,
+        fields=fields,
+        search=search,
         filters=filters,
     )
 
@@ -51,10 +66,26 @@ async def create_user(
 @router.get("/{user_id}/", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    service: UserService = Depends(get_service),
-) -> UserResponse:
-    """Get a user by ID."""
-    return await service.get_by_id(user_id)
+    request: Request,
+    response: Response,
+    service: UserService = Depends(get_read_service),
+) -> UserResponse | Response:
+    """Get a user by ID.
+
+    Answers 304 when ``If-None-Match`` carries the current ETag.
+    """
+    return await conditional_get(
+        request,
+        response,
+        [("users", user_id), ("user_roles", None), ("user_groups", None),
+         ("user_organizations", None)],
+        lambda: service.get_by_id(user_id),
+        lambda user: [
+            *(("roles", role.id) for role in user.roles),
+            *(("groups", group.id) for group in user.groups),
+            *(("organizations", organization.id) for organization in user.organizations),
+        ],
+    )
 
 
 @router.put("/{user_id}/", response_model=UserResponse)
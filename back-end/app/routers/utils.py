@@ -1,26 +1,40 @@
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
 
-from fastapi import Request
+from fastapi import Request, Response
 from pydantic import BaseModel
 
+from app.core.response_cache import response_cache
+from app.core.versions import VersionKey, entity_versions
+
+T = TypeVar("T")
+
 
 def build_pagination_urls(
     request: Request,
     page: int,
     page_size: int,
-    total_count: int,
+    total_count: int | None,
+    has_more: bool | None = None,
 ) -> tuple[str | None, str | None]:
-    """Build next and previous pagination URLs."""
+    """Build next and previous pagination URLs.
+
+    ``has_more`` takes precedence over ``total_count`` when deciding whether
+    a next page exists, so links still work when counting is disabled.
+    """
     base_url = str(request.url).split("?")[0]
 
     # Preserve existing query params except page
     params = dict(request.query_params)
 
-    total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 1
+    if has_more is None:
+        total = total_count or 0
+        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 1
+        has_more = page < total_pages
 
     # Build next URL
     next_url = None
-    if page < total_pages:
+    if has_more:
         params["page"] = str(page + 1)
         params["page_size"] = str(page_size)
         next_url = f"{base_url}?{'&'.join(f'{k}={v}' for k, v in params.items())}"
@@ -35,6 +49,91 @@ def build_pagination_urls(
     return next_url, previous_url
 
 
+def build_cursor_urls(
+    request: Request,
+    next_cursor: str | None,
+    previous_cursor: str | None,
+) -> tuple[str | None, str | None]:
+    """Build next and previous URLs for cursor pagination."""
+    base_url = str(request.url).split("?")[0]
+
+    # Preserve existing query params except page and cursor
+    params = {k: v for k, v in request.query_params.items() if k not in ("page", "cursor")}
+
+    def with_cursor(cursor: str | None) -> str | None:
+        if cursor is None:
+            return None
+        query = {**params, "cursor": cursor}
+        return f"{base_url}?{'&'.join(f'{k}={v}' for k, v in query.items())}"
+
+    return with_cursor(next_cursor), with_cursor(previous_cursor)
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if ``If-None-Match`` matches ``etag``.
+
+    Uses the weak comparison required for GET, so ``W/`` prefixes are ignored.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    wanted = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == wanted:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    keys: Iterable[VersionKey],
+    load: Callable[[], Awaitable[T]],
+    links: Callable[[T], Iterable[VersionKey]] | None = None,
+    *,
+    cache: bool = False,
+) -> T | Response:
+    """Serve a GET with a version ETag, answering 304 before ``load`` runs.
+
+    With ``cache``, the body must be a Pydantic model; it is serialized
+    once and later requests for the same ETag get the cached JSON bytes.
+
+    Args:
+        request: Incoming request; its path names the view.
+        response: Response whose ``ETag`` header is set.
+        keys: Entities and tables (see ``app.core.versions``) the view reads.
+        load: Builds the response body.
+        links: Extra entities embedded in a loaded body, such as named owners.
+        cache: Keep the serialized body in ``response_cache``.
+
+    Returns:
+        The loaded body, or a 304 or cached JSON response.
+    """
+    view = request.url.path
+    keys = tuple(keys)
+    etag = entity_versions.etag(view, *keys)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+    if cache and (content := response_cache.get(view, etag)) is not None:
+        return Response(content, media_type="application/json", headers={"ETag": etag})
+    clock = entity_versions.clock
+    body = await load()
+    if links is not None:
+        entity_versions.link(view, links(body))
+        if entity_versions.clock == clock:
+            # Nothing changed during the load, so the body matches the new links
+            etag = entity_versions.etag(view, *keys)
+    if cache:
+        assert isinstance(body, BaseModel)
+        content = body.model_dump_json(by_alias=True).encode()
+        # An ETag taken before a concurrent write no longer matches later requests
+        response_cache.set(view, etag, content)
+        return Response(content, media_type="application/json", headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return body
+
+
 def serialize_item(item: Any) -> Any:
     """Serialize item, using aliases if it's a Pydantic model."""
     if isinstance(item, BaseModel):
@@ -45,19 +144,37 @@ def serialize_item(item: Any) -> Any:
 def paginate_response(
     request: Request,
     items: list[Any],
-    total_count: int,
+    total_count: int | None,
     page: int,
     page_size: int,
+    *,
+    cursors: tuple[str | None, str | None] | None = None,
+    has_more: bool | None = None,
 ) -> dict[str, Any]:
-    """Build a paginated response matching Django REST Framework format."""
-    next_url, previous_url = build_pagination_urls(request, page, page_size, total_count)
+    """Build a paginated response matching Django REST Framework format.
+
+    When ``cursors`` is given as (next, previous), the links carry opaque
+    ``cursor`` tokens instead of page numbers. When the total count was not
+    computed, ``count`` is null and a ``hasMore`` flag is added.
+    """
+    if cursors is not None:
+        next_url, previous_url = build_cursor_urls(request, *cursors)
+        if has_more is None:
+            has_more = cursors[0] is not None
+    else:
+        next_url, previous_url = build_pagination_urls(
+            request, page, page_size, total_count, has_more
+        )
 
     # Serialize items with aliases
     serialized_items = [serialize_item(item) for item in items]
 
-    return {
+    response: dict[str, Any] = {
         "count": total_count,
         "next": next_url,
         "previous": previous_url,
         "results": serialized_items,
     }
+    if total_count is None:
+        response["hasMore"] = bool(has_more)
+    return response
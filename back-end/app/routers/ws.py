@@ -1,18 +1,93 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import json
+from typing import Any
 
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+
+from app.core.encoding import negotiate
+from app.core.topics import ALL_TOPICS, is_valid_topic
 from app.core.websockets import manager
 
 router = APIRouter(tags=["websockets"])
 
 
+def _parse_topics(value: Any) -> list[str] | None:
+    """Return the topics in a client message, or None if any is invalid."""
+    if not isinstance(value, list) or not all(isinstance(t, str) for t in value):
+        return None
+    if not all(is_valid_topic(topic) for topic in value):
+        return None
+    return value
+
+
+async def _handle_message(websocket: WebSocket, text: str) -> None:
+    """Apply a subscribe/unsubscribe request and acknowledge it.
+
+    Messages look like ``{"action": "subscribe", "topics": ["objective:1"]}``.
+    ``{"action": "pong"}`` answers a server ping and gets no reply.
+    """
+    try:
+        request = json.loads(text)
+    except ValueError:
+        request = None
+    if not isinstance(request, dict):
+        manager.received(websocket)
+        await manager.send(websocket, {"type": "error", "message": "Expected a JSON object"})
+        return
+
+    action = request.get("action")
+    manager.received(websocket, heartbeat=action == "pong")
+    if action == "pong":
+        return
+    topics = _parse_topics(request.get("topics"))
+    if action not in ("subscribe", "unsubscribe") or topics is None:
+        await manager.send(websocket, {
+            "type": "error",
+            "message": "Expected an action of subscribe or unsubscribe and a list of valid topics",
+        })
+        return
+
+    if action == "subscribe":
+        current = manager.subscribe(websocket, topics)
+    else:
+        current = manager.unsubscribe(websocket, topics)
+    await manager.send(websocket, {"type": "subscriptions", "topics": sorted(current)})
+
+
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket) -> None:
-    """WebSocket endpoint for real-time updates."""
-    await manager.connect(websocket)
+async def websocket_endpoint(
+    websocket: WebSocket,
+    topics: str | None = Query(None),
+    since: int | None = Query(None),
+) -> None:
+    """WebSocket endpoint for real-time updates.
+
+    Connections receive every event unless they pass ``?topics=`` (comma
+    separated) or later unsubscribe from ``*``. Offering the ``okr.msgpack``
+    subprotocol switches server messages to MessagePack binary frames.
+
+    Events carry a ``seq`` number; reconnecting with ``?since=<seq>`` replays
+    the events missed in between, or sends ``resync_required`` if they are
+    no longer available.
+
+    The server sends ``{"type": "ping"}`` periodically and closes sockets
+    that do not answer with ``{"action": "pong"}`` in time.
+    """
+    initial = [t for t in (topics or ALL_TOPICS).split(",") if t]
+    subprotocol, encoding = negotiate(websocket.scope.get("subprotocols", []))
+    accepted = await manager.connect(
+        websocket,
+        [t for t in initial if is_valid_topic(t)],
+        subprotocol=subprotocol,
+        encoding=encoding,
+        since=since,
+    )
+    if not accepted:
+        return
     try:
-        while True:
-            # We just iterate to keep connection open
-            # Future: Handle incoming messages if needed
-            await websocket.receive_text()
+        # The manager drops sockets it reaps or disconnects as slow consumers
+        while websocket in manager.active_connections:
+            await _handle_message(websocket, await websocket.receive_text())
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
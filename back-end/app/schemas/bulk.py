@@ -0,0 +1,39 @@
+"""Request and response schemas for bulk create/update/delete endpoints."""
+
+from typing import Any, Generic, Literal, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.schemas.errors import ErrorResponse
+
+T = TypeVar("T")
+
+
+class BulkRequest(BaseModel):
+    """Items to create or update.
+
+    Items are validated one by one so a bad item is reported in its result
+    instead of rejecting the whole batch. Update items carry their ``id``.
+    """
+
+    items: list[dict[str, Any]] = Field(min_length=1)
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: list[int] = Field(min_length=1)
+
+
+class BulkItemResult(BaseModel, Generic[T]):
+    """Outcome for one item, in request order."""
+
+    index: int
+    id: int | None = None
+    status: Literal["created", "updated", "deleted", "failed"]
+    data: T | None = None
+    error: ErrorResponse | None = None
+
+
+class BulkResponse(BaseModel, Generic[T]):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult[T]]
@@ -39,6 +39,20 @@ class KeyResultUpdate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class KeyResultProgressUpdate(BaseModel):
+    """One progress reading pushed by a metrics integration."""
+
+    id: int
+    current_value: float | None = Field(default=None, alias="currentValue")
+    is_complete: bool | None = Field(default=None, alias="isComplete")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class KeyResultProgressBatch(BaseModel):
+    updates: list[KeyResultProgressUpdate] = Field(min_length=1)
+
+
 class KeyResultResponse(BaseModel):
     id: int
     name: str
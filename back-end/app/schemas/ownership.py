@@ -56,5 +56,11 @@ class UserAssignedOKRs(BaseModel):
         serialization_alias="byGroup",
         description="Objectives assigned via groups, keyed by group name",
     )
+    count: int | None = Field(
+        default=None,
+        description="Total assigned objectives; only set for paginated requests",
+    )
+    next: str | None = Field(default=None, description="URL of the next page")
+    previous: str | None = Field(default=None, description="URL of the previous page")
 
     model_config = ConfigDict(populate_by_name=True)
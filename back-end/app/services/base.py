@@ -1,14 +1,22 @@
 """Base service with generic CRUD operations."""
 
-from typing import Any, ClassVar, Generic, TypeVar
+from collections.abc import Sequence
+from typing import Any, ClassVar, Generic, Literal, TypeVar, cast
 
 from fastapi import Request
 from pydantic import BaseModel
+from pydantic import ValidationError as SchemaValidationError
+from sqlalchemy import Row, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.exceptions import AppError, InvalidFieldError, NotFoundError, ValidationError
+from app.core.pagination import CountMode
 from app.database import Base
 from app.repositories.base import BaseRepository
 from app.routers.utils import paginate_response
+from app.schemas.bulk import BulkItemResult, BulkResponse
+from app.schemas.errors import ErrorResponse
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -24,10 +32,18 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
     - response_schema: The Pydantic response schema.
     - _to_response: If custom conversion is needed.
     - _validate_create/_validate_update/_validate_delete: For custom validation.
+    - field_columns: Response keys stored under a different column name.
+    - create_schema/update_schema: Needed by the bulk operations, which
+      validate raw items one at a time.
+    - _validate_bulk_create/_validate_bulk_update/_validate_bulk_delete:
+      Set-based validation for bulk operations.
     """
 
     repository_class: ClassVar[type[BaseRepository[Any, Any, Any]]]
     response_schema: ClassVar[type[BaseModel]]
+    create_schema: ClassVar[type[BaseModel]]
+    update_schema: ClassVar[type[BaseModel]]
+    field_columns: ClassVar[dict[str, str]] = {}
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
@@ -47,6 +63,51 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         """
         return self.response_schema.model_validate(instance)  # type: ignore[return-value]
 
+    def _selectable_fields(self) -> dict[str, str]:
+        """Map response JSON keys that are plain model columns to their attribute names."""
+        column_keys = inspect(self.repository.model).column_attrs.keys()
+        selectable: dict[str, str] = {}
+        for name, info in self.response_schema.model_fields.items():
+            key = info.serialization_alias or name
+            attr = self.field_columns.get(key, name)
+            if attr in column_keys:
+                selectable[key] = attr
+        return selectable
+
+    def _resolve_fields(self, fields: str) -> dict[str, str]:
+        """Parse a ``fields`` parameter into JSON key -> attribute name pairs.
+
+        Args:
+            fields: Comma-separated response keys (e.g. "id,name").
+
+        Returns:
+            Requested keys mapped to the model attributes that hold them.
+
+        Raises:
+            InvalidFieldError: If a key is unknown or not a stored column.
+        """
+        selectable = self._selectable_fields()
+        resolved: dict[str, str] = {}
+        for key in (part.strip() for part in fields.split(",")):
+            if not key:
+                continue
+            if key not in selectable:
+                raise InvalidFieldError(key, list(selectable), operation="selection")
+            resolved[key] = selectable[key]
+        return resolved
+
+    @staticmethod
+    def _row_to_dict(row: Row[Any], field_map: dict[str, str]) -> dict[str, Any]:
+        """Serialize a projected row straight to its response keys."""
+        mapping = row._mapping
+        return {key: mapping[attr] for key, attr in field_map.items()}
+
+    def _serialize_items(self, items: list[Any], field_map: dict[str, str]) -> list[Any]:
+        """Convert list items to responses, or to dicts for a sparse fieldset."""
+        if field_map:
+            return [self._row_to_dict(row, field_map) for row in items]
+        return [self._to_response(item) for item in items]
+
     async def _validate_create(self, data: CreateSchemaType) -> None:
         """Validate data before creation.
 
@@ -110,28 +171,72 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         page_size: int = 10,
         ordering: str | None = None,
         filters: dict[str, Any] | None = None,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+        search: str | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """Get paginated list of items.
 
+        Uses keyset pagination when ``cursor`` is given (an empty string
+        requests the first page); otherwise falls back to page numbers.
+        With ``fields``, only those columns are selected and each item is
+        serialized directly from the row, skipping ORM and schema models.
+
         Args:
             request: FastAPI request for URL building.
             page: Page number (1-indexed).
             page_size: Number of items per page.
             ordering: Ordering string (e.g., "name" or "-name").
             filters: Dictionary of field -> value filters.
+            cursor: Opaque cursor token for keyset pagination.
+            count: Count strategy ("exact", "estimate" or "none").
+            search: Full-text search term.
+            fields: Comma-separated response keys to include (sparse fieldset).
 
         Returns:
             Paginated response dictionary.
         """
-        items, total_count = await self.repository.get_list(
+        field_map = self._resolve_fields(fields) if fields else {}
+        columns = list(field_map.values()) or None
+
+        if cursor is not None:
+            items, total_count, next_cursor, previous_cursor = await self.repository.get_list_by_cursor(
+                cursor=cursor or None,
+                page_size=page_size,
+                ordering=ordering,
+                filters=filters,
+                count=count,
+                search=search,
+                columns=columns,
+            )
+            return paginate_response(
+                request,
+                self._serialize_items(items, field_map),
+                total_count,
+                page,
+                page_size,
+                cursors=(next_cursor, previous_cursor),
+            )
+
+        items, total_count, has_more = await self.repository.get_list(
             page=page,
             page_size=page_size,
             ordering=ordering,
             filters=filters,
+            count=count,
+            search=search,
+            columns=columns,
         )
 
-        response_items = [self._to_response(item) for item in items]
-        return paginate_response(request, response_items, total_count, page, page_size)
+        return paginate_response(
+            request,
+            self._serialize_items(items, field_map),
+            total_count,
+            page,
+            page_size,
+            has_more=has_more,
+        )
 
     async def create(self, data: CreateSchemaType) -> ResponseSchemaType:
         """Create new item.
@@ -179,3 +284,250 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Respons
         """
         await self._validate_delete(id)
         await self.repository.delete(id)
+
+    async def _validate_bulk_create(self, items: list[CreateSchemaType]) -> dict[int, AppError]:
+        """Validate a batch before creation.
+
+        The default runs ``_validate_create`` per item; override with
+        set-based checks (one query for the whole batch) where possible.
+
+        Args:
+            items: Parsed create schemas.
+
+        Returns:
+            Errors keyed by position in ``items``; invalid items are skipped.
+        """
+        errors: dict[int, AppError] = {}
+        for position, data in enumerate(items):
+            try:
+                await self._validate_create(data)
+            except AppError as exc:
+                errors[position] = exc
+        return errors
+
+    async def _validate_bulk_update(
+        self, changes: list[tuple[int, UpdateSchemaType]]
+    ) -> dict[int, AppError]:
+        """Validate a batch of existing items before update.
+
+        Args:
+            changes: (id, update schema) pairs.
+
+        Returns:
+            Errors keyed by position in ``changes``.
+        """
+        errors: dict[int, AppError] = {}
+        for position, (id, data) in enumerate(changes):
+            try:
+                await self._validate_update(id, data)
+            except AppError as exc:
+                errors[position] = exc
+        return errors
+
+    async def _validate_bulk_delete(self, ids: list[int]) -> dict[int, AppError]:
+        """Validate a batch of existing items before deletion.
+
+        Args:
+            ids: Item IDs.
+
+        Returns:
+            Errors keyed by position in ``ids``.
+        """
+        errors: dict[int, AppError] = {}
+        for position, id in enumerate(ids):
+            try:
+                await self._validate_delete(id)
+            except AppError as exc:
+                errors[position] = exc
+        return errors
+
+    async def _after_bulk_write(self) -> None:
+        """Hook run inside the bulk transaction, just before it commits."""
+
+    @staticmethod
+    def _check_batch_size(size: int) -> None:
+        """Reject batches larger than ``Settings.bulk_max_items``."""
+        if size > settings.bulk_max_items:
+            raise ValidationError(
+                message=f"At most {settings.bulk_max_items} items per request",
+                field="items",
+                value=size,
+            )
+
+    @staticmethod
+    def _error_response(exc: AppError | SchemaValidationError) -> ErrorResponse:
+        """Convert an item's error to the standard error format."""
+        if isinstance(exc, SchemaValidationError):
+            return ErrorResponse(
+                error_code="VALIDATION_ERROR",
+                message="Validation failed",
+                details={"errors": exc.errors(include_url=False, include_context=False)},
+            )
+        return ErrorResponse(**exc.to_dict())
+
+    def _bulk_response(
+        self,
+        size: int,
+        status: Literal["created", "updated", "deleted"],
+        written: Sequence[tuple[int, int]],
+        items: Sequence[ModelType],
+        errors: dict[int, tuple[int | None, AppError | SchemaValidationError]],
+    ) -> BulkResponse[Any]:
+        """Assemble per-item results in request order.
+
+        Args:
+            size: Number of items in the request.
+            status: Status reported for written items.
+            written: (request index, id) pairs that were written.
+            items: Reloaded written items (empty for deletes).
+            errors: Request index -> (id if known, error) for failed items.
+        """
+        by_id = {getattr(item, "id"): item for item in items}
+        results: list[BulkItemResult[Any] | None] = [None] * size
+        for index, id in written:
+            instance = by_id.get(id)
+            data = self._to_response(instance) if instance is not None else None
+            results[index] = BulkItemResult(index=index, id=id, status=status, data=data)
+        for index, (failed_id, error) in errors.items():
+            results[index] = BulkItemResult(
+                index=index, id=failed_id, status="failed", error=self._error_response(error)
+            )
+        return BulkResponse(
+            succeeded=len(written),
+            failed=len(errors),
+            results=cast(list[BulkItemResult[Any]], results),
+        )
+
+    async def _commit_bulk(self) -> None:
+        """Commit a bulk write, rolling back the whole batch on failure."""
+        try:
+            await self._after_bulk_write()
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        # Bulk statements bypass the identity map, so loaded objects and
+        # collections in this session may be stale
+        self.db.expire_all()
+
+    async def bulk_create(self, raw_items: list[dict[str, Any]]) -> BulkResponse[Any]:
+        """Create many items in one transaction.
+
+        Items are validated individually; valid items are inserted with a
+        single executemany statement and invalid ones are reported per item.
+
+        Args:
+            raw_items: Item payloads in create schema format.
+
+        Returns:
+            Per-item results in request order.
+
+        Raises:
+            ValidationError: If the batch is too large.
+        """
+        self._check_batch_size(len(raw_items))
+        errors: dict[int, tuple[int | None, AppError | SchemaValidationError]] = {}
+        indexes: list[int] = []
+        parsed: list[CreateSchemaType] = []
+        for index, raw in enumerate(raw_items):
+            try:
+                parsed.append(cast(CreateSchemaType, self.create_schema.model_validate(raw)))
+                indexes.append(index)
+            except SchemaValidationError as exc:
+                errors[index] = (None, exc)
+
+        for position, error in (await self._validate_bulk_create(parsed)).items():
+            errors[indexes[position]] = (None, error)
+        accepted = [(index, data) for index, data in zip(indexes, parsed, strict=True)
+                    if index not in errors]
+
+        ids = await self.repository.bulk_create([data for _, data in accepted])
+        await self._commit_bulk()
+        items = await self.repository.get_many(ids)
+        written = [(index, id) for (index, _), id in zip(accepted, ids, strict=True)]
+        return self._bulk_response(len(raw_items), "created", written, items, errors)
+
+    async def bulk_update(self, raw_items: list[dict[str, Any]]) -> BulkResponse[Any]:
+        """Partially update many items in one transaction.
+
+        Each item carries its ``id`` plus the fields to change. Existence is
+        checked with one query and all rows are written with a single
+        executemany UPDATE.
+
+        Args:
+            raw_items: Item payloads in update schema format, each with ``id``.
+
+        Returns:
+            Per-item results in request order.
+
+        Raises:
+            ValidationError: If the batch is too large.
+        """
+        self._check_batch_size(len(raw_items))
+        errors: dict[int, tuple[int | None, AppError | SchemaValidationError]] = {}
+        indexes: list[int] = []
+        changes: list[tuple[int, UpdateSchemaType]] = []
+        for index, raw in enumerate(raw_items):
+            fields = dict(raw)
+            id = fields.pop("id", None)
+            if not isinstance(id, int) or isinstance(id, bool):
+                errors[index] = (None, ValidationError("Item id is required", field="id", value=id))
+                continue
+            try:
+                data = cast(UpdateSchemaType, self.update_schema.model_validate(fields))
+            except SchemaValidationError as exc:
+                errors[index] = (id, exc)
+                continue
+            indexes.append(index)
+            changes.append((id, data))
+
+        existing = await self.repository.existing_ids(id for id, _ in changes)
+        found = [(index, change) for index, change in zip(indexes, changes, strict=True)
+                 if change[0] in existing]
+        for index, (id, _) in zip(indexes, changes, strict=True):
+            if id not in existing:
+                errors[index] = (id, NotFoundError(self.repository.model.__name__, id))
+
+        validation = await self._validate_bulk_update([change for _, change in found])
+        for position, error in validation.items():
+            index, (id, _) = found[position]
+            errors[index] = (id, error)
+        accepted = [(index, change) for index, change in found if index not in errors]
+
+        await self.repository.bulk_update([change for _, change in accepted])
+        await self._commit_bulk()
+        ids = list(dict.fromkeys(id for _, (id, _) in accepted))
+        items = await self.repository.get_many(ids)
+        written = [(index, id) for index, (id, _) in accepted]
+        return self._bulk_response(len(raw_items), "updated", written, items, errors)
+
+    async def bulk_delete(self, ids: list[int]) -> BulkResponse[Any]:
+        """Delete many items in one transaction.
+
+        Args:
+            ids: Item IDs.
+
+        Returns:
+            Per-item results in request order.
+
+        Raises:
+            ValidationError: If the batch is too large.
+        """
+        self._check_batch_size(len(ids))
+        existing = await self.repository.existing_ids(ids)
+        errors: dict[int, tuple[int | None, AppError | SchemaValidationError]] = {
+            index: (id, NotFoundError(self.repository.model.__name__, id))
+            for index, id in enumerate(ids)
+            if id not in existing
+        }
+        found = [(index, id) for index, id in enumerate(ids) if id in existing]
+
+        validation = await self._validate_bulk_delete([id for _, id in found])
+        for position, error in validation.items():
+            index, id = found[position]
+            errors[index] = (id, error)
+        accepted = [(index, id) for index, id in found if index not in errors]
+
+        await self.repository.bulk_delete(list(dict.fromkeys(id for _, id in accepted)))
+        await self._commit_bulk()
+        return self._bulk_response(len(ids), "deleted", accepted, [], errors)
@@ -1,12 +1,12 @@
 """Choice service for polls."""
 
-from typing import Any, cast
+from typing import Any
 
 from fastapi import Request
 
+from app.core.pagination import CountMode
 from app.models.poll import Choice
 from app.repositories.choice import ChoiceRepository
-from app.routers.utils import paginate_response
 from app.schemas.poll import ChoiceCreate, ChoiceResponse, ChoiceUpdate
 from app.services.base import BaseService
 
@@ -25,7 +25,11 @@ class ChoiceService(BaseService[Choice, ChoiceCreate, ChoiceUpdate, ChoiceRespon
         page_size: int = 10,
         ordering: str | None = None,
         filters: dict[str, Any] | None = None,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+        search: str | None = None,
         question_id: int | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """Get paginated list of choices with optional question filter.
 
@@ -35,19 +39,23 @@ class ChoiceService(BaseService[Choice, ChoiceCreate, ChoiceUpdate, ChoiceRespon
             page_size: Number of items per page.
             ordering: Ordering string (e.g., "id" or "-id").
             filters: Dictionary of field -> value filters.
+            cursor: Opaque cursor token for keyset pagination.
+            count: Count strategy ("exact", "estimate" or "none").
+            search: Full-text search term.
             question_id: Optional question ID to filter by.
+            fields: Comma-separated response keys to include (sparse fieldset).
 
         Returns:
             Paginated response dictionary.
         """
-        repo = cast(ChoiceRepository, self.repository)
-        items, total_count = await repo.get_list(
+        return await super().get_list(
+            request,
             page=page,
             page_size=page_size,
             ordering=ordering,
-            filters=filters,
-            question_id=question_id,
+            filters={**(filters or {}), "question_id": question_id},
+            cursor=cursor,
+            count=count,
+            search=search,
+            fields=fields,
         )
-
-        response_items = [self._to_response(item) for item in items]
-        return paginate_response(request, response_items, total_count, page, page_size)
@@ -1,8 +1,12 @@
 """Group service."""
 
+from sqlalchemy import select
+
+from app.core.exceptions import NotFoundError, ValidationError
+from app.core.group_hierarchy import group_hierarchy
 from app.models.group import Group
 from app.repositories.group import GroupRepository
-from app.schemas.group import GroupCreate, GroupResponse, GroupUpdate
+from app.schemas.group import GroupCreate, GroupDetailResponse, GroupRef, GroupResponse, GroupUpdate
 from app.services.base import BaseService
 
 
@@ -11,3 +15,86 @@ class GroupService(BaseService[Group, GroupCreate, GroupUpdate, GroupResponse]):
 
     repository_class = GroupRepository
     response_schema = GroupResponse
+
+    async def get_detail(self, id: int) -> GroupDetailResponse:
+        """Get a group with its children and delegates.
+
+        Args:
+            id: Group ID.
+
+        Returns:
+            Group detail response.
+
+        Raises:
+            NotFoundError: If group not found.
+        """
+        instance = await self.repository.get_by_id(id, profile="detail")
+        return GroupDetailResponse.model_validate(instance)
+
+    async def get_ancestors(self, id: int) -> list[GroupRef]:
+        """Get the chain of parent groups above a group, nearest first.
+
+        Raises:
+            NotFoundError: If group not found.
+        """
+        await self._require_group(id)
+        return await self._refs(group_hierarchy.ancestors(id))
+
+    async def get_descendants(self, id: int) -> list[GroupRef]:
+        """Get every group below a group, breadth first.
+
+        Raises:
+            NotFoundError: If group not found.
+        """
+        await self._require_group(id)
+        return await self._refs(group_hierarchy.descendants(id))
+
+    async def _require_group(self, id: int) -> None:
+        await group_hierarchy.ensure_loaded(self.db)
+        if id not in group_hierarchy:
+            raise NotFoundError("Group", id)
+
+    async def _refs(self, ids: list[int]) -> list[GroupRef]:
+        """Load names for group IDs with one query, keeping their order."""
+        if not ids:
+            return []
+        rows = await self.db.execute(select(Group.id, Group.name).where(Group.id.in_(ids)))
+        names = dict(rows.tuples().all())
+        return [GroupRef(id=id, name=names[id]) for id in ids if id in names]
+
+    async def _validate_parent(self, id: int | None, parent_id: int | None) -> None:
+        """Check a new parent exists and would not make the group its own ancestor.
+
+        Walks the stored tree with a recursive query in the writing
+        transaction; the cached index may not have seen another worker's
+        move yet.
+        """
+        if parent_id is None:
+            return
+        chain = (
+            select(Group.id, Group.parent_id)
+            .where(Group.id == parent_id)
+            .cte("ancestors", recursive=True)
+        )
+        chain = chain.union(
+            select(Group.id, Group.parent_id).join(chain, Group.id == chain.c.parent_id)
+        )
+        ancestors = set((await self.db.scalars(select(chain.c.id))).all())
+        if not ancestors:
+            raise ValidationError(
+                message="Parent group not found", field="parent_id", value=parent_id
+            )
+        if id is not None and id in ancestors:
+            raise ValidationError(
+                message="A group cannot be moved below itself or one of its descendants",
+                field="parent_id",
+                value=parent_id,
+            )
+
+    async def _validate_create(self, data: GroupCreate) -> None:
+        """Check the parent group exists."""
+        await self._validate_parent(None, data.parent_id)
+
+    async def _validate_update(self, id: int, data: GroupUpdate) -> None:
+        """Reject parents that do not exist or would create a cycle."""
+        await self._validate_parent(id, data.parent_id)
@@ -1,13 +1,24 @@
 """KeyResult service with custom response conversion and auto-complete logic."""
 
+from collections.abc import Iterable
+from typing import Any, cast
+
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
+from app.core.exceptions import AppError, ValidationError
 from app.models.keyresult import KeyResult
 from app.models.objective import Objective
-from app.core.websockets import manager
+from app.models.outbox import outbox_event
+from app.models.progress import keyresult_progress
 from app.repositories.keyresult import KeyResultRepository
-from app.schemas.keyresult import KeyResultCreate, KeyResultResponse, KeyResultUpdate
+from app.repositories.objective import ObjectiveRepository
+from app.schemas.bulk import BulkResponse
+from app.schemas.keyresult import (
+    KeyResultCreate,
+    KeyResultProgressUpdate,
+    KeyResultResponse,
+    KeyResultUpdate,
+)
 from app.services.base import BaseService
 
 
@@ -16,6 +27,9 @@ class KeyResultService(BaseService[KeyResult, KeyResultCreate, KeyResultUpdate,
 
     repository_class = KeyResultRepository
     response_schema = KeyResultResponse
+    create_schema = KeyResultCreate
+    update_schema = KeyResultUpdate
+    field_columns = {"objective": "objective_id"}
 
     def _to_response(self, instance: KeyResult) -> KeyResultResponse:
         """Convert KeyResult to response with objective info.
@@ -36,7 +50,8 @@ class KeyResultService(BaseService[KeyResult, KeyResultCreate, KeyResultUpdate,
 
         If the updated key result results in all key results being complete
         (either via is_complete checkbox or 100% progress), auto-complete
-        the parent objective.
+        the parent objective. The ``keyresult_update`` event is written to
+        the outbox with the change, not broadcast here.
 
         Args:
             id: Primary key ID.
@@ -51,51 +66,123 @@ class KeyResultService(BaseService[KeyResult, KeyResultCreate, KeyResultUpdate,
         # Check if we need to auto-complete the objective
         await self._check_and_auto_complete_objective(instance.objective_id)
 
-        # Broadcast update
-        await manager.broadcast({
-            "type": "keyresult_update",
-            "data": {
-                "id": instance.id,
-                "objectiveId": instance.objective_id,
-                "progress": instance.progress_percentage
-            }
-        })
-
         return self._to_response(instance)
 
-    async def _check_and_auto_complete_objective(self, objective_id: int) -> None:
-        """Check if all key results are complete and auto-complete objective.
+    async def _validate_objectives(self, objective_ids: list[int | None]) -> dict[int, AppError]:
+        """Check referenced objectives exist with one IN query.
+
+        Args:
+            objective_ids: Objective ID per item, or None if not being set.
+
+        Returns:
+            Errors keyed by item position.
+        """
+        existing = await ObjectiveRepository(self.db).existing_ids(
+            id for id in objective_ids if id is not None
+        )
+        return {
+            position: ValidationError(message="Objective not found", field="objective", value=id)
+            for position, id in enumerate(objective_ids)
+            if id is not None and id not in existing
+        }
+
+    async def _validate_bulk_create(self, items: list[KeyResultCreate]) -> dict[int, AppError]:
+        """Validate objective references for a batch of new key results."""
+        return await self._validate_objectives([item.objective for item in items])
+
+    async def _validate_bulk_update(
+        self, changes: list[tuple[int, KeyResultUpdate]]
+    ) -> dict[int, AppError]:
+        """Validate objective references for a batch of key result updates."""
+        return await self._validate_objectives([data.objective for _, data in changes])
+
+    async def _after_bulk_write(self) -> None:
+        """Auto-complete each affected objective once and record its progress event.
+
+        Bulk statements skip the outbox flush hook, so one
+        ``objective_progress`` event per objective is added here, carrying
+        the objective's aggregates and the progress of all its key results.
+        """
+        repo = cast(KeyResultRepository, self.repository)
+        objective_ids = repo.touched_objective_ids
+        await self._auto_complete_objectives(objective_ids)
+        if not objective_ids:
+            return
+
+        objectives = await self.db.execute(
+            select(Objective.id, Objective.progress_percentage, Objective.is_complete)
+            .where(Objective.id.in_(objective_ids))
+        )
+        keyresults: dict[int, list[dict[str, Any]]] = {}
+        rows = await self.db.execute(
+            select(KeyResult.id, KeyResult.objective_id, keyresult_progress)
+            .where(KeyResult.objective_id.in_(objective_ids))
+            .order_by(KeyResult.id)
+        )
+        for id, objective_id, progress in rows:
+            keyresults.setdefault(objective_id, []).append({"id": id, "progress": progress})
+
+        self.db.add_all(
+            outbox_event("objective_progress", "updated", {
+                "objectiveId": objective_id,
+                "progress": progress,
+                "isComplete": is_complete,
+                "keyresults": keyresults.get(objective_id, []),
+            }, objective_id=objective_id)
+            for objective_id, progress, is_complete in objectives
+        )
+
+    async def apply_progress(self, updates: list[KeyResultProgressUpdate]) -> BulkResponse[Any]:
+        """Apply many progress readings in one transaction.
+
+        Auto-complete runs once per affected objective and one
+        ``objective_progress`` event is recorded per objective, instead of
+        a commit and a message per key result.
+
+        Args:
+            updates: Progress readings; unknown key result IDs are reported
+                as failed items.
+
+        Returns:
+            Per-item results in request order.
+        """
+        return await self.bulk_update([update.model_dump(exclude_unset=True) for update in updates])
+
+    async def _auto_complete_objectives(self, objective_ids: Iterable[int]) -> bool:
+        """Sync objectives' is_complete with their key results, without committing.
 
         A key result is considered complete if:
         - is_complete is True, OR
         - progress_percentage >= 100
 
+        Objectives without key results are left unchanged.
+
         Args:
-            objective_id: Objective ID to check.
-        """
-        # Get objective with all key results
-        query = (
-            select(Objective)
-            .options(selectinload(Objective.keyresults))
-            .where(Objective.id == objective_id)
-        )
-        result = await self.db.execute(query)
-        objective = result.scalar_one_or_none()
+            objective_ids: Objective IDs to check.
 
-        if not objective or not objective.keyresults:
-            return
+        Returns:
+            True if any objective changed.
+        """
+        ids = set(objective_ids)
+        if not ids:
+            return False
+        objectives = await self.db.scalars(select(Objective).where(Objective.id.in_(ids)))
+        changed = False
+        for objective in objectives:
+            if not objective.keyresult_count:
+                continue
+            # Aggregates are kept current on every write, so no key results need loading
+            all_complete = objective.completed_keyresult_count == objective.keyresult_count
+            if objective.is_complete != all_complete:
+                objective.is_complete = all_complete
+                changed = True
+        return changed
 
-        # Check if all key results are complete
-        all_complete = all(
-            kr.is_complete or kr.progress_percentage >= 100
-            for kr in objective.keyresults
-        )
+    async def _check_and_auto_complete_objective(self, objective_id: int) -> None:
+        """Check if all key results are complete and auto-complete objective.
 
-        # Update objective if all complete and not already marked complete
-        if all_complete and not objective.is_complete:
-            objective.is_complete = True
-            await self.db.commit()
-        elif not all_complete and objective.is_complete:
-            # If some key results are no longer complete, unmark objective
-            objective.is_complete = False
+        Args:
+            objective_id: Objective ID to check.
+        """
+        if await self._auto_complete_objectives([objective_id]):
             await self.db.commit()
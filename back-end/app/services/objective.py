@@ -19,6 +19,8 @@ class ObjectiveService(BaseService[Objective, ObjectiveCreate, ObjectiveUpdate,
 
     repository_class = ObjectiveRepository
     response_schema = ObjectiveResponse
+    create_schema = ObjectiveCreate
+    update_schema = ObjectiveUpdate
 
     async def get_by_id_with_keyresults(self, id: int) -> ObjectiveWithKeyResults:
         """Get objective with eager-loaded key results and resolved ownerships.
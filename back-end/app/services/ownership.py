@@ -2,9 +2,13 @@
 
 from typing import Literal
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.models.associations import OwnerType
 from app.repositories.ownership import OwnershipRepository
+from app.routers.utils import build_pagination_urls
 from app.schemas.objective import ObjectiveResponse
 from app.schemas.ownership import OwnershipResponse, UserAssignedOKRs
 
@@ -71,50 +75,58 @@ class OwnershipService:
             for o in ownerships
         ]
 
-    async def get_user_assigned_okrs(self, user_id: int) -> UserAssignedOKRs:
+    async def get_user_assigned_okrs(
+        self,
+        user_id: int,
+        request: Request | None = None,
+        page: int | None = None,
+        page_size: int = settings.default_page_size,
+    ) -> UserAssignedOKRs:
         """Get all objectives assigned to a user, grouped by assignment type.
 
         Args:
             user_id: User ID.
+            request: Incoming request, used to build pagination links.
+            page: 1-based page of objectives, in ID order; None returns all.
+            page_size: Objectives per page.
 
         Returns:
             UserAssignedOKRs with objectives grouped by individual, role, and group.
         """
-        objectives, role_assignments, group_assignments = (
-            await self.repository.get_user_objectives(user_id)
+        if page is None:
+            rows = await self.repository.get_user_assignments(user_id)
+        else:
+            rows = await self.repository.get_user_assignments(
+                user_id, (page - 1) * page_size, page_size
+            )
+        names = await self.repository.resolve_owner_names(
+            (via_type, via_id) for _, via_type, via_id in rows if via_type != OwnerType.USER
         )
 
-        # Build response
         individual: list[ObjectiveResponse] = []
-        by_role: dict[str, list[ObjectiveResponse]] = {}
-        by_group: dict[str, list[ObjectiveResponse]] = {}
-
-        for obj in objectives:
-            obj_response = ObjectiveResponse.model_validate(obj)
-
-            # Check if directly assigned to user
-            from app.models.associations import OwnerType
-
-            direct_assignment = any(
-                o.owner_type == OwnerType.USER and o.owner_id == user_id
-                for o in obj.ownerships
-            )
-
-            if direct_assignment:
-                individual.append(obj_response)
-
-            # Check role assignments
-            if obj.id in role_assignments:
-                for role_name in role_assignments[obj.id]:
-                    by_role.setdefault(role_name, []).append(obj_response)
-
-            # Check group assignments
-            if obj.id in group_assignments:
-                for group_name in group_assignments[obj.id]:
-                    by_group.setdefault(group_name, []).append(obj_response)
-
-        return UserAssignedOKRs(
+        by_owner: dict[OwnerType, dict[str, list[ObjectiveResponse]]] = {
+            OwnerType.ROLE: {},
+            OwnerType.GROUP: {},
+        }
+        responses: dict[int, ObjectiveResponse] = {}
+        for objective, via_type, via_id in rows:
+            response = responses.get(objective.id)
+            if response is None:
+                response = responses[objective.id] = ObjectiveResponse.model_validate(objective)
+            if via_type == OwnerType.USER:
+                individual.append(response)
+            elif (name := names.get((via_type, via_id))) is not None:
+                by_owner[via_type].setdefault(name, []).append(response)
+
+        result = UserAssignedOKRs(
             individual=individual,
-            by_role=by_role,
-            by_group=by_group,
+            by_role=by_owner[OwnerType.ROLE],
+            by_group=by_owner[OwnerType.GROUP],
         )
+        if page is not None:
+            result.count = await self.repository.count_user_objectives(user_id)
+            if request is not None:
+                result.next, result.previous = build_pagination_urls(
+                    request, page, page_size, result.count
+                )
+        return result
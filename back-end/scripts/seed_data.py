@@ -17,6 +17,7 @@ from app.models import (
     Role,
     User,
 )
+from app.models.assignment import rebuild_assignments
 from app.models.associations import (
     group_organizations,
     group_roles,
@@ -659,6 +660,10 @@ async def seed_database() -> None:
         db.add_all([recurring1, recurring2, recurring3, recurring4, recurring5])
         print("Created 5 recurring schedules")
 
+        # Memberships and ownerships above bypass the repositories that maintain these
+        await db.run_sync(lambda session: rebuild_assignments(session.connection()))
+        print("Built user objective assignments")
+
         await db.commit()
         print("\n" + "=" * 50)
         print("Database seeding completed successfully!")
@@ -0,0 +1,412 @@
+"""Load test for websocket fan-out.
+
+Opens N websocket clients against a server, drives key result updates
+through the REST API at a fixed rate and reports end-to-end delivery
+latency percentiles, lost messages and server CPU/memory as JSON.
+
+Each update sets a key result's ``current_value`` to a unique counter
+against a huge target, so every ``keyresult_update`` event identifies the
+update that produced it. An update a client never sees counts as
+superseded if a later update of the same key result reached it (the
+server coalesces bursts to the latest state) and as lost otherwise.
+
+Usage (from back-end/):
+
+    # Start a throwaway server on a temporary database and test it
+    uv run python -m scripts.ws_load_test --spawn-server --clients 1000 --rate 50
+
+    # Test a running server; pass its pid to sample CPU and memory
+    uv run python -m scripts.ws_load_test --url http://127.0.0.1:8000 --server-pid 1234
+
+Thousands of clients need a higher open file limit (``ulimit -n``).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+
+try:
+    import psutil
+except ImportError:  # optional; falls back to /proc on Linux
+    psutil = None
+
+# Target value of the test key results; progress is current / target * 100
+TARGET_VALUE = 1_000_000_000
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class ClientStats:
+    """What one simulated client received."""
+
+    connected: bool = False
+    closed_by_server: bool = False
+    # (key result id, update counter) -> receive time
+    received: dict[tuple[int, int], float] = field(default_factory=dict)
+    seqs: list[int] = field(default_factory=list)
+    resyncs: int = 0
+
+
+def percentiles(values: list[float]) -> dict[str, float | None]:
+    """Summarize latencies in milliseconds with nearest-rank percentiles."""
+    if not values:
+        return {"count": 0, "mean": None, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": round(rank(50), 3),
+        "p90": round(rank(90), 3),
+        "p99": round(rank(99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class ProcessSampler:
+    """Samples a process's CPU usage and resident memory."""
+
+    def __init__(self, pid: int, interval: float) -> None:
+        self.pid = pid
+        self.interval = interval
+        self.cpu_percent: list[float] = []
+        self.rss_mb: list[float] = []
+        self._process = psutil.Process(pid) if psutil is not None else None
+
+    def _cpu_seconds(self) -> float:
+        if self._process is not None:
+            times = self._process.cpu_times()
+            return float(times.user + times.system)
+        with open(f"/proc/{self.pid}/stat") as f:
+            # Fields after the parenthesised command name; utime and stime are 14 and 15
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def _rss_mb(self) -> float:
+        if self._process is not None:
+            return float(self._process.memory_info().rss) / 2**20
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return 0.0
+
+    async def run(self) -> None:
+        last_cpu, last_time = self._cpu_seconds(), time.monotonic()
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, now = self._cpu_seconds(), time.monotonic()
+            self.cpu_percent.append((cpu - last_cpu) / (now - last_time) * 100)
+            self.rss_mb.append(self._rss_mb())
+            last_cpu, last_time = cpu, now
+
+    def summary(self) -> dict[str, Any]:
+        def stats(values: list[float]) -> dict[str, float | None]:
+            if not values:
+                return {"mean": None, "max": None}
+            return {"mean": round(sum(values) / len(values), 2), "max": round(max(values), 2)}
+
+        return {"pid": self.pid, "cpuPercent": stats(self.cpu_percent), "rssMb": stats(self.rss_mb)}
+
+
+def _events(message: dict[str, Any]) -> list[dict[str, Any]]:
+    """Unwrap coalesced batches."""
+    if message.get("type") == "batch":
+        return list(message.get("events", []))
+    return [message]
+
+
+async def run_client(ws_url: str, stats: ClientStats, ready: asyncio.Semaphore) -> None:
+    """Receive events until cancelled, answering heartbeats."""
+    try:
+        async with connect(ws_url, max_queue=None, open_timeout=30) as ws:
+            stats.connected = True
+            ready.release()
+            await _receive(ws, stats)
+            # Iteration only ends when the server closes the socket cleanly
+            stats.closed_by_server = True
+    except ConnectionClosed:
+        stats.closed_by_server = stats.connected
+    except (OSError, TimeoutError):
+        pass
+    finally:
+        if not stats.connected:
+            ready.release()
+
+
+async def _receive(ws: ClientConnection, stats: ClientStats) -> None:
+    async for frame in ws:
+        now = time.perf_counter()
+        message = json.loads(frame)
+        if message.get("type") == "ping":
+            await ws.send('{"action":"pong"}')
+            continue
+        if message.get("type") == "resync_required":
+            stats.resyncs += 1
+        if isinstance(message.get("seq"), int):
+            stats.seqs.append(message["seq"])
+        for event in _events(message):
+            data = event.get("data") or {}
+            if event.get("type") == "keyresult_update" and "progress" in data:
+                counter = round(data["progress"] * TARGET_VALUE / 100)
+                stats.received.setdefault((data["id"], counter), now)
+
+
+async def setup_keyresults(http: httpx.AsyncClient, count: int) -> list[int]:
+    """Create an objective with ``count`` key results to update."""
+    objective = await http.post("/objectives/", json={
+        "name": "Load test", "description": "Websocket fan-out load test",
+    })
+    objective.raise_for_status()
+    objective_id = objective.json()["id"]
+    response = await http.post("/keyresults/bulk/", json={"items": [
+        {
+            "objective": objective_id,
+            "name": f"Load test KR {i}",
+            "description": "Load test",
+            "targetValue": TARGET_VALUE,
+            "currentValue": 0,
+        }
+        for i in range(count)
+    ]})
+    response.raise_for_status()
+    return [result["id"] for result in response.json()["results"]]
+
+
+async def drive_updates(
+    http: httpx.AsyncClient,
+    keyresult_ids: list[int],
+    rate: float,
+    duration: float,
+) -> tuple[dict[tuple[int, int], float], list[float], int]:
+    """Send ``rate`` updates per second for ``duration`` seconds.
+
+    Returns:
+        Send time per (key result id, counter), REST latencies in ms and
+        the number of failed requests.
+    """
+    sent: dict[tuple[int, int], float] = {}
+    rest_latencies: list[float] = []
+    failures = 0
+
+    async def update(kr_id: int, counter: int) -> None:
+        nonlocal failures
+        started = time.perf_counter()
+        sent[(kr_id, counter)] = started
+        try:
+            response = await http.put(f"/keyresults/{kr_id}/", json={"currentValue": counter})
+            response.raise_for_status()
+        except httpx.HTTPError:
+            failures += 1
+            del sent[(kr_id, counter)]
+            return
+        rest_latencies.append((time.perf_counter() - started) * 1000)
+
+    tasks = []
+    total = int(rate * duration)
+    start = time.perf_counter()
+    for counter in range(1, total + 1):
+        delay = start + (counter - 1) / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        kr_id = keyresult_ids[counter % len(keyresult_ids)]
+        tasks.append(asyncio.create_task(update(kr_id, counter)))
+    await asyncio.gather(*tasks)
+    return sent, rest_latencies, failures
+
+
+def delivery_summary(
+    sent: dict[tuple[int, int], float], clients: list[ClientStats]
+) -> dict[str, Any]:
+    """Classify every (update, client) pair as delivered, superseded or lost."""
+    latencies: list[float] = []
+    delivered = superseded = lost = seq_gaps = 0
+    connected = [c for c in clients if c.connected]
+    for client in connected:
+        latest: dict[int, int] = {}
+        for kr_id, counter in client.received:
+            latest[kr_id] = max(latest.get(kr_id, 0), counter)
+        for key, sent_at in sent.items():
+            received_at = client.received.get(key)
+            if received_at is not None:
+                delivered += 1
+                latencies.append((received_at - sent_at) * 1000)
+            elif latest.get(key[0], 0) > key[1]:
+                superseded += 1
+            else:
+                lost += 1
+        seqs = sorted(set(client.seqs))
+        if seqs:
+            seq_gaps += (seqs[-1] - seqs[0] + 1) - len(seqs)
+    return {
+        "expected": len(sent) * len(connected),
+        "delivered": delivered,
+        "superseded": superseded,
+        "lost": lost,
+        "seqGaps": seq_gaps,
+        "resyncs": sum(c.resyncs for c in connected),
+        "latencyMs": percentiles(latencies),
+    }
+
+
+@contextlib.contextmanager
+def spawned_server(port: int, clients: int) -> Any:
+    """Run uvicorn on a temporary database for the duration of the test."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{tmp}/load-test.db",
+            "BROADCAST_SQLITE_PATH": f"{tmp}/load-test-events.db",
+            "WS_MAX_CONNECTIONS": str(clients + 10),
+            "DEBUG": "false",
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app",
+             "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+            env=env,
+            cwd=BACKEND_DIR,
+        )
+        try:
+            yield process
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+async def wait_until_healthy(http: httpx.AsyncClient, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        with contextlib.suppress(httpx.HTTPError):
+            if (await http.get("/health")).status_code == 200:
+                return
+        if time.monotonic() > deadline:
+            raise RuntimeError("Server did not become healthy")
+        await asyncio.sleep(0.2)
+
+
+async def run(args: argparse.Namespace, server_pid: int | None) -> dict[str, Any]:
+    base_url = args.url.rstrip("/")
+    ws_url = base_url.replace("http", "ws", 1) + "/ws"
+    limits = httpx.Limits(max_connections=args.http_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as http:
+        await wait_until_healthy(http)
+        keyresult_ids = await setup_keyresults(http, args.keyresults)
+
+        clients = [ClientStats() for _ in range(args.clients)]
+        # Limits how many handshakes are in flight at once
+        ready = asyncio.Semaphore(args.connect_concurrency)
+        connect_started = time.perf_counter()
+        readers = []
+        for stats in clients:
+            await ready.acquire()
+            readers.append(asyncio.create_task(run_client(ws_url, stats, ready)))
+        for _ in range(args.connect_concurrency):
+            await ready.acquire()
+        connect_seconds = time.perf_counter() - connect_started
+
+        sampler = ProcessSampler(server_pid, args.sample_interval) if server_pid else None
+        sampling = asyncio.create_task(sampler.run()) if sampler else None
+
+        sent, rest_latencies, failures = await drive_updates(
+            http, keyresult_ids, args.rate, args.duration
+        )
+        await asyncio.sleep(args.settle)
+        server_websockets = (await http.get("/diagnostics/websockets")).json()
+
+        if sampling is not None:
+            sampling.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sampling
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
+
+    return {
+        "startedAt": datetime.now(UTC).isoformat(),
+        "config": {
+            "url": base_url,
+            "clients": args.clients,
+            "keyresults": args.keyresults,
+            "rate": args.rate,
+            "duration": args.duration,
+            "settle": args.settle,
+        },
+        "clients": {
+            "requested": args.clients,
+            "connected": sum(c.connected for c in clients),
+            "closedByServer": sum(c.closed_by_server for c in clients),
+            "connectSeconds": round(connect_seconds, 3),
+        },
+        "updates": {
+            "sent": len(sent),
+            "failed": failures,
+            "restLatencyMs": percentiles(rest_latencies),
+        },
+        "delivery": delivery_summary(sent, clients),
+        "server": {
+            "process": sampler.summary() if sampler else None,
+            "websockets": server_websockets,
+        },
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Server base URL")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="Start uvicorn on a temporary database at --url's port")
+    parser.add_argument("--server-pid", type=int, help="Server process to sample")
+    parser.add_argument("--clients", type=int, default=100, help="Websocket clients")
+    parser.add_argument("--keyresults", type=int, default=10, help="Key results to update")
+    parser.add_argument("--rate", type=float, default=20.0, help="Updates per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of updates")
+    parser.add_argument("--settle", type=float, default=2.0,
+                        help="Seconds to wait for deliveries after the last update")
+    parser.add_argument("--connect-concurrency", type=int, default=100,
+                        help="Websocket handshakes in flight at once")
+    parser.add_argument("--http-concurrency", type=int, default=20,
+                        help="Concurrent REST requests")
+    parser.add_argument("--sample-interval", type=float, default=0.5,
+                        help="Seconds between CPU/memory samples")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.spawn_server:
+        port = httpx.URL(args.url).port or 8000
+        with spawned_server(port, args.clients) as process:
+            report = asyncio.run(run(args, process.pid))
+    else:
+        report = asyncio.run(run(args, args.server_pid))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
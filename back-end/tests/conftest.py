@@ -1,12 +1,22 @@
 import pytest
 import pytest_asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from typing import Any
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from httpx import AsyncClient, ASGITransport
 
 from app.main import app as fastapi_app
-from app.database import Base, get_db
+from app.core.counts import count_cache
+from app.core.group_hierarchy import group_hierarchy
+from app.core.loading import STRICT_LOADING_KEY
+from app.core.owner_names import owner_names
+from app.core.response_cache import response_cache
+from app.core.storage import STORAGE_PROFILES, install_storage_profile
+from app.core.versions import entity_versions
+from app.core.websockets import manager
+from app.database import Base, get_db, get_read_db
 # Import models to ensure they are registered with Base.metadata
 import app.models  # noqa: F401
 
@@ -18,11 +28,14 @@ engine = create_async_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+install_storage_profile(engine, STORAGE_PROFILES["test"])
 
+# Fail on relationship loads missing from a repository's load profile
 TestingSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    info={STRICT_LOADING_KEY: True},
 )
 
 @pytest_asyncio.fixture(scope="function")
@@ -38,6 +51,23 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+@pytest.fixture
+def session_factory(db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Open further sessions on the test database, e.g. for background tasks."""
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+@pytest.fixture
+def sql_statements() -> Generator[list[str], None, None]:
+    """Record the SQL statements sent to the test database."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a FastAPI AsyncClient with overridden database dependency."""
@@ -45,6 +75,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_read_db] = override_get_db
 
     # httpx 0.28+ requires 'transport' or 'base_url' for ASGI apps
     # We use ASGITransport to mount the FastAPI app
@@ -53,3 +84,21 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield c
 
     fastapi_app.dependency_overrides.clear()
+    # Ids are reused once the next test recreates the tables
+    entity_versions.clear()
+    response_cache.clear()
+    owner_names.clear()
+    group_hierarchy.clear()
+    count_cache.clear()
+    # Flush coalesced events while this test's event loop is still running
+    await manager.close()
+
+@pytest.fixture
+def create(client: AsyncClient) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Create an entity through the API and return its JSON."""
+    async def create(path: str, **payload: Any) -> dict[str, Any]:
+        response = await client.post(path, json={"description": "Desc", **payload})
+        assert response.status_code == 201
+        return response.json()
+
+    return create
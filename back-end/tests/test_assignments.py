@@ -0,0 +1,107 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models import UserObjectiveAssignment
+from app.models.assignment import rebuild_assignments
+
+
+async def _own(client: AsyncClient, objective_id: int, owner_type: str, owner_id: int):
+    response = await client.post(
+        f"/ownership/objectives/{objective_id}/owner",
+        json={"ownerType": owner_type, "ownerId": owner_id},
+    )
+    assert response.status_code < 300
+
+
+async def _assigned(client: AsyncClient, user_id: int, **params):
+    response = await client.get(f"/ownership/users/{user_id}/objectives", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _names(objectives):
+    return [objective["name"] for objective in objectives]
+
+
+@pytest.mark.asyncio
+async def test_assignments_follow_ownerships_and_memberships(
+    client: AsyncClient, create, db_session
+):
+    user = await create("/users/", name="Ada")
+    role = await create("/roles/", name="Engineer")
+    group = await create("/groups/", name="Platform")
+    direct = await create("/objectives/", name="Direct")
+    by_role = await create("/objectives/", name="Role")
+    by_group = await create("/objectives/", name="Group")
+    await _own(client, direct["id"], "user", user["id"])
+    await _own(client, by_role["id"], "role", role["id"])
+    await _own(client, by_group["id"], "group", group["id"])
+
+    # Ownerships added before the memberships reach the user once they join
+    await client.post(f"/memberships/users/{user['id']}/roles/{role['id']}")
+    await client.post(f"/memberships/groups/{group['id']}/users/{user['id']}")
+    assigned = await _assigned(client, user["id"])
+    assert _names(assigned["individual"]) == ["Direct"]
+    assert _names(assigned["byRole"]["Engineer"]) == ["Role"]
+    assert _names(assigned["byGroup"]["Platform"]) == ["Group"]
+    assert assigned["count"] is None
+
+    # An ownership added to a role reaches its current members
+    await _own(client, direct["id"], "role", role["id"])
+    assigned = await _assigned(client, user["id"])
+    assert _names(assigned["byRole"]["Engineer"]) == ["Direct", "Role"]
+
+    await client.delete(f"/memberships/groups/{group['id']}/users/{user['id']}")
+    await client.delete(
+        f"/ownership/objectives/{direct['id']}/owner",
+        params={"ownerType": "user", "ownerId": user["id"]},
+    )
+    assigned = await _assigned(client, user["id"])
+    assert assigned["individual"] == []
+    assert assigned["byGroup"] == {}
+
+    # Deleting the role drops its assignments although the ownership remains
+    assert (await client.delete(f"/roles/{role['id']}/")).status_code == 204
+    assert await _assigned(client, user["id"]) == {
+        "individual": [],
+        "byRole": {},
+        "byGroup": {},
+        "count": None,
+        "next": None,
+        "previous": None,
+    }
+
+    # A rebuild from scratch agrees with the incremental maintenance
+    await _own(client, by_group["id"], "user", user["id"])
+    await client.post(f"/memberships/groups/{group['id']}/users/{user['id']}")
+    count = select(func.count()).select_from(UserObjectiveAssignment)
+    maintained = await db_session.scalar(count)
+    await db_session.run_sync(lambda session: rebuild_assignments(session.connection()))
+    assert await db_session.scalar(count) == maintained == 2
+
+
+@pytest.mark.asyncio
+async def test_assigned_objectives_paginate_by_objective(client: AsyncClient, create):
+    user = await create("/users/", name="Ada")
+    role = await create("/roles/", name="Engineer")
+    await client.post(f"/memberships/users/{user['id']}/roles/{role['id']}")
+    objectives = [await create("/objectives/", name=f"O{i}") for i in range(3)]
+    # The first objective is assigned twice and still counts once
+    await _own(client, objectives[0]["id"], "user", user["id"])
+    for objective in objectives:
+        await _own(client, objective["id"], "role", role["id"])
+
+    first = await _assigned(client, user["id"], page=1, page_size=2)
+    assert first["count"] == 3
+    assert first["previous"] is None
+    assert "page=2" in first["next"]
+    assert _names(first["individual"]) == ["O0"]
+    assert _names(first["byRole"]["Engineer"]) == ["O0", "O1"]
+
+    second = await _assigned(client, user["id"], page=2, page_size=2)
+    assert second["next"] is None
+    assert second["individual"] == []
+    assert _names(second["byRole"]["Engineer"]) == ["O2"]
+
+    assert (await client.get("/ownership/users/9999/objectives")).status_code == 404
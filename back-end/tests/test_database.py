@@ -0,0 +1,90 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.counts import count_cache
+from app.core.group_hierarchy import group_hierarchy
+from app.core.owner_names import owner_names
+from app.core.response_cache import response_cache
+from app.core.storage import STORAGE_PROFILES, install_storage_profile
+from app.core.versions import entity_versions
+from app.core.websockets import manager
+from app.database import Base, get_db, get_read_db
+from app.main import app as fastapi_app
+from app.models import Objective
+
+SessionFactories = tuple[async_sessionmaker[AsyncSession], async_sessionmaker[AsyncSession]]
+
+
+@pytest_asyncio.fixture
+async def split_sessions(tmp_path) -> AsyncGenerator[SessionFactories, None]:
+    """Writer and reader sessions on separate engines over one database file."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'split.db'}"
+    profile = STORAGE_PROFILES["dev"]
+    writer = create_async_engine(url, pool_size=1, max_overflow=0)
+    install_storage_profile(writer, profile)
+    reader = create_async_engine(url, pool_size=2, max_overflow=0)
+    install_storage_profile(reader, profile, read_only=True)
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield (
+        async_sessionmaker(writer, class_=AsyncSession, expire_on_commit=False),
+        async_sessionmaker(reader, class_=AsyncSession, expire_on_commit=False),
+    )
+
+    await writer.dispose()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reader_rejects_writes(split_sessions):
+    _, read_session = split_sessions
+    async with read_session() as session:
+        with pytest.raises(OperationalError, match="readonly"):
+            await session.execute(insert(Objective).values(name="Obj", description="Desc"))
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_are_visible_to_the_next_read(split_sessions):
+    write_session, read_session = split_sessions
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with write_session() as session:
+            yield session
+
+    async def override_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+        async with read_session() as session:
+            yield session
+
+    fastapi_app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_read_db] = override_get_read_db
+    try:
+        transport = ASGITransport(app=fastapi_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # Warm a reader connection so it is reused after the write
+            assert (await client.get("/objectives/")).json()["count"] == 0
+
+            created = await client.post("/objectives/", json={"name": "Obj", "description": "D"})
+            assert created.status_code == 201
+            objective_id = created.json()["id"]
+
+            assert (await client.get("/objectives/")).json()["count"] == 1
+            detail = await client.get(f"/objectives/{objective_id}/")
+            assert detail.status_code == 200
+
+            await client.put(f"/objectives/{objective_id}/", json={"name": "Renamed"})
+            assert (await client.get(f"/objectives/{objective_id}/")).json()["name"] == "Renamed"
+    finally:
+        fastapi_app.dependency_overrides.clear()
+        entity_versions.clear()
+        response_cache.clear()
+        owner_names.clear()
+        group_hierarchy.clear()
+        count_cache.clear()
+        await manager.close()
@@ -0,0 +1,123 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.response_cache import ResponseCache
+from app.services.objective import ObjectiveService
+
+
+async def _etag(client: AsyncClient, path: str) -> str:
+    response = await client.get(path)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+async def _revalidate(client: AsyncClient, path: str, etag: str) -> int:
+    return (await client.get(path, headers={"If-None-Match": etag})).status_code
+
+
+@pytest.mark.asyncio
+async def test_objective_etag_tracks_keyresults_and_owner_names(
+    client: AsyncClient, create, monkeypatch
+):
+    user = await create("/users/", name="Ada")
+    objective = await create("/objectives/", name="Obj")
+    other = await create("/objectives/", name="Other")
+    kr = await create("/keyresults/", objective=objective["id"], name="KR")
+    await client.post(
+        f"/ownership/objectives/{objective['id']}/owner",
+        json={"ownerType": "user", "ownerId": user["id"]},
+    )
+    path = f"/objectives/{objective['id']}/"
+
+    etag = await _etag(client, path)
+    assert etag.startswith('W/"')
+
+    async def fail(self, id):
+        raise AssertionError("a matching ETag must not load the objective")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ObjectiveService, "get_by_id_with_keyresults", fail)
+        response = await client.get(path, headers={"If-None-Match": f'"x", {etag}'})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # Writes to unrelated objectives keep the ETag
+    await client.put(f"/objectives/{other['id']}/", json={"name": "Renamed"})
+    assert await _revalidate(client, path, etag) == 304
+
+    await client.put(f"/keyresults/{kr['id']}/", json={"currentValue": 5})
+    assert await _revalidate(client, path, etag) == 200
+
+    etag = await _etag(client, path)
+    await client.put(f"/users/{user['id']}/", json={"name": "Grace"})
+    assert await _revalidate(client, path, etag) == 200
+    assert (await client.get(path)).json()["ownerships"][0]["ownerName"] == "Grace"
+
+
+@pytest.mark.asyncio
+async def test_group_etags_follow_membership_statements(client: AsyncClient, create):
+    user = await create("/users/", name="Ada")
+    group = await create("/groups/", name="Platform")
+    list_etag = await _etag(client, "/groups/")
+    detail_etag = await _etag(client, f"/groups/{group['id']}/")
+
+    # A failed write leaves versions alone
+    assert (await client.post(f"/memberships/groups/{group['id']}/users/9999")).status_code >= 400
+    assert await _revalidate(client, "/groups/", list_etag) == 304
+    assert await _revalidate(client, f"/groups/{group['id']}/", detail_etag) == 304
+
+    # Membership rows are written by Core statements, which bump their table
+    await client.post(f"/memberships/groups/{group['id']}/users/{user['id']}")
+    assert await _revalidate(client, "/groups/", list_etag) == 200
+    assert await _revalidate(client, f"/groups/{group['id']}/", detail_etag) == 200
+
+    user_etag = await _etag(client, f"/users/{user['id']}/")
+    await client.put(f"/groups/{group['id']}/", json={"name": "Infra"})
+    assert await _revalidate(client, f"/users/{user['id']}/", user_etag) == 200
+
+
+@pytest.mark.asyncio
+async def test_objective_detail_serves_cached_bytes(client: AsyncClient, create, monkeypatch):
+    role = await create("/roles/", name="Engineer")
+    objective = await create("/objectives/", name="Obj")
+    await create("/keyresults/", objective=objective["id"], name="KR")
+    await client.post(
+        f"/ownership/objectives/{objective['id']}/owner",
+        json={"ownerType": "role", "ownerId": role["id"]},
+    )
+    path = f"/objectives/{objective['id']}/"
+    first = await client.get(path)
+    assert first.json()["ownerships"][0]["ownerName"] == "Engineer"
+    assert "keyresults" in first.json()
+
+    async def fail(self, id):
+        raise AssertionError("a cached body must not be rebuilt")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ObjectiveService, "get_by_id_with_keyresults", fail)
+        cached = await client.get(path)
+    assert cached.status_code == 200
+    assert cached.content == first.content
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert cached.headers["content-type"] == "application/json"
+
+    # Renaming an owner rebuilds the body
+    await client.put(f"/roles/{role['id']}/", json={"name": "Staff Engineer"})
+    assert (await client.get(path)).json()["ownerships"][0]["ownerName"] == "Staff Engineer"
+    assert (await client.get(f"/objectives/{objective['id'] + 1}/")).status_code == 404
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("/a", "1", b"aaaa")
+    cache.set("/b", "1", b"bbbb")
+    assert cache.get("/a", "1") == b"aaaa"
+    assert cache.get("/b", "2") is None
+    cache.set("/c", "1", b"cccc")
+    assert cache.get("/b", "1") is None
+    assert cache.get("/a", "1") == b"aaaa"
+    # A newer version replaces the route's entry instead of adding one
+    cache.set("/a", "2", b"AAAA")
+    assert cache.statistics()["entries"] == 2
+    assert cache.statistics()["bytes"] == 8
@@ -0,0 +1,113 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.models.group import Group
+from app.repositories.membership import MembershipRepository
+
+
+@pytest.mark.asyncio
+async def test_group_load_profiles(client: AsyncClient, create):
+    owner = await create("/users/", name="Ada")
+    role = await create("/roles/", name="Engineer")
+    parent = await create("/groups/", name="Platform", ownerId=owner["id"])
+    child = await create("/groups/", name="Storage", parentId=parent["id"])
+    assert child["parent"] == {"id": parent["id"], "name": "Platform"}
+
+    await client.post(f"/memberships/groups/{parent['id']}/users/{owner['id']}")
+    await client.post(f"/memberships/groups/{parent['id']}/roles/{role['id']}")
+
+    listed = (await client.get("/groups/", params={"ordering": "name"})).json()["results"]
+    assert [g["name"] for g in listed] == ["Platform", "Storage"]
+    assert "children" not in listed[0]
+
+    detail = (await client.get(f"/groups/{parent['id']}/")).json()
+    assert detail["owner"] == {"id": owner["id"], "name": "Ada"}
+    assert detail["children"] == [{"id": child["id"], "name": "Storage"}]
+    assert detail["users"] == [{"id": owner["id"], "name": "Ada"}]
+    assert detail["roles"] == [{"id": role["id"], "name": "Engineer"}]
+
+    users = (await client.get("/users/")).json()["results"]
+    assert users[0]["groups"] == [{"id": parent["id"], "name": "Platform"}]
+
+    # Database cascades clean up memberships and orphaned children
+    assert (await client.delete(f"/groups/{parent['id']}/")).status_code == 204
+    orphan = (await client.get(f"/groups/{child['id']}/")).json()
+    assert orphan["parentId"] is None
+    role_detail = (await client.get(f"/roles/{role['id']}/")).json()
+    assert role_detail["groups"] == []
+
+
+@pytest.mark.asyncio
+async def test_relationships_are_not_loaded_implicitly(create, db_session: AsyncSession):
+    group = await create("/groups/", name="Platform")
+    db_session.expunge_all()
+
+    loaded = (await db_session.execute(select(Group).where(Group.id == group["id"]))).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        _ = loaded.users
+
+
+@pytest.mark.asyncio
+async def test_group_hierarchy_lookups_and_cycle_checks(
+    client: AsyncClient, create, db_session: AsyncSession
+):
+    root = await create("/groups/", name="Root")
+    # Loads the index before the rest of the tree exists, so later writes update it
+    assert (await client.get(f"/groups/{root['id']}/descendants")).json() == []
+    team = await create("/groups/", name="Team", parentId=root["id"])
+    squad = await create("/groups/", name="Squad", parentId=team["id"])
+    other = await create("/groups/", name="Other", parentId=root["id"])
+
+    ancestors = (await client.get(f"/groups/{squad['id']}/ancestors")).json()
+    assert ancestors == [{"id": team["id"], "name": "Team"}, {"id": root["id"], "name": "Root"}]
+    descendants = (await client.get(f"/groups/{root['id']}/descendants")).json()
+    assert [g["name"] for g in descendants] == ["Team", "Other", "Squad"]
+    assert (await client.get("/groups/9999/ancestors")).status_code == 404
+
+    # A group cannot become its own ancestor
+    for parent in (root, squad):
+        response = await client.put(f"/groups/{root['id']}/", json={"parentId": parent["id"]})
+        assert response.status_code == 400
+        assert response.json()["details"]["field"] == "parent_id"
+    orphan = {"name": "Orphan", "description": "Desc", "parentId": 9999}
+    assert (await client.post("/groups/", json=orphan)).status_code == 400
+
+    # Moves and deletes keep the index current
+    response = await client.put(f"/groups/{squad['id']}/", json={"parentId": other["id"]})
+    assert response.status_code == 200
+    ancestors = (await client.get(f"/groups/{squad['id']}/ancestors")).json()
+    assert [g["name"] for g in ancestors] == ["Other", "Root"]
+    assert (await client.delete(f"/groups/{other['id']}/")).status_code == 204
+    assert (await client.get(f"/groups/{squad['id']}/ancestors")).json() == []
+
+    # Cascading checks the parent link through the index
+    objective = await create("/objectives/", name="Obj")
+    repository = MembershipRepository(db_session)
+    cascaded = await repository.cascade_objective_to_child(root["id"], team["id"], objective["id"])
+    assert cascaded.is_active
+    with pytest.raises(ValidationError):
+        await repository.cascade_objective_to_child(root["id"], squad["id"], objective["id"])
+
+
+@pytest.mark.asyncio
+async def test_cycle_check_reads_the_stored_tree(client: AsyncClient, create, db_session):
+    first = await create("/groups/", name="First")
+    second = await create("/groups/", name="Second")
+    assert (await client.get(f"/groups/{first['id']}/ancestors")).json() == []
+
+    # Another worker moves First below Second; this worker's index has not seen it
+    await db_session.run_sync(
+        lambda session: session.connection().execute(
+            update(Group.__table__).where(Group.id == first["id"]).values(parent_id=second["id"])
+        )
+    )
+    await db_session.commit()
+    assert (await client.get(f"/groups/{first['id']}/ancestors")).json() == []
+
+    response = await client.put(f"/groups/{second['id']}/", json={"parentId": first["id"]})
+    assert response.status_code == 400
+    assert response.json()["details"]["field"] == "parent_id"
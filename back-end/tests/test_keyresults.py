@@ -1,5 +1,21 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.outbox import OutboxDispatcher
+from app.models import Objective
+from app.models.progress import sync_objective_progress
+
+
+async def dispatch_outbox(db_session):
+    """Drain the outbox, returning the (message, topics) pairs it published."""
+    sent = []
+
+    async def record(message, topics):
+        sent.append((message, set(topics)))
+
+    await OutboxDispatcher(record).dispatch(db_session)
+    return sent
 
 @pytest.mark.asyncio
 async def test_create_key_result(client: AsyncClient):
@@ -56,3 +72,173 @@ async def test_key_result_progress_calculation(client: AsyncClient):
     assert get_res.status_code == 200
     data = get_res.json()
     assert data["progressPercentage"] == 50.0
+
+@pytest.mark.asyncio
+async def test_objective_aggregates_follow_key_result_writes(client: AsyncClient):
+    obj_a = (await client.post("/objectives/", json={"name": "A", "description": "D"})).json()["id"]
+    obj_b = (await client.post("/objectives/", json={"name": "B", "description": "D"})).json()["id"]
+
+    kr1 = (await client.post(
+        "/keyresults/",
+        json={"objective": obj_a, "name": "KR 1", "description": "D", "currentValue": 100}
+    )).json()["id"]
+    kr2 = (await client.post(
+        "/keyresults/",
+        json={"objective": obj_a, "name": "KR 2", "description": "D", "currentValue": 50}
+    )).json()["id"]
+
+    data = (await client.get("/objectives/", params={"ordering": "-progress"})).json()
+    assert [o["id"] for o in data["results"]] == [obj_a, obj_b]
+    assert data["results"][0]["progressPercentage"] == 75.0
+    assert data["results"][0]["celebrationTrigger"] == "hit_75"
+
+    data = (await client.get("/objectives/", params={"progress_min": 70})).json()
+    assert [o["id"] for o in data["results"]] == [obj_a]
+
+    # Completing the last key result auto-completes the objective
+    await client.put(f"/keyresults/{kr2}/", json={"isComplete": True})
+    data = (await client.get(f"/objectives/{obj_a}/")).json()
+    assert data["isComplete"] is True
+
+    # Moving a key result updates both objectives
+    await client.put(f"/keyresults/{kr1}/", json={"objective": obj_b})
+    a = (await client.get(f"/objectives/{obj_a}/")).json()
+    b = (await client.get(f"/objectives/{obj_b}/")).json()
+    assert a["progressPercentage"] == 50.0
+    assert b["progressPercentage"] == 100.0
+
+    await client.delete(f"/keyresults/{kr1}/")
+    b = (await client.get(f"/objectives/{obj_b}/")).json()
+    assert b["progressPercentage"] == 0.0
+
+@pytest.mark.asyncio
+async def test_sync_objective_progress_is_one_grouped_update(
+    client: AsyncClient, db_session, sql_statements
+):
+    ids = [
+        (await client.post("/objectives/", json={"name": f"O{i}", "description": "D"})).json()["id"]
+        for i in range(3)
+    ]
+    for objective_id, value in ((ids[0], 100), (ids[0], 0), (ids[1], 50)):
+        await client.post("/keyresults/", json={
+            "objective": objective_id, "name": "KR", "description": "D", "currentValue": value,
+        })
+    sql_statements.clear()
+    await db_session.run_sync(lambda session: sync_objective_progress(session.connection(), ids))
+    # One grouped update, and one for objectives without key results
+    assert len(sql_statements) == 2
+
+    rows = (await db_session.execute(
+        select(Objective.keyresult_count, Objective.progress_percentage)
+        .where(Objective.id.in_(ids))
+        .order_by(Objective.id)
+    )).all()
+    assert [tuple(row) for row in rows] == [(2, 50.0), (1, 50.0), (0, 0.0)]
+
+@pytest.mark.asyncio
+async def test_bulk_key_results(client: AsyncClient):
+    obj_id = (await client.post(
+        "/objectives/", json={"name": "Bulk Obj", "description": "Desc"}
+    )).json()["id"]
+
+    created = (await client.post("/keyresults/bulk/", json={"items": [
+        {"objective": obj_id, "name": "KR A", "description": "Desc", "currentValue": 100},
+        {"objective": 9999, "name": "KR B", "description": "Desc"},
+        {"objective": obj_id, "description": "Missing name"},
+        {"objective": obj_id, "name": "KR C", "description": "Desc"},
+    ]})).json()
+    assert (created["succeeded"], created["failed"]) == (2, 2)
+    statuses = [r["status"] for r in created["results"]]
+    assert statuses == ["created", "failed", "failed", "created"]
+    assert created["results"][1]["error"]["details"] == {"field": "objective", "value": 9999}
+    assert created["results"][3]["data"]["objectiveName"] == "Bulk Obj"
+    kr_a, kr_c = created["results"][0]["id"], created["results"][3]["id"]
+
+    objective = (await client.get(f"/objectives/{obj_id}/")).json()
+    assert objective["progressPercentage"] == 50.0
+    assert objective["isComplete"] is False
+
+    updated = (await client.patch("/keyresults/bulk/", json={"items": [
+        {"id": kr_c, "currentValue": 100},
+        {"id": 9999, "currentValue": 10},
+        {"name": "No id"},
+    ]})).json()
+    assert [r["status"] for r in updated["results"]] == ["updated", "failed", "failed"]
+    assert updated["results"][0]["data"]["progressPercentage"] == 100.0
+    assert updated["results"][1]["error"]["error_code"] == "NOT_FOUND"
+
+    objective = (await client.get(f"/objectives/{obj_id}/")).json()
+    assert objective["progressPercentage"] == 100.0
+    assert objective["isComplete"] is True
+
+    deleted = (await client.request("DELETE", "/keyresults/bulk/", json={"ids": [kr_a, 9999]})).json()
+    assert [r["status"] for r in deleted["results"]] == ["deleted", "failed"]
+    objective = (await client.get(f"/objectives/{obj_id}/")).json()
+    assert [kr["id"] for kr in objective["keyresults"]] == [kr_c]
+
+@pytest.mark.asyncio
+async def test_progress_batch_coalesces_per_objective(client: AsyncClient, db_session):
+    obj_id = (await client.post(
+        "/objectives/", json={"name": "Metrics", "description": "Desc"}
+    )).json()["id"]
+    kr_ids = [
+        (await client.post("/keyresults/", json={
+            "objective": obj_id, "name": f"KR {i}", "description": "Desc",
+        })).json()["id"]
+        for i in range(3)
+    ]
+    await dispatch_outbox(db_session)
+
+    response = await client.post("/keyresults/progress:batch", json={"updates": [
+        {"id": kr_ids[0], "currentValue": 100},
+        {"id": kr_ids[1], "isComplete": True},
+        {"id": kr_ids[2], "currentValue": 100},
+        {"id": 9999, "currentValue": 1},
+    ]})
+    assert response.status_code == 200
+    assert (response.json()["succeeded"], response.json()["failed"]) == (3, 1)
+
+    sent = [message for message, _ in await dispatch_outbox(db_session)]
+    assert [m["type"] for m in sent] == ["objective_update", "objective_progress"]
+    assert sent[0] == {"type": "objective_update", "action": "updated", "data": {"id": obj_id}}
+    event = sent[1]
+    assert event["data"]["objectiveId"] == obj_id
+    assert event["data"]["isComplete"] is True
+    assert sorted(kr["id"] for kr in event["data"]["keyresults"]) == sorted(kr_ids)
+
+    objective = (await client.get(f"/objectives/{obj_id}/")).json()
+    assert objective["isComplete"] is True
+
+
+@pytest.mark.asyncio
+async def test_keyresult_update_topics(client: AsyncClient, create, db_session):
+    owner = (await create("/users/", name="Owner"))["id"]
+    member = (await create("/users/", name="Member"))["id"]
+    group = (await create("/groups/", name="Team"))["id"]
+    org = (await create("/organizations/", name="Org"))["id"]
+    await client.post(f"/memberships/groups/{group}/users/{member}")
+    await client.post(f"/memberships/organizations/{org}/groups/{group}")
+
+    obj_id = (await create("/objectives/", name="Owned"))["id"]
+    for owner_type, owner_id in (("user", owner), ("group", group)):
+        await client.post(
+            f"/ownership/objectives/{obj_id}/owner",
+            json={"ownerType": owner_type, "ownerId": owner_id},
+        )
+    kr_id = (await create("/keyresults/", objective=obj_id, name="KR"))["id"]
+    await dispatch_outbox(db_session)
+
+    await client.put(f"/keyresults/{kr_id}/", json={"currentValue": 10})
+    sent = await dispatch_outbox(db_session)
+    assert [message for message, _ in sent] == [{
+        "type": "keyresult_update",
+        "action": "updated",
+        "data": {"id": kr_id, "objectiveId": obj_id, "progress": 10.0},
+    }]
+    assert [topics for _, topics in sent] == [{
+        f"objective:{obj_id}",
+        f"user:{owner}:assigned",
+        f"user:{member}:assigned",
+        f"group:{group}",
+        f"organization:{org}",
+    }]
@@ -1,5 +1,11 @@
+import time
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.core.counts import CountCache
+from app.models import Objective
 
 @pytest.mark.asyncio
 async def test_create_objective(client: AsyncClient):
@@ -34,3 +40,179 @@ async def test_list_objectives(client: AsyncClient):
     assert "results" in data
     assert len(data["results"]) >= 1
     assert data["results"][0]["name"] == "Objective 1"
+
+@pytest.mark.asyncio
+async def test_list_objectives_cursor_pagination(client: AsyncClient):
+    for i in range(5):
+        await client.post(
+            "/objectives/",
+            json={"name": f"Objective {i}", "description": "Desc"}
+        )
+
+    first = (await client.get("/objectives/", params={"cursor": "", "page_size": 2})).json()
+    assert [o["name"] for o in first["results"]] == ["Objective 0", "Objective 1"]
+    assert first["count"] == 5
+    assert first["previous"] is None
+    assert "cursor=" in first["next"]
+
+    second = (await client.get(first["next"])).json()
+    assert [o["name"] for o in second["results"]] == ["Objective 2", "Objective 3"]
+
+    third = (await client.get(second["next"])).json()
+    assert [o["name"] for o in third["results"]] == ["Objective 4"]
+    assert third["next"] is None
+
+    back = (await client.get(third["previous"])).json()
+    assert [o["name"] for o in back["results"]] == ["Objective 2", "Objective 3"]
+    assert back["next"] is not None
+
+@pytest.mark.asyncio
+async def test_list_objectives_cursor_nullable_ordering(client: AsyncClient):
+    await client.post("/objectives/", json={"name": "A", "description": "D"})
+    await client.post(
+        "/objectives/",
+        json={"name": "B", "description": "D", "startDate": "2024-02-01"}
+    )
+    await client.post(
+        "/objectives/",
+        json={"name": "C", "description": "D", "startDate": "2024-01-01"}
+    )
+
+    names = []
+    url = "/objectives/?cursor=&page_size=1&ordering=-start_date"
+    while url:
+        page = (await client.get(url)).json()
+        names.extend(o["name"] for o in page["results"])
+        url = page["next"]
+    assert names == ["B", "C", "A"]
+
+@pytest.mark.asyncio
+async def test_list_objectives_invalid_cursor(client: AsyncClient):
+    response = await client.get("/objectives/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_objectives_count_modes(client: AsyncClient):
+    for i in range(3):
+        await client.post(
+            "/objectives/",
+            json={"name": f"Objective {i}", "description": "Desc"}
+        )
+
+    exact = (await client.get("/objectives/", params={"page_size": 2})).json()
+    assert exact["count"] == 3
+    assert exact["next"] is not None
+
+    none = (await client.get("/objectives/", params={"page_size": 2, "count": "none"})).json()
+    assert none["count"] is None
+    assert none["hasMore"] is True
+    assert none["next"] is not None
+
+    last = (await client.get(none["next"])).json()
+    assert last["hasMore"] is False
+    assert last["next"] is None
+
+    estimate = (await client.get("/objectives/", params={"count": "estimate"})).json()
+    assert estimate["count"] == 3
+
+    # Writes invalidate the cached count
+    await client.post("/objectives/", json={"name": "Objective 3", "description": "Desc"})
+    estimate = (await client.get("/objectives/", params={"count": "estimate"})).json()
+    assert estimate["count"] == 4
+
+def test_count_cache_evicts_least_recently_used_and_expired(monkeypatch):
+    cache = CountCache(ttl=10, max_entries=2)
+    queries = [select(func.count()).where(Objective.name == name) for name in "abc"]
+    cache.set("objectives", queries[0], 1)
+    cache.set("objectives", queries[1], 2)
+    assert cache.get("objectives", queries[0]) == 1
+    cache.set("objectives", queries[2], 3)
+    assert cache.get("objectives", queries[1]) is None
+    assert len(cache) == 2
+
+    # Expired entries are dropped when read
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("objectives", queries[0]) is None
+    assert len(cache) == 1
+
+@pytest.mark.asyncio
+async def test_search_objectives(client: AsyncClient):
+    revenue = await client.post(
+        "/objectives/",
+        json={"name": "Grow revenue", "description": "Revenue revenue revenue"}
+    )
+    await client.post(
+        "/objectives/",
+        json={"name": "Hire engineers", "description": "Support revenue goals"}
+    )
+    await client.post("/objectives/", json={"name": "Ship app", "description": "Mobile"})
+
+    data = (await client.get("/objectives/", params={"search": "revenue"})).json()
+    assert data["count"] == 2
+    assert data["results"][0]["name"] == "Grow revenue"
+
+    # Prefix matching
+    data = (await client.get("/objectives/", params={"search": "engin"})).json()
+    assert [o["name"] for o in data["results"]] == ["Hire engineers"]
+
+    # Index follows renames and deletes
+    objective_id = revenue.json()["id"]
+    await client.put(f"/objectives/{objective_id}/", json={"name": "Grow profit", "description": "Margin"})
+    data = (await client.get("/objectives/", params={"search": "profit"})).json()
+    assert [o["id"] for o in data["results"]] == [objective_id]
+
+    await client.delete(f"/objectives/{objective_id}/")
+    data = (await client.get("/objectives/", params={"search": "profit"})).json()
+    assert data["count"] == 0
+
+@pytest.mark.asyncio
+async def test_list_objectives_sparse_fields(client: AsyncClient):
+    for name in ("Alpha", "Beta", "Gamma"):
+        await client.post("/objectives/", json={"name": name, "description": "Desc"})
+
+    response = await client.get(
+        "/objectives/", params={"fields": "id,name,progressPercentage", "page_size": 2}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert data["results"] == [
+        {"id": 1, "name": "Alpha", "progressPercentage": 0.0},
+        {"id": 2, "name": "Beta", "progressPercentage": 0.0},
+    ]
+
+    first = (await client.get(
+        "/objectives/", params={"fields": "name", "cursor": "", "page_size": 2, "ordering": "-name"}
+    )).json()
+    assert first["results"] == [{"name": "Gamma"}, {"name": "Beta"}]
+    second = (await client.get(first["next"])).json()
+    assert second["results"] == [{"name": "Alpha"}]
+
+    invalid = await client.get("/objectives/", params={"fields": "id,celebrationTrigger"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_objectives(client: AsyncClient):
+    created = (await client.post("/objectives/bulk/", json={"items": [
+        {"name": "Obj A", "description": "Desc", "startDate": "2024-01-01"},
+        {"name": "Obj B"},
+    ]})).json()
+    assert [r["status"] for r in created["results"]] == ["created", "failed"]
+    obj_id = created["results"][0]["id"]
+    assert created["results"][0]["data"]["startDate"] == "2024-01-01"
+
+    await client.post(
+        "/keyresults/", json={"objective": obj_id, "name": "KR", "description": "Desc"}
+    )
+    updated = (await client.patch(
+        "/objectives/bulk/", json={"items": [{"id": obj_id, "name": "Renamed"}]}
+    )).json()
+    assert updated["results"][0]["data"]["name"] == "Renamed"
+
+    # Key results are removed with their objective
+    deleted = (await client.request("DELETE", "/objectives/bulk/", json={"ids": [obj_id]})).json()
+    assert deleted["succeeded"] == 1
+    assert (await client.get(f"/objectives/{obj_id}/")).status_code == 404
+    assert (await client.get("/keyresults/")).json()["count"] == 0
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+
+from app.core.outbox import OutboxDispatcher
+from app.models import GroupStreak, Reaction
+from app.models.outbox import OutboxEvent
+from app.repositories.reaction import ReactionRepository
+
+
+async def pending_events(db_session):
+    return await db_session.scalar(select(func.count()).select_from(OutboxEvent))
+
+
+@pytest.mark.asyncio
+async def test_writes_record_outbox_events(client: AsyncClient, create, db_session):
+    sent = []
+
+    async def record(message, topics):
+        sent.append((message["type"], message["action"], message["data"], topics))
+
+    user = (await create("/users/", name="Me"))["id"]
+    group = (await create("/groups/", name="Team"))["id"]
+    obj_id = (await create("/objectives/", name="Obj"))["id"]
+    kr_id = (await create("/keyresults/", objective=obj_id, name="KR"))["id"]
+    await client.post(
+        f"/ownership/objectives/{obj_id}/owner", json={"ownerType": "group", "ownerId": group}
+    )
+    db_session.add(Reaction(key_result_id=kr_id, user_id=user, emoji="fire"))
+    db_session.add(GroupStreak(group_id=group, current_streak=1, longest_streak=1))
+    await db_session.commit()
+    await client.delete(
+        f"/ownership/objectives/{obj_id}/owner", params={"ownerType": "group", "ownerId": group}
+    )
+    await ReactionRepository(db_session).remove_reaction(kr_id, user, "fire")
+
+    # A failed write leaves no event behind
+    assert (await client.post("/keyresults/", json={
+        "objective": 9999, "name": "Orphan", "description": "Desc",
+    })).status_code == 400
+
+    assert await pending_events(db_session) == 7
+    assert await OutboxDispatcher(record).dispatch(db_session) == 7
+    assert await pending_events(db_session) == 0
+
+    objective = {f"objective:{obj_id}"}
+    ownership = {"objectiveId": obj_id, "ownerType": "group", "ownerId": group}
+    assert sent == [
+        ("objective_update", "created", {"id": obj_id}, objective),
+        ("keyresult_update", "created",
+         {"id": kr_id, "objectiveId": obj_id, "progress": 0.0}, objective),
+        ("ownership_update", "created", ownership, {f"group:{group}", *objective}),
+        ("reaction_update", "created", {"keyResultId": kr_id}, objective),
+        ("streak_update", "created",
+         {"groupId": group, "currentStreak": 1, "longestStreak": 1}, {f"group:{group}"}),
+        # The former owner still hears about losing the objective
+        ("ownership_update", "deleted", ownership, {f"group:{group}", *objective}),
+        ("reaction_update", "deleted", {"keyResultId": kr_id}, objective),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_keeps_events(client: AsyncClient, db_session):
+    async def fail(message, topics):
+        raise ConnectionError("broker down")
+
+    await client.post("/objectives/", json={"name": "Obj", "description": "Desc"})
+    with pytest.raises(ConnectionError):
+        await OutboxDispatcher(fail).dispatch(db_session)
+    assert await pending_events(db_session) == 1
+
+    # The claim is released, so the next dispatch retries right away
+    published = []
+
+    async def record(message, topics):
+        # Publishing happens outside any transaction, before the rows are deleted
+        published.append(db_session.in_transaction())
+
+    assert await OutboxDispatcher(record).dispatch(db_session) == 1
+    assert published == [False]
+    assert await pending_events(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_claimed_events_wait_for_the_claim_to_expire(client: AsyncClient, db_session):
+    async def record(message, topics):
+        pass
+
+    await client.post("/objectives/", json={"name": "Obj", "description": "Desc"})
+    claimed_until = datetime.utcnow() + timedelta(seconds=30)
+    await db_session.execute(update(OutboxEvent).values(claimed_until=claimed_until))
+    await db_session.commit()
+    # Another dispatcher is publishing this event
+    assert await OutboxDispatcher(record).dispatch(db_session) == 0
+
+    # It crashed: the event is sent once its claim runs out
+    await db_session.execute(
+        update(OutboxEvent).values(claimed_until=claimed_until - timedelta(seconds=60))
+    )
+    await db_session.commit()
+    assert await OutboxDispatcher(record).dispatch(db_session) == 1
+    assert await pending_events(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_wakes_on_commit(client: AsyncClient, session_factory, monkeypatch):
+    import app.core.outbox as outbox_module
+
+    published = asyncio.Event()
+
+    async def record(message, topics):
+        published.set()
+
+    dispatcher = OutboxDispatcher(record, poll_interval=60)
+    monkeypatch.setattr(outbox_module, "outbox_dispatcher", dispatcher)
+    await dispatcher.start(session_factory)
+    try:
+        await client.post("/objectives/", json={"name": "Obj", "description": "Desc"})
+        # Woken by the commit rather than the 60 second poll
+        await asyncio.wait_for(published.wait(), timeout=1)
+
+        # Rows are deleted after the publish returns
+        async def deleted():
+            while dispatcher.statistics()["dispatched"] == 0:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(deleted(), timeout=1)
+    finally:
+        await dispatcher.stop()
+    assert dispatcher.statistics()["dispatched"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_coalesces_each_batch(client: AsyncClient, db_session):
+    sent = []
+
+    async def record(message, topics):
+        sent.append((message, topics))
+
+    objective = await client.post("/objectives/", json={"name": "Obj", "description": "D"})
+    obj_id = objective.json()["id"]
+    kr_id = (await client.post("/keyresults/", json={
+        "objective": obj_id, "name": "KR", "description": "D",
+    })).json()["id"]
+    for value in (10, 20):
+        await client.put(f"/keyresults/{kr_id}/", json={"currentValue": value})
+
+    assert await OutboxDispatcher(record, coalesce=True).dispatch(db_session) == 4
+    assert len(sent) == 1
+    message, topics = sent[0]
+    assert topics == (f"objective:{obj_id}",)
+    # The key result's creation and two updates collapse into its latest state
+    assert [(e["type"], e["action"]) for e in message["events"]] == [
+        ("objective_update", "created"),
+        ("keyresult_update", "updated"),
+    ]
+    assert message["events"][1]["data"]["progress"] == 20.0
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.core.owner_names import owner_names
+from app.models import User
+from app.models.associations import OwnerType
+from app.repositories.ownership import OwnershipRepository
+
+
+@pytest.mark.asyncio
+async def test_owner_names_resolve_without_sql_once_warm(
+    client: AsyncClient, create, db_session, sql_statements
+):
+    user = await create("/users/", name="Ada")
+    role = await create("/roles/", name="Engineer")
+    group = await create("/groups/", name="Platform")
+    objective = await create("/objectives/", name="Obj")
+    for owner_type, owner in (("user", user), ("role", role), ("group", group)):
+        await client.post(
+            f"/ownership/objectives/{objective['id']}/owner",
+            json={"ownerType": owner_type, "ownerId": owner["id"]},
+        )
+
+    repository = OwnershipRepository(db_session)
+    ownerships = await repository.get_objective_ownerships(objective["id"])
+    sql_statements.clear()
+    names = await repository.get_owner_names_bulk(ownerships)
+    assert sql_statements == []
+    assert names == {
+        ("user", user["id"]): "Ada",
+        ("role", role["id"]): "Engineer",
+        ("group", group["id"]): "Platform",
+    }
+
+
+@pytest.mark.asyncio
+async def test_owner_names_follow_renames_deletes_and_rollbacks(
+    client: AsyncClient, create, db_session
+):
+    user = await create("/users/", name="Ada")
+    key = (OwnerType.USER, user["id"])
+    assert owner_names.lookup([key])[0] == {key: "Ada"}
+
+    await client.put(f"/users/{user['id']}/", json={"name": "Grace"})
+    assert owner_names.lookup([key])[0] == {key: "Grace"}
+
+    instance = await db_session.get(User, user["id"])
+    instance.name = "Rolled back"
+    await db_session.flush()
+    await db_session.rollback()
+    assert owner_names.lookup([key])[0] == {key: "Grace"}
+
+    await client.delete(f"/users/{user['id']}/")
+    assert owner_names.lookup([key]) == ({}, {key})
+    assert await OwnershipRepository(db_session).get_owner_name("user", user["id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_owner_names_expire(client: AsyncClient, create, db_session, monkeypatch):
+    user = await create("/users/", name="Ada")
+    repository = OwnershipRepository(db_session)
+    assert await repository.get_owner_name("user", user["id"]) == "Ada"
+
+    # A rename committed by another worker never reaches this process's hooks
+    rename = text("UPDATE users SET name = 'Grace' WHERE id = :id")
+    await db_session.execute(rename, {"id": user["id"]})
+    await db_session.commit()
+    assert await repository.get_owner_name("user", user["id"]) == "Ada"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + owner_names.ttl + 1)
+    assert await repository.get_owner_name("user", user["id"]) == "Grace"
@@ -0,0 +1,28 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_list_choices_by_page_and_cursor(client: AsyncClient):
+    questions = []
+    for text in ("Lunch?", "Dinner?"):
+        response = await client.post("/polls/questions/", json={"question_text": text})
+        assert response.status_code == 201
+        questions.append(response.json())
+    choices = [(questions[0], "Soup"), (questions[0], "Salad"), (questions[1], "Pizza")]
+    for question, choice_text in choices:
+        response = await client.post(
+            "/polls/choices/",
+            json={"choice_text": choice_text, "question_id": question["id"]},
+        )
+        assert response.status_code == 201
+
+    response = await client.get("/polls/choices/", params={"page_size": 2})
+    assert response.status_code == 200
+    assert response.json()["count"] == 3
+
+    params = {"question_id": questions[0]["id"]}
+    by_page = (await client.get("/polls/choices/", params=params)).json()
+    assert [choice["choice_text"] for choice in by_page["results"]] == ["Soup", "Salad"]
+    by_cursor = (await client.get("/polls/choices/", params={**params, "cursor": ""})).json()
+    assert by_cursor["results"] == by_page["results"]
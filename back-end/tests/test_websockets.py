@@ -1,7 +1,15 @@
 import pytest
 import asyncio
+import json
 from httpx import AsyncClient
-from app.core.websockets import manager
+from app.core.websockets import ConnectionManager, manager
+
+
+def _without_seq(data):
+    """Decode a sent frame, dropping the sequence number stamped on events."""
+    message = json.loads(data)
+    message.pop("seq", None)
+    return message
 
 @pytest.mark.asyncio
 async def test_websocket_connection(client: AsyncClient):
@@ -26,8 +34,8 @@ async def test_manager_broadcast():
         async def accept(self):
             self.accepted = True
 
-        async def send_json(self, message):
-            self.sent_messages.append(message)
+        async def send_text(self, data):
+            self.sent_messages.append(_without_seq(data))
 
     # Test Connection
     ws1 = MockWebSocket()
@@ -42,6 +50,7 @@ async def test_manager_broadcast():
     # Test Broadcast
     msg = {"type": "update", "data": "test"}
     await manager.broadcast(msg)
+    await manager.drain()
 
     assert len(ws1.sent_messages) == 1
     assert ws1.sent_messages[0] == msg
@@ -53,3 +62,335 @@ async def test_manager_broadcast():
 
     # Cleanup
     manager.disconnect(ws2)
+
+
+class BlockedWebSocket:
+    """Socket whose sends wait until released."""
+
+    def __init__(self):
+        self.sent_messages = []
+        self.release = asyncio.Event()
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        await self.release.wait()
+        self.sent_messages.append(_without_seq(data))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_block_broadcast():
+    fast_manager = ConnectionManager(queue_size=2, policy="drop_oldest", coalesce_window=0)
+    slow = BlockedWebSocket()
+    await fast_manager.connect(slow)
+
+    for i in range(5):
+        await asyncio.wait_for(fast_manager.broadcast({"n": i}), timeout=1)
+
+    stats = fast_manager.statistics()
+    assert stats["droppedMessages"] == 3
+    assert stats["maxQueueDepth"] == 2
+
+    slow.release.set()
+    await fast_manager.drain()
+    # The newest messages survive
+    assert slow.sent_messages == [{"n": 3}, {"n": 4}]
+    await fast_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_disconnect_policy():
+    strict_manager = ConnectionManager(queue_size=1, policy="disconnect", coalesce_window=0)
+    slow = BlockedWebSocket()
+    await strict_manager.connect(slow)
+
+    for i in range(3):
+        await strict_manager.broadcast({"n": i})
+    await asyncio.sleep(0.01)
+
+    assert strict_manager.statistics()["slowDisconnects"] == 1
+    assert len(strict_manager.active_connections) == 0
+    assert slow.closed_with == 1013
+    await strict_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_topic_routing():
+    class MockWebSocket:
+        def __init__(self):
+            self.sent_messages = []
+
+        async def accept(self):
+            pass
+
+        async def send_text(self, data):
+            self.sent_messages.append(_without_seq(data))
+
+    topic_manager = ConnectionManager(coalesce_window=0)
+    everything, watcher = MockWebSocket(), MockWebSocket()
+    await topic_manager.connect(everything)
+    await topic_manager.connect(watcher, ["objective:1"])
+
+    await topic_manager.broadcast({"n": 1}, ["objective:1", "group:2"])
+    await topic_manager.broadcast({"n": 2}, ["objective:2"])
+    topic_manager.subscribe(watcher, ["group:2"])
+    topic_manager.unsubscribe(watcher, ["objective:1"])
+    await topic_manager.broadcast({"n": 3}, ["objective:1"])
+    await topic_manager.broadcast({"n": 4}, ["group:2"])
+    await topic_manager.drain()
+
+    assert everything.sent_messages == [{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}]
+    assert watcher.sent_messages == [{"n": 1}, {"n": 4}]
+
+    topic_manager.disconnect(watcher)
+    assert set(topic_manager.subscribers) == {"*"}
+    await topic_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_reaches_other_workers(tmp_path):
+    from app.core.broadcast import SQLiteBackend
+
+    class MockWebSocket:
+        def __init__(self):
+            self.sent_messages = []
+
+        async def accept(self):
+            pass
+
+        async def send_text(self, data):
+            self.sent_messages.append(_without_seq(data))
+
+    path = str(tmp_path / "events.db")
+    # Long poll interval so the test drives polling itself
+    workers = [
+        ConnectionManager(
+            backend=SQLiteBackend(path, poll_interval=60, retention=60), coalesce_window=0
+        )
+        for _ in range(2)
+    ]
+    sockets = [MockWebSocket(), MockWebSocket()]
+    for worker, socket in zip(workers, sockets):
+        await worker.start()
+        await worker.connect(socket, ["objective:1"])
+
+    await workers[0].broadcast({"n": 1}, ["objective:1"])
+    await workers[0].broadcast({"n": 2}, ["objective:2"])
+    for worker in workers:
+        assert await worker.backend.poll() == 2
+        await worker.drain()
+
+    assert sockets[0].sent_messages == [{"n": 1}]
+    assert sockets[1].sent_messages == [{"n": 1}]
+    for worker in workers:
+        await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_coalescing_window_keeps_latest_state():
+    published = []
+
+    async def publish(message, topics):
+        published.append((message, topics))
+
+    from app.core.coalesce import Coalescer
+
+    coalescer = Coalescer(0.05, publish)
+    for progress in (10, 20, 30):
+        await coalescer.add({"type": "keyresult_update", "data": {"id": 1, "progress": progress}},
+                            ["objective:1"])
+    await coalescer.add({"type": "keyresult_update", "data": {"id": 2, "progress": 5}},
+                        ["objective:1"])
+    await coalescer.add({"type": "keyresult_update", "data": {"id": 3, "progress": 1}},
+                        ["objective:2"])
+    assert published == []
+
+    await asyncio.sleep(0.1)
+    by_topic = {topics: message for message, topics in published}
+    assert by_topic[("objective:1",)] == {"type": "batch", "events": [
+        {"type": "keyresult_update", "data": {"id": 1, "progress": 30}},
+        {"type": "keyresult_update", "data": {"id": 2, "progress": 5}},
+    ]}
+    # A lone event is sent unwrapped
+    assert by_topic[("objective:2",)]["data"]["id"] == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_publish_failures_are_logged(caplog):
+    async def publish(message, topics):
+        raise ConnectionError("backend down")
+
+    from app.core.coalesce import Coalescer
+
+    coalescer = Coalescer(0.01, publish)
+    await coalescer.add({"type": "keyresult_update", "data": {"id": 1}}, ["objective:1"])
+    await asyncio.sleep(0.05)
+    assert coalescer.statistics()["failed"] == 1
+    assert "Coalesced event publish failed" in caplog.text
+    assert "backend down" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once():
+    class RecordingWebSocket:
+        def __init__(self):
+            self.frames = []
+
+        async def accept(self, subprotocol=None):
+            self.subprotocol = subprotocol
+
+        async def send_text(self, data):
+            self.frames.append(data)
+
+    encoding_manager = ConnectionManager(coalesce_window=0)
+    sockets = [RecordingWebSocket() for _ in range(3)]
+    for socket in sockets:
+        await encoding_manager.connect(socket, subprotocol="okr.json")
+
+    await encoding_manager.broadcast({"type": "update", "data": {"id": 1}})
+    await encoding_manager.drain()
+
+    frames = [socket.frames[0] for socket in sockets]
+    assert frames[0] == '{"type":"update","data":{"id":1},"seq":1}'
+    # Every socket is sent the same encoded buffer
+    assert all(frame is frames[0] for frame in frames)
+    assert sockets[0].subprotocol == "okr.json"
+    await encoding_manager.close()
+
+
+def test_subprotocol_negotiation():
+    from app.core.encoding import negotiate
+
+    assert negotiate([]) == (None, "json")
+    assert negotiate(["okr.json"]) == ("okr.json", "json")
+
+
+def test_msgpack_negotiation():
+    msgpack = pytest.importorskip("msgpack")
+    from app.core.encoding import EncodedMessage, negotiate
+
+    assert negotiate(["okr.msgpack", "okr.json"]) == ("okr.msgpack", "msgpack")
+    data = EncodedMessage({"type": "update"}).encode("msgpack")
+    assert msgpack.unpackb(data) == {"type": "update"}
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_missed_events():
+    class MockWebSocket:
+        def __init__(self):
+            self.sent_messages = []
+
+        async def accept(self):
+            pass
+
+        async def send_text(self, data):
+            self.sent_messages.append(json.loads(data))
+
+    replay_manager = ConnectionManager(coalesce_window=0, replay_size=3)
+    for n in range(1, 5):
+        await replay_manager.broadcast({"n": n}, ["objective:1" if n % 2 else "objective:2"])
+
+    # Missed seq 3 and 4; only the objective:1 event matches
+    resumed = MockWebSocket()
+    await replay_manager.connect(resumed, ["objective:1"], since=2)
+    await replay_manager.broadcast({"n": 5}, ["objective:1"])
+    await replay_manager.drain()
+    assert resumed.sent_messages == [{"n": 3, "seq": 3}, {"n": 5, "seq": 5}]
+
+    # seq 1 has left the three-event buffer
+    stale = MockWebSocket()
+    await replay_manager.connect(stale, since=0)
+    # A sequence from before a restart is unknown
+    ahead = MockWebSocket()
+    await replay_manager.connect(ahead, since=99)
+    await replay_manager.drain()
+    assert stale.sent_messages == [{"type": "resync_required", "seq": 5}]
+    assert ahead.sent_messages == [{"type": "resync_required", "seq": 5}]
+    await replay_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_filters_and_resumes(monkeypatch):
+    import app.routers.events as events_module
+
+    sse_manager = ConnectionManager(coalesce_window=0)
+    await sse_manager.broadcast({"type": "keyresult_update", "data": {"id": 1}}, ["objective:1"])
+    await sse_manager.broadcast({"type": "keyresult_update", "data": {"id": 2}}, ["objective:2"])
+
+    connection = sse_manager.open_stream(["objective:1"], since=0)
+
+    async def connected():
+        return False
+
+    monkeypatch.setattr(events_module, "manager", sse_manager)
+    frames = events_module.event_stream(connection, heartbeat=0.01, is_disconnected=connected)
+    # Replayed from seq 0, skipping the objective:2 event
+    assert await anext(frames) == (
+        'id: 1\nevent: keyresult_update\ndata: {"type":"keyresult_update","data":{"id":1},"seq":1}\n\n'
+    )
+    assert await anext(frames) == ": heartbeat\n\n"
+    await sse_manager.broadcast({"type": "keyresult_update", "data": {"id": 3}}, ["objective:1"])
+    assert (await anext(frames)).startswith("id: 3\n")
+    await frames.aclose()
+    assert sse_manager.statistics()["streams"] == 0
+    await sse_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_reaper_pings_and_closes_dead_sockets():
+    reaper_manager = ConnectionManager(
+        coalesce_window=0, ping_interval=10, ping_timeout=5, idle_timeout=60
+    )
+    alive, dead, idle = BlockedWebSocket(), BlockedWebSocket(), BlockedWebSocket()
+    for socket in (alive, dead, idle):
+        socket.release.set()
+        await reaper_manager.connect(socket)
+    start = reaper_manager.active_connections[alive].last_active
+
+    # First sweep pings everyone
+    assert reaper_manager.reap(now=start + 10) == 0
+    await reaper_manager.drain()
+    assert alive.sent_messages == [{"type": "ping"}]
+
+    # alive answers with a pong and idle with a request; dead stays silent
+    reaper_manager.received(alive, heartbeat=True)
+    reaper_manager.received(idle, heartbeat=True)
+    assert reaper_manager.reap(now=start + 20) == 1
+    await asyncio.sleep(0)
+    assert dead.closed_with == 1001
+    assert dead not in reaper_manager.active_connections
+
+    # Both keep answering pings, but only alive has sent anything else lately
+    reaper_manager.received(alive, heartbeat=True)
+    reaper_manager.received(idle, heartbeat=True)
+    reaper_manager.active_connections[alive].last_active = start + 30
+    assert reaper_manager.reap(now=start + 61) == 1
+    await asyncio.sleep(0)
+    assert idle.closed_with == 1001
+    assert list(reaper_manager.active_connections) == [alive]
+    assert reaper_manager.statistics()["reapedConnections"] == 2
+    await reaper_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_limit_rejects_new_clients():
+    from app.core.exceptions import ServiceUnavailableError
+
+    limited_manager = ConnectionManager(coalesce_window=0, max_connections=1)
+    first, second = BlockedWebSocket(), BlockedWebSocket()
+    assert await limited_manager.connect(first)
+    assert not await limited_manager.connect(second)
+    assert second.closed_with == 1013
+    with pytest.raises(ServiceUnavailableError):
+        limited_manager.open_stream(["*"])
+
+    # A slot frees up once a client leaves
+    limited_manager.disconnect(first)
+    assert await limited_manager.connect(second)
+    assert limited_manager.statistics()["rejectedConnections"] == 2
+    await limited_manager.close()
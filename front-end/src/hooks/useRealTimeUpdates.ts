@@ -15,12 +15,31 @@ export function useRealTimeUpdates() {
 
         switch (message.type) {
           case 'keyresult_update':
+          case 'objective_progress':
+          case 'batch':
             // Invalidate keyresults list and objectives list (as progress propagates)
             queryClient.invalidateQueries({ queryKey: ['keyresults'] });
             queryClient.invalidateQueries({ queryKey: ['objectives'] });
             break;
 
-          // Future: handle other types like 'reaction_add', 'objective_update' etc.
+          case 'objective_update':
+          case 'ownership_update':
+            queryClient.invalidateQueries({ queryKey: ['objectives'] });
+            break;
+
+          case 'reaction_update':
+            queryClient.invalidateQueries({ queryKey: ['reactions'] });
+            break;
+
+          case 'streak_update':
+            queryClient.invalidateQueries({ queryKey: ['streaks'] });
+            break;
+
+          case 'resync_required':
+            // Missed events are no longer available; refetch everything
+            queryClient.invalidateQueries();
+            break;
+
         }
       } catch (error) {
         console.error('Failed to parse websocket message:', error);
@@ -27,12 +27,34 @@ export function WebSocketProvider({ children }: { children: React.ReactNode }) {
   const socketRef = useRef<WebSocket | null>(null);
   const retryCount = useRef(0);
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Sequence number of the last event received, used to resume after a reconnect
+  const lastSeqRef = useRef<number | null>(null);
 
   useEffect(() => {
     const connect = () => {
       // Read URL from environment variable with fallback
       const wsUrl = import.meta.env.VITE_WS_URL || 'ws://localhost:8000/ws';
-      const ws = new WebSocket(wsUrl);
+      const url = new URL(wsUrl);
+      if (lastSeqRef.current !== null) {
+        url.searchParams.set('since', String(lastSeqRef.current));
+      }
+      const ws = new WebSocket(url.toString());
+
+      ws.addEventListener('message', (event: MessageEvent) => {
+        try {
+          const message = JSON.parse(event.data);
+          if (message.type === 'ping') {
+            // Answer heartbeats so the server does not reap this socket
+            ws.send(JSON.stringify({ action: 'pong' }));
+            return;
+          }
+          if (typeof message.seq === 'number') {
+            lastSeqRef.current = message.seq;
+          }
+        } catch {
+          // Ignore frames that are not JSON
+        }
+      });
 
       ws.onopen = () => {
         console.log('WebSocket connected');
@@ -259,6 +259,10 @@ export interface UserAssignedOKRs {
   individual: Objective[];
   byRole: Record<string, Objective[]>;
   byGroup: Record<string, Objective[]>;
+  // Set when a page was requested
+  count?: number | null;
+  next?: string | null;
+  previous?: string | null;
 }
 
 // Reaction types